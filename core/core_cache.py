@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+
+
+def empreinte_tableaux(*tableaux) -> str:
+    """
+    Calcule une empreinte (hash du contenu) d'un ou plusieurs tableaux.
+
+    Deux tableaux de même forme, même type et mêmes valeurs ont la même
+    empreinte, ce qui permet de s'en servir comme clé de cache.
+
+    Args:
+        tableaux: Des tableaux NumPy (ou convertibles en tableaux).
+
+    Returns:
+        L'empreinte hexadécimale (32 caractères).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for tableau in tableaux:
+        tableau = np.ascontiguousarray(tableau)
+        h.update(f"{tableau.dtype.str}{tableau.shape}".encode())
+        h.update(tableau.data)
+    return h.hexdigest()
+
+
+class CacheLRU:
+    """
+    Petit cache en mémoire avec éviction LRU (le moins récemment utilisé part en premier).
+
+    La taille est bornée en nombre d'éléments et, optionnellement, en octets
+    (la taille d'un élément est donnée par la fonction `taille_element`).
+    Les compteurs de succès/échecs sont exposés par `statistiques()`.
+    """
+    def __init__(self, taille_max: int = 32,
+                 octets_max: int | None = None,
+                 taille_element=None):
+        self.taille_max = taille_max
+        self.octets_max = octets_max
+        self.taille_element = taille_element or (lambda valeur: 0)
+        self._elements = OrderedDict()
+        self._octets = 0
+        self._verrou = threading.Lock()
+        self.succes = 0
+        self.echecs = 0
+
+    def obtenir(self, cle):
+        """Retourne la valeur associée à `cle`, ou None si elle est absente."""
+        with self._verrou:
+            if cle in self._elements:
+                self._elements.move_to_end(cle)
+                self.succes += 1
+                return self._elements[cle][0]
+            self.echecs += 1
+            return None
+
+    def ajouter(self, cle, valeur):
+        """Ajoute (ou remplace) une valeur, puis évince les plus anciennes si besoin."""
+        taille = self.taille_element(valeur)
+        with self._verrou:
+            if cle in self._elements:
+                self._octets -= self._elements.pop(cle)[1]
+            self._elements[cle] = (valeur, taille)
+            self._octets += taille
+            while self._elements and (len(self._elements) > self.taille_max or
+                                      (self.octets_max is not None and self._octets > self.octets_max)):
+                _, (_, taille_evincee) = self._elements.popitem(last=False)
+                self._octets -= taille_evincee
+
+    def vider(self):
+        """Supprime tous les éléments (les compteurs sont conservés)."""
+        with self._verrou:
+            self._elements.clear()
+            self._octets = 0
+
+    def statistiques(self) -> dict:
+        """Retourne le nombre d'éléments, d'octets, de succès et d'échecs."""
+        with self._verrou:
+            return {"elements": len(self._elements), "octets": self._octets,
+                    "succes": self.succes, "echecs": self.echecs}
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __contains__(self, cle):
+        return cle in self._elements
+
+
+class CacheColonnesDisque:
+    """
+    Cache sur disque de colonnes NumPy, une entrée par clé et un fichier
+    `.npy` par colonne (relu en mémoire mappée : rien n'est copié ni analysé).
+
+    Chaque entrée est un sous-répertoire `<repertoire>/<clé>/` contenant les
+    colonnes et un fichier `meta.json` (noms, fichiers et types). Une entrée
+    peut être complétée plus tard par de nouvelles colonnes. La taille totale
+    est bornée par `octets_max` : les entrées les moins récemment utilisées
+    (date de modification du répertoire, mise à jour à chaque lecture) sont
+    supprimées en premier.
+    """
+    def __init__(self, repertoire: str, octets_max: int = 2 * 2**30):
+        self.repertoire = repertoire
+        self.octets_max = octets_max
+        self._verrou = threading.Lock()
+        self.succes = 0
+        self.echecs = 0
+
+    def _chemin(self, cle: str) -> str:
+        return os.path.join(self.repertoire, cle)
+
+    def _lire_meta(self, cle: str) -> dict:
+        try:
+            with open(os.path.join(self._chemin(cle), "meta.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def colonnes(self, cle: str) -> dict[str, str]:
+        """Retourne {nom_colonne: type} des colonnes présentes pour `cle`."""
+        return {nom: info["dtype"] for nom, info in self._lire_meta(cle).items()}
+
+    def obtenir(self, cle: str, noms: list[str]) -> dict[str, np.ndarray] | None:
+        """
+        Retourne {nom: tableau en mémoire mappée (lecture seule)} pour les
+        colonnes `noms`, ou None si l'une d'elles est absente du cache.
+        """
+        meta = self._lire_meta(cle)
+        if not all(nom in meta for nom in noms):
+            with self._verrou:
+                self.echecs += 1
+            return None
+        try:
+            tableaux = {nom: np.load(os.path.join(self._chemin(cle), meta[nom]["fichier"]), mmap_mode="r")
+                        for nom in noms}
+            os.utime(self._chemin(cle)) # Marque l'entrée comme récemment utilisée
+        except (OSError, ValueError):
+            with self._verrou:
+                self.echecs += 1
+            return None
+        with self._verrou:
+            self.succes += 1
+        return tableaux
+
+    def ajouter(self, cle: str, tableaux: dict[str, np.ndarray]):
+        """
+        Enregistre (ou remplace) des colonnes pour `cle`, puis évince les
+        entrées les plus anciennes si la taille maximale est dépassée.
+        """
+        chemin = self._chemin(cle)
+        with self._verrou:
+            os.makedirs(chemin, exist_ok=True)
+            meta = self._lire_meta(cle)
+            remplaces = [meta[nom]["fichier"] for nom in tableaux if nom in meta]
+            for nom, tableau in tableaux.items():
+                # Écriture dans un fichier temporaire puis renommage : jamais de colonne à moitié écrite
+                fichier = f"{uuid.uuid4().hex}.npy"
+                np.save(os.path.join(chemin, fichier + ".tmp.npy"), np.ascontiguousarray(tableau))
+                os.replace(os.path.join(chemin, fichier + ".tmp.npy"), os.path.join(chemin, fichier))
+                meta[nom] = {"fichier": fichier, "dtype": np.asarray(tableau).dtype.str}
+            temporaire = os.path.join(chemin, "meta.json.tmp")
+            with open(temporaire, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(temporaire, os.path.join(chemin, "meta.json"))
+            for fichier in remplaces:
+                try:
+                    os.remove(os.path.join(chemin, fichier))
+                except OSError:
+                    pass
+            os.utime(chemin)
+            self._evincer(protegee=cle)
+
+    def _taille_entree(self, chemin: str) -> int:
+        return sum(entree.stat().st_size for entree in os.scandir(chemin) if entree.is_file())
+
+    def _evincer(self, protegee: str | None = None):
+        """Supprime les entrées les moins récemment utilisées au-delà de `octets_max`."""
+        entrees = [(entree.stat().st_mtime, entree.path, self._taille_entree(entree.path))
+                   for entree in os.scandir(self.repertoire) if entree.is_dir()]
+        total = sum(taille for _, _, taille in entrees)
+        for _, chemin, taille in sorted(entrees):
+            if total <= self.octets_max:
+                break
+            if os.path.basename(chemin) == protegee:
+                continue
+            # ignore_errors : un fichier encore mappé (Windows) sera supprimé plus tard
+            shutil.rmtree(chemin, ignore_errors=True)
+            total -= taille
+
+    def vider(self):
+        """Supprime toutes les entrées du répertoire de cache."""
+        with self._verrou:
+            if os.path.isdir(self.repertoire):
+                for entree in os.scandir(self.repertoire):
+                    if entree.is_dir():
+                        shutil.rmtree(entree.path, ignore_errors=True)
+
+    def statistiques(self) -> dict:
+        """Retourne le nombre d'entrées, d'octets, de succès et d'échecs."""
+        with self._verrou:
+            entrees = ([entree.path for entree in os.scandir(self.repertoire) if entree.is_dir()]
+                       if os.path.isdir(self.repertoire) else [])
+            return {"elements": len(entrees),
+                    "octets": sum(self._taille_entree(chemin) for chemin in entrees),
+                    "succes": self.succes, "echecs": self.echecs}
@@ -0,0 +1,700 @@
+import gzip
+import re
+from array import array
+
+import numpy as np
+import scipy.sparse as sp
+
+from core.core_prog_lineaire import ProblemeLineaire
+
+# Les deux formats de fichier reconnus, par extension (éventuellement suivie de .gz)
+EXTENSIONS = {".mps": "mps", ".lp": "lp"}
+
+# Dans un fichier LP, une borne au-delà de cette valeur est considérée comme infinie
+INFINI_LP = 1e30
+
+# Nombre de termes écrits par ligne dans un fichier LP (les lignes trop longues sont refusées par certains solveurs)
+TERMES_PAR_LIGNE = 8
+
+
+def _ouvrir(chemin: str, mode: str):
+    # Les modèles volumineux sont souvent distribués compressés (.mps.gz)
+    if chemin.endswith(".gz"):
+        return gzip.open(chemin, mode + "t", encoding="utf-8")
+    return open(chemin, mode, encoding="utf-8")
+
+
+def _format_fichier(chemin: str) -> str | None:
+    nom = chemin.lower().removesuffix(".gz")
+    for extension, format_fichier in EXTENSIONS.items():
+        if nom.endswith(extension):
+            return format_fichier
+    return None
+
+
+class _Assembleur:
+    """
+    Accumule les coefficients lus dans des tableaux compacts (array), puis
+    construit les matrices CSR du ProblemeLineaire en une seule fois : on ne
+    passe jamais par des dictionnaires de dictionnaires.
+    """
+    def __init__(self):
+        self.indice_variable = {}
+        self.lignes = array('q')
+        self.colonnes = array('q')
+        self.valeurs = array('d')
+        self.objectif = {}
+
+    def variable(self, nom: str) -> int:
+        j = self.indice_variable.get(nom)
+        if j is None:
+            j = self.indice_variable[nom] = len(self.indice_variable)
+        return j
+
+    def construire(self, sens: np.ndarray, rhs: np.ndarray, bornes_inf: dict, bornes_sup: dict,
+                   entiers: set, direction: str, plages: dict | None = None) -> ProblemeLineaire:
+        """
+        Args:
+            sens: Sens de chaque ligne lue ('L', 'G' ou 'E').
+            rhs: Second membre de chaque ligne lue.
+            bornes_inf, bornes_sup: Bornes modifiées, {indice de variable: valeur}.
+            entiers: Indices des variables entières.
+            plages: {ligne: R} pour les contraintes à deux bornes (section RANGES du MPS).
+        """
+        n = len(self.indice_variable)
+        lignes = np.frombuffer(self.lignes, dtype=np.int64)
+        colonnes = np.frombuffer(self.colonnes, dtype=np.int64)
+        valeurs = np.frombuffer(self.valeurs, dtype=np.float64)
+        plages = plages or {}
+
+        # Chaque ligne lue devient une ligne <= (changée de signe pour 'G') ou une ligne ==
+        est_eq = sens == 'E'
+        position = np.where(est_eq, np.cumsum(est_eq) - 1, np.cumsum(~est_eq) - 1)
+        signe = np.where(sens == 'G', -1.0, 1.0)
+        b_ub = (signe * rhs)[~est_eq]
+        b_eq = rhs[est_eq]
+
+        entrees_eq = est_eq[lignes]
+        A_ub = sp.csr_matrix((signe[lignes[~entrees_eq]] * valeurs[~entrees_eq],
+                              (position[lignes[~entrees_eq]], colonnes[~entrees_eq])), shape=(len(b_ub), n))
+        A_eq = sp.csr_matrix((valeurs[entrees_eq], (position[lignes[entrees_eq]], colonnes[entrees_eq])),
+                             shape=(len(b_eq), n))
+
+        if plages:
+            # Une contrainte à deux bornes bas <= a·x <= haut garde sa ligne d'origine ;
+            # l'autre borne devient une ligne <= supplémentaire
+            lignes_plage = np.array(sorted(plages))
+            supplementaires, b_sup = [], []
+            for i in lignes_plage:
+                R = plages[i]
+                if sens[i] == 'L':
+                    signe_sup, borne = -1.0, -(rhs[i] - abs(R)) # a·x >= rhs - |R|
+                elif sens[i] == 'G':
+                    signe_sup, borne = 1.0, rhs[i] + abs(R) # a·x <= rhs + |R|
+                else:
+                    # Ligne E : l'égalité devient l'intervalle [rhs, rhs + R] (ou [rhs + R, rhs])
+                    signe_sup, borne = (1.0, rhs[i] + R) if R >= 0 else (-1.0, -(rhs[i] + R))
+                supplementaires.append(signe_sup)
+                b_sup.append(borne)
+            rang = np.full(len(sens), -1)
+            rang[lignes_plage] = np.arange(len(lignes_plage))
+            masque = rang[lignes] >= 0
+            A_plages = sp.csr_matrix((np.array(supplementaires)[rang[lignes[masque]]] * valeurs[masque],
+                                      (rang[lignes[masque]], colonnes[masque])), shape=(len(lignes_plage), n))
+            # Les égalités à plage ne sont plus des égalités : leur autre borne passe dans A_ub
+            eq_plages = lignes_plage[sens[lignes_plage] == 'E']
+            if len(eq_plages):
+                garder = np.ones(len(b_eq), dtype=bool)
+                garder[position[eq_plages]] = False
+                R_eq = np.array([plages[i] for i in eq_plages])
+                A_eq_plages = A_eq[position[eq_plages]]
+                # rhs <= a·x (R > 0) ou a·x <= rhs (R < 0)
+                signe_eq = np.where(R_eq >= 0, -1.0, 1.0)
+                A_ub = sp.vstack([A_ub, sp.diags(signe_eq) @ A_eq_plages])
+                b_ub = np.concatenate((b_ub, signe_eq * rhs[eq_plages]))
+                A_eq, b_eq = A_eq[garder], b_eq[garder]
+            A_ub = sp.vstack([A_ub, A_plages]).tocsr()
+            b_ub = np.concatenate((b_ub, b_sup))
+
+        A_ub.eliminate_zeros()
+        A_eq.eliminate_zeros()
+        c = np.zeros(n)
+        for j, v in self.objectif.items():
+            c[j] += v
+        borne_inf = np.zeros(n)
+        borne_sup = np.full(n, np.inf)
+        for j, v in bornes_inf.items():
+            borne_inf[j] = v
+        for j, v in bornes_sup.items():
+            borne_sup[j] = v
+
+        noms = list(self.indice_variable)
+        return ProblemeLineaire(c, A_ub, b_ub, A_eq, b_eq,
+                                bornes=list(zip(borne_inf.tolist(), borne_sup.tolist())),
+                                direction=direction, noms_variables=noms, entiers=sorted(entiers))
+
+
+# --- Format MPS -------------------------------------------------------------
+
+def lire_mps(chemin_fichier: str) -> tuple[ProblemeLineaire | None, str | None]:
+    """
+    Lit un fichier MPS (format libre ou fixe, noms sans espaces), ligne à ligne.
+
+    Sections reconnues : NAME, OBJSENSE, ROWS, COLUMNS (avec les marqueurs
+    INTORG/INTEND), RHS, RANGES, BOUNDS (UP, LO, FX, FR, MI, PL, BV, LI, UI), ENDATA.
+    La constante de l'objectif (RHS de la ligne N) est ignorée.
+
+    Returns:
+        Un tuple (probleme, erreur).
+        - Si succès, (ProblemeLineaire, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        with _ouvrir(chemin_fichier, "r") as fichier:
+            return _lire_mps(fichier), None
+    except FileNotFoundError:
+        return None, "Erreur : Fichier non trouvé. Vérifiez le chemin."
+    except (ValueError, IndexError) as e:
+        return None, f"Erreur : Fichier MPS invalide ({e})."
+    except Exception as e:
+        return None, f"Une erreur inattendue est survenue : {e}"
+
+
+def _lire_mps(fichier) -> ProblemeLineaire:
+    assembleur = _Assembleur()
+    indice_ligne, sens, rhs = {}, [], []
+    objectif = None
+    plages = {}
+    bornes_inf, bornes_sup, entiers = {}, {}, set()
+    direction = "Minimiser"
+    section = None
+    dans_entiers = False
+
+    for numero, ligne in enumerate(fichier, 1):
+        if not ligne.strip():
+            continue
+        if ligne[0] == '*':
+            # Commentaire ; PuLP y écrit le sens de l'objectif (*SENSE:Maximize)
+            if ligne.upper().startswith("*SENSE:MAX"):
+                direction = "Maximiser"
+            continue
+        champs = ligne.split()
+        if not ligne[0].isspace():
+            # Début de section (un mot-clé en première colonne)
+            section = champs[0].upper()
+            if section == "OBJSENSE" and len(champs) > 1:
+                direction = "Maximiser" if champs[1].upper().startswith("MAX") else "Minimiser"
+            elif section == "ENDATA":
+                break
+            elif section not in ("NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS"):
+                raise ValueError(f"section '{section}' non prise en charge, ligne {numero}")
+            continue
+
+        if section == "OBJSENSE":
+            direction = "Maximiser" if champs[0].upper().startswith("MAX") else "Minimiser"
+        elif section == "ROWS":
+            type_ligne, nom = champs[0].upper(), champs[1]
+            if type_ligne == 'N':
+                if objectif is None:
+                    objectif = nom # Les lignes N suivantes sont ignorées
+            elif type_ligne in ('L', 'G', 'E'):
+                indice_ligne[nom] = len(sens)
+                sens.append(type_ligne)
+                rhs.append(0.0)
+            else:
+                raise ValueError(f"type de ligne '{type_ligne}' inconnu, ligne {numero}")
+        elif section == "COLUMNS":
+            if len(champs) >= 3 and champs[1].strip("'\"").upper() == "MARKER":
+                dans_entiers = champs[2].strip("'\"").upper() == "INTORG"
+                continue
+            j = assembleur.variable(champs[0])
+            if dans_entiers:
+                entiers.add(j)
+            for nom, valeur in zip(champs[1::2], champs[2::2]):
+                if nom == objectif:
+                    assembleur.objectif[j] = assembleur.objectif.get(j, 0.0) + float(valeur)
+                elif nom in indice_ligne:
+                    assembleur.lignes.append(indice_ligne[nom])
+                    assembleur.colonnes.append(j)
+                    assembleur.valeurs.append(float(valeur))
+                else:
+                    raise ValueError(f"ligne '{nom}' inconnue, ligne {numero}")
+        elif section in ("RHS", "RANGES"):
+            if len(champs) % 2 == 1:
+                champs = champs[1:] # Nom du jeu de seconds membres
+            for nom, valeur in zip(champs[0::2], champs[1::2]):
+                if nom == objectif:
+                    continue
+                if section == "RHS":
+                    rhs[indice_ligne[nom]] = float(valeur)
+                else:
+                    plages[indice_ligne[nom]] = float(valeur)
+        elif section == "BOUNDS":
+            type_borne = champs[0].upper()
+            sans_valeur = type_borne in ("FR", "MI", "PL", "BV")
+            if sans_valeur:
+                nom = champs[2] if len(champs) >= 3 else champs[1]
+            else:
+                nom, valeur = (champs[2], float(champs[3])) if len(champs) >= 4 else (champs[1], float(champs[2]))
+            j = assembleur.variable(nom)
+            if type_borne == "UP" or type_borne == "UI":
+                bornes_sup[j] = valeur
+                if valeur < 0 and j not in bornes_inf:
+                    bornes_inf[j] = -np.inf # Convention MPS : borne sup négative => pas de borne inf
+            elif type_borne in ("LO", "LI"):
+                bornes_inf[j] = valeur
+            elif type_borne == "FX":
+                bornes_inf[j] = bornes_sup[j] = valeur
+            elif type_borne == "FR":
+                bornes_inf[j], bornes_sup[j] = -np.inf, np.inf
+            elif type_borne == "MI":
+                bornes_inf[j] = -np.inf
+            elif type_borne == "PL":
+                bornes_sup[j] = np.inf
+            elif type_borne == "BV":
+                bornes_inf[j], bornes_sup[j] = 0.0, 1.0
+            else:
+                raise ValueError(f"type de borne '{type_borne}' inconnu, ligne {numero}")
+            if type_borne in ("BV", "LI", "UI"):
+                entiers.add(j)
+
+    return assembleur.construire(np.array(sens, dtype='<U1'), np.array(rhs, dtype=np.float64),
+                                 bornes_inf, bornes_sup, entiers, direction, plages)
+
+
+def ecrire_mps(probleme: ProblemeLineaire, chemin_fichier: str) -> tuple[str | None, str | None]:
+    """
+    Écrit le problème au format MPS libre, colonne par colonne.
+
+    Les contraintes sont nommées ub_i (<=) et eq_i (==), comme les lignes de
+    A_ub et A_eq. Un objectif à maximiser est signalé par la section OBJSENSE
+    (ignorée par certains lecteurs, dont CBC et PuLP).
+
+    Returns:
+        Un tuple (chemin_fichier, erreur).
+    """
+    try:
+        _verifier_noms(probleme.noms_variables, r"\S+")
+        with _ouvrir(chemin_fichier, "w") as fichier:
+            _ecrire_mps(probleme, fichier)
+        return chemin_fichier, None
+    except ValueError as e:
+        return None, f"Erreur : {e}"
+    except Exception as e:
+        return None, f"Une erreur inattendue est survenue : {e}"
+
+
+def _verifier_noms(noms: list[str], motif: str):
+    motif = re.compile(motif)
+    for nom in noms:
+        if not motif.fullmatch(nom):
+            raise ValueError(f"Nom de variable '{nom}' impossible à écrire dans ce format.")
+
+
+def _noms_lignes(probleme: ProblemeLineaire) -> list[str]:
+    return ([f"ub_{i}" for i in range(probleme.A_ub.shape[0])] +
+            [f"eq_{i}" for i in range(probleme.A_eq.shape[0])])
+
+
+def _ecrire_mps(probleme: ProblemeLineaire, fichier):
+    noms_lignes = _noms_lignes(probleme)
+    m_ub = probleme.A_ub.shape[0]
+    fichier.write("NAME Probleme\n")
+    if probleme.direction == "Maximiser":
+        fichier.write("OBJSENSE\n    MAX\n")
+    fichier.write("ROWS\n N  obj\n")
+    fichier.writelines(f" {'L' if i < m_ub else 'E'}  {nom}\n" for i, nom in enumerate(noms_lignes))
+
+    # Matrice [c ; A_ub ; A_eq] en CSC : on parcourt les colonnes une à une
+    A = sp.vstack([sp.csr_matrix(probleme.c), probleme.A_ub, probleme.A_eq]).tocsc()
+    A.sort_indices()
+    noms_lignes = ["obj"] + noms_lignes
+    fichier.write("COLUMNS\n")
+    dans_entiers = False
+    for j, nom in enumerate(probleme.noms_variables):
+        if probleme.entiers[j] != dans_entiers:
+            dans_entiers = bool(probleme.entiers[j])
+            fichier.write(f"    MARKER 'MARKER' '{'INTORG' if dans_entiers else 'INTEND'}'\n")
+        debut, fin = A.indptr[j], A.indptr[j + 1]
+        if debut == fin:
+            fichier.write(f"    {nom} obj 0\n") # La variable doit apparaître dans COLUMNS
+        fichier.writelines(f"    {nom} {noms_lignes[i]} {v!r}\n"
+                           for i, v in zip(A.indices[debut:fin].tolist(), A.data[debut:fin].tolist()))
+    if dans_entiers:
+        fichier.write("    MARKER 'MARKER' 'INTEND'\n")
+
+    fichier.write("RHS\n")
+    b = np.concatenate((probleme.b_ub, probleme.b_eq)).tolist()
+    fichier.writelines(f"    RHS {nom} {v!r}\n" for nom, v in zip(noms_lignes[1:], b) if v != 0)
+
+    fichier.write("BOUNDS\n")
+    for nom, inf, sup, entier in zip(probleme.noms_variables, probleme.borne_inf.tolist(),
+                                     probleme.borne_sup.tolist(), probleme.entiers.tolist()):
+        if inf == sup:
+            fichier.write(f" FX BND {nom} {inf!r}\n")
+            continue
+        if entier and inf == 0 and sup == 1:
+            fichier.write(f" BV BND {nom}\n")
+            continue
+        if inf == -np.inf and sup == np.inf:
+            fichier.write(f" FR BND {nom}\n")
+            continue
+        if inf == -np.inf:
+            fichier.write(f" MI BND {nom}\n")
+        elif inf != 0:
+            fichier.write(f" LO BND {nom} {inf!r}\n")
+        if sup != np.inf:
+            fichier.write(f" UP BND {nom} {sup!r}\n")
+    fichier.write("ENDATA\n")
+
+
+# --- Format LP (CPLEX) ------------------------------------------------------
+
+# Mots-clés de section du format LP (en minuscules)
+_SECTIONS_LP = {
+    "maximize": "max", "maximise": "max", "maximum": "max", "max": "max",
+    "minimize": "min", "minimise": "min", "minimum": "min", "min": "min",
+    "subject to": "contraintes", "such that": "contraintes", "st": "contraintes",
+    "s.t.": "contraintes", "st.": "contraintes",
+    "bounds": "bornes", "bound": "bornes",
+    "general": "entiers", "generals": "entiers", "gen": "entiers",
+    "binary": "binaires", "binaries": "binaires", "bin": "binaires",
+    "end": "fin",
+}
+_MOTIF_SECTION = re.compile(r"\s*(" + "|".join(re.escape(mot).replace(r"\ ", r"\s+")
+                                                 for mot in sorted(_SECTIONS_LP, key=len, reverse=True))
+                            + r")(?=\s|$)", re.IGNORECASE)
+_NOMBRE = r"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+# Un nom ne commence ni par un chiffre ni par un point
+_NOM = r"(?![\d.])[^\s:+\-<>=*^\[\]\\]+"
+_MOTIF_ETIQUETTE = re.compile(rf"\s*{_NOM}\s*:")
+_MOTIF_OPERATEUR = re.compile(r"<=|>=|=<|=>|<|>|=")
+# Expressions (objectif, contraintes) : lues terme par terme (signe, coefficient, nom)
+_MOTIF_TERME = re.compile(rf"([+-]?)\s*({_NOMBRE})?\s*\*?\s*({_NOM})?")
+_CARACTERES_SPECIAUX = frozenset(":+-<>=*^[]\\")
+# Bornes : lues jeton par jeton (nombre, opérateur de comparaison, signe, nom)
+_MOTIF_JETON = re.compile(rf"""
+    (?P<nombre>{_NOMBRE})
+  | (?P<operateur><=|>=|=<|=>|<|>|=)
+  | (?P<signe>[+-])
+  | (?P<nom>{_NOM})
+  | (?P<espace>\s+|\*)
+  | (?P<autre>.)
+""", re.VERBOSE)
+_INFINIS = {"inf", "infinity"}
+
+
+def _jetons(texte: str):
+    """Découpe une ligne du format LP en jetons (type, valeur)."""
+    for m in _MOTIF_JETON.finditer(texte):
+        genre = m.lastgroup
+        if genre == "espace":
+            continue
+        if genre == "autre":
+            raise ValueError(f"caractère inattendu '{m.group()}'")
+        valeur = m.group(genre)
+        if genre == "nom" and valeur.lower() in _INFINIS:
+            genre, valeur = "nombre", "inf"
+        yield genre, valeur
+
+
+def _termes(texte: str, signe: str) -> tuple[list[tuple[str, float]], bool, str]:
+    """
+    Lit les termes « signe coefficient nom » d'un morceau d'expression.
+
+    `signe` est un signe resté en fin de ligne précédente. Retourne
+    (liste de (nom, coefficient), présence d'une constante, signe en attente).
+    Les jetons séparés par des espaces (cas des fichiers écrits par un
+    programme) sont lus directement ; sinon on passe par l'expression régulière.
+    """
+    termes = []
+    constante = False
+    coefficient = None
+    signe_initial = signe
+    for jeton in texte.split():
+        if jeton == '+' or jeton == '-':
+            if coefficient is not None:
+                constante, coefficient, signe = True, None, ""
+            signe = '-' if (signe == '-') != (jeton == '-') else '+'
+        elif jeton[0].isdigit() or jeton[0] == '.':
+            if coefficient is not None:
+                return _termes_regex(texte, signe_initial)
+            try:
+                coefficient = float(jeton)
+            except ValueError: # Ex. "3x" : coefficient et nom collés
+                return _termes_regex(texte, signe_initial)
+        elif _CARACTERES_SPECIAUX.isdisjoint(jeton):
+            valeur = 1.0 if coefficient is None else coefficient
+            termes.append((jeton, -valeur if signe == '-' else valeur))
+            signe, coefficient = "", None
+        else:
+            return _termes_regex(texte, signe_initial)
+    if coefficient is not None:
+        constante, signe = True, ""
+    return termes, constante, signe
+
+
+def _termes_regex(texte: str, signe: str) -> tuple[list[tuple[str, float]], bool, str]:
+    if _MOTIF_TERME.sub("", texte).strip():
+        raise ValueError("expression illisible")
+    termes = []
+    constante = False
+    for signe_terme, coefficient, nom in _MOTIF_TERME.findall(texte):
+        if not nom:
+            if coefficient:
+                constante, signe = True, ""
+            elif signe_terme:
+                signe = signe_terme # Signe en fin de ligne, terme à la ligne suivante
+            continue
+        valeur = float(coefficient) if coefficient else 1.0
+        termes.append((nom, -valeur if (signe_terme or signe) == '-' else valeur))
+        signe = ""
+    return termes, constante, signe
+
+
+def lire_lp(chemin_fichier: str) -> tuple[ProblemeLineaire | None, str | None]:
+    """
+    Lit un fichier au format LP de CPLEX, ligne à ligne.
+
+    Sections reconnues : Maximize/Minimize, Subject To, Bounds, General,
+    Binary, End. Une expression peut s'étendre sur plusieurs lignes ; les
+    commentaires commencent par '\\'. La constante de l'objectif est ignorée.
+
+    Returns:
+        Un tuple (probleme, erreur).
+        - Si succès, (ProblemeLineaire, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        with _ouvrir(chemin_fichier, "r") as fichier:
+            return _lire_lp(fichier), None
+    except FileNotFoundError:
+        return None, "Erreur : Fichier non trouvé. Vérifiez le chemin."
+    except ValueError as e:
+        return None, f"Erreur : Fichier LP invalide ({e})."
+    except Exception as e:
+        return None, f"Une erreur inattendue est survenue : {e}"
+
+
+def _lire_lp(fichier) -> ProblemeLineaire:
+    assembleur = _Assembleur()
+    sens, rhs = [], []
+    bornes_inf, bornes_sup, entiers = {}, {}, set()
+    direction = None
+    section = None
+
+    indice_variable = assembleur.indice_variable
+    # État de l'expression en cours, quand elle s'étend sur plusieurs lignes
+    operateur = None
+    signe_en_attente = ""
+
+    def terminer_contrainte(valeur: float):
+        nonlocal operateur
+        sens.append('L' if '<' in operateur else 'G' if '>' in operateur else 'E')
+        rhs.append(valeur)
+        operateur = None
+
+    for numero, ligne in enumerate(fichier, 1):
+        ligne = ligne.split("\\", 1)[0]
+        if not ligne.strip():
+            continue
+        m = _MOTIF_SECTION.match(ligne)
+        if m:
+            section = _SECTIONS_LP[" ".join(m.group(1).lower().split())]
+            if section in ("max", "min"):
+                direction = "Maximiser" if section == "max" else "Minimiser"
+                section = "objectif"
+            elif section == "fin":
+                break
+            ligne = ligne[m.end():]
+            signe_en_attente = ""
+            if not ligne.strip():
+                continue
+
+        try:
+            if section in ("objectif", "contraintes"):
+                etiquette = _MOTIF_ETIQUETTE.match(ligne)
+                if etiquette:
+                    ligne = ligne[etiquette.end():]
+                if operateur is not None:
+                    # Opérateur en fin de ligne précédente : la ligne est le second membre
+                    terminer_contrainte(float(ligne.replace(" ", "")))
+                    continue
+                m = _MOTIF_OPERATEUR.search(ligne)
+                gauche = ligne[:m.start()] if m else ligne
+                termes, constante, signe_en_attente = _termes(gauche, signe_en_attente)
+                if constante and section == "contraintes":
+                    raise ValueError("constante dans le membre de gauche non prise en charge")
+                colonnes, valeurs = [], []
+                for nom, valeur in termes:
+                    j = indice_variable.get(nom)
+                    if j is None:
+                        j = assembleur.variable(nom)
+                    colonnes.append(j)
+                    valeurs.append(valeur)
+                if section == "objectif":
+                    for j, valeur in zip(colonnes, valeurs):
+                        assembleur.objectif[j] = assembleur.objectif.get(j, 0.0) + valeur
+                else:
+                    assembleur.lignes.extend([len(sens)] * len(colonnes))
+                    assembleur.colonnes.extend(colonnes)
+                    assembleur.valeurs.extend(valeurs)
+                if m:
+                    if section == "objectif":
+                        raise ValueError("opérateur de comparaison dans l'objectif")
+                    operateur = m.group()
+                    droite = ligne[m.end():].replace(" ", "").strip()
+                    if droite:
+                        terminer_contrainte(float(droite))
+            elif section == "bornes":
+                _lire_borne(list(_jetons(ligne)), assembleur, bornes_inf, bornes_sup)
+            elif section in ("entiers", "binaires"):
+                for genre, valeur in _jetons(ligne):
+                    j = assembleur.variable(valeur)
+                    entiers.add(j)
+                    if section == "binaires":
+                        bornes_inf[j], bornes_sup[j] = 0.0, 1.0
+            elif section is None:
+                raise ValueError("le fichier doit commencer par Maximize ou Minimize")
+        except ValueError as e:
+            raise ValueError(f"{e}, ligne {numero}") from None
+
+    if direction is None:
+        raise ValueError("objectif absent")
+    return assembleur.construire(np.array(sens, dtype='<U1'), np.array(rhs, dtype=np.float64),
+                                 bornes_inf, bornes_sup, entiers, direction)
+
+
+def _lire_borne(jetons: list, assembleur: _Assembleur, bornes_inf: dict, bornes_sup: dict):
+    """Une ligne de la section Bounds : x free, x = v, x >= l, l <= x, l <= x <= u..."""
+    # Les nombres signés sont regroupés : [("signe", "-"), ("nombre", "5")] -> ("nombre", -5.0)
+    elements, signe = [], 1.0
+    for genre, valeur in jetons:
+        if genre == "signe":
+            signe = -1.0 if valeur == '-' else 1.0
+        elif genre == "nombre":
+            elements.append(("nombre", signe * float(valeur)))
+            signe = 1.0
+        else:
+            elements.append((genre, valeur))
+    genres = [genre for genre, _ in elements]
+
+    if genres == ["nom", "nom"] and elements[1][1].lower() == "free":
+        j = assembleur.variable(elements[0][1])
+        bornes_inf[j], bornes_sup[j] = -np.inf, np.inf
+    elif genres == ["nom", "operateur", "nombre"]:
+        j = assembleur.variable(elements[0][1])
+        _appliquer_borne(j, elements[1][1], elements[2][1], bornes_inf, bornes_sup)
+    elif genres == ["nombre", "operateur", "nom"]:
+        # l <= x s'écrit aussi x >= l : on inverse l'opérateur
+        j = assembleur.variable(elements[2][1])
+        inverse = {'<': '>', '>': '<', '=': '='}
+        operateur = elements[1][1]
+        _appliquer_borne(j, "".join(inverse[o] for o in operateur), elements[0][1], bornes_inf, bornes_sup)
+    elif genres == ["nombre", "operateur", "nom", "operateur", "nombre"]:
+        j = assembleur.variable(elements[2][1])
+        _appliquer_borne(j, ">=", elements[0][1], bornes_inf, bornes_sup)
+        _appliquer_borne(j, "<=", elements[4][1], bornes_inf, bornes_sup)
+    else:
+        raise ValueError("borne illisible")
+
+
+def _appliquer_borne(j: int, operateur: str, valeur: float, bornes_inf: dict, bornes_sup: dict):
+    if abs(valeur) >= INFINI_LP:
+        valeur = np.copysign(np.inf, valeur)
+    if operateur == '=':
+        bornes_inf[j] = bornes_sup[j] = valeur
+    elif '<' in operateur:
+        bornes_sup[j] = valeur
+    else:
+        bornes_inf[j] = valeur
+
+
+def ecrire_lp(probleme: ProblemeLineaire, chemin_fichier: str) -> tuple[str | None, str | None]:
+    """
+    Écrit le problème au format LP de CPLEX, contrainte par contrainte.
+
+    Les contraintes sont nommées ub_i (<=) et eq_i (==), comme les lignes de
+    A_ub et A_eq.
+
+    Returns:
+        Un tuple (chemin_fichier, erreur).
+    """
+    try:
+        # Pas de chiffre, de point ou de 'e' suivi d'un chiffre en tête de nom
+        _verifier_noms(probleme.noms_variables, r"(?![0-9.]|[eE][0-9+-])[^\s:+\-<>=*^\[\]\\]+")
+        with _ouvrir(chemin_fichier, "w") as fichier:
+            _ecrire_lp(probleme, fichier)
+        return chemin_fichier, None
+    except ValueError as e:
+        return None, f"Erreur : {e}"
+    except Exception as e:
+        return None, f"Une erreur inattendue est survenue : {e}"
+
+
+def _expression(indices, valeurs, noms: list[str]) -> str:
+    termes = [f"{'-' if v < 0 else '+'} {abs(v)!r} {noms[j]}" for j, v in zip(indices, valeurs)]
+    if not termes:
+        termes = [f"+ 0 {noms[0]}"] # Une expression vide n'est pas acceptée
+    return "\n   ".join(" ".join(termes[k:k + TERMES_PAR_LIGNE])
+                        for k in range(0, len(termes), TERMES_PAR_LIGNE))
+
+
+def _ecrire_lp(probleme: ProblemeLineaire, fichier):
+    noms = probleme.noms_variables
+    fichier.write("\\ Problème écrit par Projet_Math_App\n")
+    fichier.write("Maximize\n" if probleme.direction == "Maximiser" else "Minimize\n")
+    objectif = np.flatnonzero(probleme.c)
+    fichier.write(f" obj: {_expression(objectif.tolist(), probleme.c[objectif].tolist(), noms)}\n")
+
+    fichier.write("Subject To\n")
+    for prefixe, A, b, operateur in (("ub", probleme.A_ub, probleme.b_ub, "<="),
+                                     ("eq", probleme.A_eq, probleme.b_eq, "=")):
+        for i in range(A.shape[0]):
+            debut, fin = A.indptr[i], A.indptr[i + 1]
+            expression = _expression(A.indices[debut:fin].tolist(), A.data[debut:fin].tolist(), noms)
+            fichier.write(f" {prefixe}_{i}: {expression} {operateur} {float(b[i])!r}\n")
+
+    fichier.write("Bounds\n")
+    for nom, inf, sup, entier in zip(noms, probleme.borne_inf.tolist(),
+                                     probleme.borne_sup.tolist(), probleme.entiers.tolist()):
+        if entier and inf == 0 and sup == 1:
+            continue # Section Binary
+        if inf == sup:
+            fichier.write(f" {nom} = {inf!r}\n")
+        elif inf == -np.inf and sup == np.inf:
+            fichier.write(f" {nom} free\n")
+        elif sup == np.inf:
+            if inf != 0:
+                fichier.write(f" {nom} >= {inf!r}\n")
+        else:
+            fichier.write(f" {'-inf' if inf == -np.inf else repr(inf)} <= {nom} <= {sup!r}\n")
+
+    entieres = [nom for nom, inf, sup, entier in zip(noms, probleme.borne_inf, probleme.borne_sup,
+                                                     probleme.entiers) if entier and not (inf == 0 and sup == 1)]
+    binaires = [nom for nom, inf, sup, entier in zip(noms, probleme.borne_inf, probleme.borne_sup,
+                                                     probleme.entiers) if entier and inf == 0 and sup == 1]
+    for titre, liste in (("General", entieres), ("Binary", binaires)):
+        if liste:
+            fichier.write(f"{titre}\n")
+            fichier.writelines(f" {nom}\n" for nom in liste)
+    fichier.write("End\n")
+
+
+# --- Choix du format par extension -------------------------------------------
+
+def charger_probleme_fichier(chemin_fichier: str) -> tuple[ProblemeLineaire | None, str | None]:
+    """Lit un fichier .mps ou .lp (éventuellement compressé en .gz) selon son extension."""
+    format_fichier = _format_fichier(chemin_fichier)
+    if format_fichier is None:
+        return None, "Erreur : Extension non reconnue (attendu : .mps ou .lp)."
+    return (lire_mps if format_fichier == "mps" else lire_lp)(chemin_fichier)
+
+
+def enregistrer_probleme_fichier(probleme: ProblemeLineaire,
+                                 chemin_fichier: str) -> tuple[str | None, str | None]:
+    """Écrit un fichier .mps ou .lp (éventuellement compressé en .gz) selon son extension."""
+    format_fichier = _format_fichier(chemin_fichier)
+    if format_fichier is None:
+        return None, "Erreur : Extension non reconnue (attendu : .mps ou .lp)."
+    return (ecrire_mps if format_fichier == "mps" else ecrire_lp)(probleme, chemin_fichier)
@@ -1,44 +1,1029 @@
+import os
+import warnings
+from bisect import bisect_right
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
+import scipy.sparse as sp
+import scipy.linalg as sla
+import scipy.sparse.linalg as spla
+
+from core.core_cache import CacheLRU, empreinte_tableaux
+
+# Nombre de tirages uniformes générés d'un coup (borne la mémoire des longues simulations)
+TAILLE_BLOC = 1 << 16
+# Jusqu'à ce nombre d'états, on précalcule le successeur de chaque état pour tout un bloc
+SEUIL_SUCCESSEURS = 32
+
+# Puissances P^(2^k) déjà calculées, indexées par (empreinte de P, k)
+_CACHE_PUISSANCES = CacheLRU(taille_max=64, octets_max=256 * 2**20,
+                             taille_element=lambda matrice: matrice.nbytes)
+
+
+def _preparer_matrice(matrice_transition) -> np.ndarray | sp.csr_matrix:
+    """
+    Convertit la matrice en float64 : CSR si elle est creuse (scipy.sparse),
+    tableau dense sinon. La mémoire d'une matrice creuse reste proportionnelle
+    au nombre de transitions non nulles.
+    """
+    if sp.issparse(matrice_transition):
+        matrice_transition = sp.csr_matrix(matrice_transition, dtype=np.float64)
+        if not matrice_transition.has_canonical_format or np.any(matrice_transition.data == 0):
+            # Copie d'abord : la CSR peut partager ses tableaux avec celle de l'appelant
+            matrice_transition = matrice_transition.copy()
+            matrice_transition.sum_duplicates()
+            matrice_transition.eliminate_zeros()
+        return matrice_transition
+    return np.asarray(matrice_transition, dtype=np.float64)
+
+
+def _valider_matrice(matrice_transition: np.ndarray | sp.csr_matrix) -> str | None:
+    """
+    Vérifie qu'une matrice de transition (dense ou CSR) est carrée et stochastique.
+
+    Returns:
+        None si la matrice est valide, sinon le message d'erreur.
+    """
+    if matrice_transition.ndim != 2 or matrice_transition.shape[0] != matrice_transition.shape[1]:
+        return "Erreur : La matrice de transition doit être carrée."
+    valeurs = matrice_transition.data if sp.issparse(matrice_transition) else matrice_transition
+    if np.any(valeurs < 0):
+        return "Erreur : La matrice contient des probabilités négatives."
+    sommes = np.asarray(matrice_transition.sum(axis=1)).ravel()
+    if not np.allclose(sommes, 1):
+        return "Erreur : Les lignes de la matrice ne somment pas à 1."
+    return None
+
+
+def _valider_etat_initial(etat_initial, n_etats: int) -> str | None:
+    """
+    Vérifie que l'état initial est un indice entier dans [0, N[.
+
+    Returns:
+        None si l'état est valide, sinon le message d'erreur.
+    """
+    if isinstance(etat_initial, (bool, np.bool_)) or not isinstance(etat_initial, (int, np.integer)):
+        return "Erreur : L'état initial doit être un entier."
+    if etat_initial >= n_etats or etat_initial < 0:
+        return "Erreur : L'état initial est en dehors des bornes."
+    return None
+
+
+def _dtype_etats(n_etats: int) -> np.dtype:
+    """Plus petit type entier (signé) capable de stocker les indices d'états."""
+    return np.min_scalar_type(-max(n_etats, 1))
+
+
+def _empreinte_matrice(matrice_transition: np.ndarray | sp.csr_matrix) -> str:
+    """Empreinte du contenu de la matrice (dense ou CSR), utilisée comme clé de cache."""
+    if sp.issparse(matrice_transition):
+        return empreinte_tableaux(np.array(matrice_transition.shape), matrice_transition.indptr,
+                                  matrice_transition.indices, matrice_transition.data)
+    return empreinte_tableaux(matrice_transition)
+
+
+def _lignes_non_nulles(matrice_transition: np.ndarray | sp.csr_matrix):
+    """
+    Transitions non nulles de la matrice, ligne par ligne (format CSR).
+
+    Returns:
+        (degres, indptr, indices, valeurs) : nombre de transitions par ligne,
+        bornes des lignes, états d'arrivée et probabilités.
+    """
+    if sp.issparse(matrice_transition):
+        # Déjà au format CSR : on réutilise directement ses tableaux
+        degres = np.diff(matrice_transition.indptr)
+        colonnes, valeurs = matrice_transition.indices, matrice_transition.data
+    else:
+        lignes, colonnes = np.nonzero(matrice_transition)
+        valeurs = matrice_transition[lignes, colonnes]
+        degres = np.bincount(lignes, minlength=matrice_transition.shape[0])
+    indptr = np.concatenate(([0], np.cumsum(degres))).astype(np.int64)
+    return degres, indptr, colonnes.astype(np.int64), valeurs
+
+
+class _TableCumulative:
+    """
+    Lignes cumulées d'une matrice de transition, calculées une seule fois.
+
+    Seules les transitions non nulles sont conservées (format CSR) :
+    - indptr[i]:indptr[i+1] délimite la ligne i,
+    - indices[k] est l'état d'arrivée de l'entrée k,
+    - cumul[k] est la probabilité cumulée de la ligne jusqu'à l'entrée k incluse
+      (la dernière entrée de chaque ligne vaut exactement 1).
+    """
+    def __init__(self, matrice_transition: np.ndarray | sp.csr_matrix):
+        self.n_etats = matrice_transition.shape[0]
+        degres, self.indptr, self.indices, valeurs = _lignes_non_nulles(matrice_transition)
+
+        # Somme cumulée ligne par ligne, normalisée pour que chaque ligne finisse à 1
+        cumul = np.cumsum(valeurs, dtype=np.float64)
+        debuts, fins = self.indptr[:-1], self.indptr[1:] - 1
+        avant = np.repeat(cumul[debuts] - valeurs[debuts], degres)
+        cumul -= avant
+        cumul /= np.repeat(cumul[fins], degres)
+        cumul[fins] = 1.0
+        self.cumul = cumul
+        self._cumul_decale = None
+        self._listes = None
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.indices.nbytes + 2 * self.cumul.nbytes
+
+    @property
+    def cumul_decale(self) -> np.ndarray:
+        """cumul + indice de ligne : un seul tableau croissant pour un searchsorted global."""
+        if self._cumul_decale is None:
+            degres = np.diff(self.indptr)
+            self._cumul_decale = self.cumul + np.repeat(np.arange(self.n_etats), degres)
+        return self._cumul_decale
+
+    def tirer(self, etats: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """Successeurs (vectorisés) des `etats` pour les tirages uniformes `u`."""
+        pos = np.searchsorted(self.cumul_decale, etats + u, side='right')
+        pos = np.clip(pos, self.indptr[etats], self.indptr[etats + 1] - 1)
+        return self.indices[pos]
+
+    def parcourir(self, etat: int, u: list, bloc: list) -> int:
+        """Avance la chaîne pas à pas (bissection dans la ligne courante uniquement)."""
+        if self._listes is None:
+            self._listes = (self.cumul.tolist(), self.indptr.tolist(), self.indices.tolist())
+        cumul, indptr, indices = self._listes
+        for t, ut in enumerate(u):
+            etat = indices[bisect_right(cumul, ut, indptr[etat], indptr[etat + 1] - 1)]
+            bloc[t] = etat
+        return etat
+
+
+class _TableAlias:
+    """
+    Tables d'alias de Walker (une par ligne) : chaque tirage coûte O(1),
+    quel que soit le nombre de transitions de la ligne.
+
+    Pour l'entrée k de la ligne i (format CSR comme _TableCumulative), on garde
+    l'entrée k avec la probabilité seuil[k], sinon on prend l'entrée alias[k].
+    Un seul uniforme u suffit : la partie entière de u * degré choisit la case,
+    la partie fractionnaire sert à la comparer au seuil.
+
+    La construction coûte trois à quatre fois celle de _TableCumulative, et
+    chaque tirage n'est que 1,5 à 2 fois plus rapide : les tables d'alias ne
+    sont rentables que pour de très longues simulations (ou beaucoup de
+    marcheurs) sur des lignes très remplies. C'est pourquoi "cdf" reste la
+    méthode par défaut.
+    """
+    def __init__(self, matrice_transition: np.ndarray | sp.csr_matrix):
+        self.n_etats = matrice_transition.shape[0]
+        degres, self.indptr, self.indices, valeurs = _lignes_non_nulles(matrice_transition)
+        self.degres = degres.astype(np.int64)
+        self._listes = None
+
+        # Méthode de Vose, vectorisée sur toutes les lignes à la fois. Dans chaque
+        # ligne, les cases sont rangées "petites" (q < 1) puis "grandes" (q >= 1) ;
+        # on remplit les cases dans cet ordre, chacune avec la grande case courante
+        # (le donneur), qui devient à son tour une case à remplir quand son reste
+        # passe sous 1. L'itération c traite la c-ième case de toutes les lignes.
+        lignes = np.repeat(np.arange(self.n_etats), self.degres)
+        sommes = np.add.reduceat(valeurs, self.indptr[:-1]) if len(valeurs) else np.zeros(self.n_etats)
+        q = valeurs * np.repeat(self.degres / np.where(self.degres > 0, sommes, 1.0), self.degres)
+        grandes = q >= 1.0
+        ordre = np.lexsort((grandes, lignes))
+        reste = q[ordre]
+        nb_petites = np.bincount(lignes, weights=~grandes, minlength=self.n_etats).astype(np.int64)
+        donneur = self.indptr[:-1] + nb_petites
+        seuil, alias = np.ones(len(q)), np.arange(len(q), dtype=np.int64)
+        actives = np.flatnonzero((nb_petites > 0) & (donneur < self.indptr[1:]))
+        c = 0
+        while len(actives):
+            case, g = self.indptr[actives] + c, donneur[actives]
+            seuil[case] = reste[case]
+            alias[case] = g
+            reste[g] -= 1.0 - reste[case]
+            g = g + (reste[g] < 1.0)
+            donneur[actives] = g
+            c += 1
+            # Une ligne est finie quand la case suivante est le donneur : les cases
+            # restantes valent 1 (aux erreurs d'arrondi près) et gardent seuil = 1
+            actives = actives[(case + 1 < g) & (g < self.indptr[actives + 1])]
+        self.seuil = np.empty_like(seuil)
+        self.seuil[ordre] = seuil
+        self.alias = np.empty_like(alias)
+        self.alias[ordre] = ordre[alias]
+
+    @property
+    def nbytes(self) -> int:
+        return (self.indptr.nbytes + self.indices.nbytes + self.degres.nbytes +
+                self.seuil.nbytes + self.alias.nbytes)
+
+    def tirer(self, etats: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """Successeurs (vectorisés) des `etats` pour les tirages uniformes `u`."""
+        degres = self.degres[etats]
+        x = u * degres
+        case = np.minimum(x.astype(np.int64), degres - 1)
+        pos = self.indptr[etats] + case
+        pos = np.where(x - case < self.seuil[pos], pos, self.alias[pos])
+        return self.indices[pos]
+
+    def parcourir(self, etat: int, u: list, bloc: list) -> int:
+        """Avance la chaîne pas à pas, un tirage en O(1) par étape."""
+        if self._listes is None:
+            self._listes = (self.indptr.tolist(), self.degres.tolist(), self.indices.tolist(),
+                            self.seuil.tolist(), self.alias.tolist())
+        indptr, degres, indices, seuil, alias = self._listes
+        for t, ut in enumerate(u):
+            x = ut * degres[etat]
+            case = min(int(x), degres[etat] - 1)
+            pos = indptr[etat] + case
+            if x - case >= seuil[pos]:
+                pos = alias[pos]
+            etat = indices[pos]
+            bloc[t] = etat
+        return etat
+
+
+# Classes d'échantillonneurs disponibles pour le paramètre `methode`
+_TABLES = {"cdf": _TableCumulative, "alias": _TableAlias}
+
+# Tables déjà construites, indexées par (empreinte du contenu de la matrice, méthode)
+_CACHE_TABLES = CacheLRU(taille_max=16, octets_max=512 * 2**20,
+                         taille_element=lambda table: table.nbytes)
+
+
+def _obtenir_table(matrice_transition: np.ndarray | sp.csr_matrix, methode: str):
+    """Retourne la table d'échantillonnage de la matrice, construite au besoin puis gardée en cache."""
+    cle = (_empreinte_matrice(matrice_transition), methode)
+    table = _CACHE_TABLES.obtenir(cle)
+    if table is None:
+        table = _TABLES[methode](matrice_transition)
+        _CACHE_TABLES.ajouter(cle, table)
+    return table
+
+
+def _blocs_trajectoire(table: _TableCumulative | _TableAlias,
+                       etat_initial: int,
+                       nb_etapes: int,
+                       generateur: np.random.Generator,
+                       taille_bloc: int = TAILLE_BLOC):
+    """
+    Générateur des morceaux successifs d'une trajectoire (état initial compris).
+
+    Chaque morceau contient `taille_bloc` états (sauf le dernier). Les uniformes
+    sont tirés morceau par morceau, ce qui donne exactement la même suite de
+    nombres qu'un tirage unique : la trajectoire ne dépend pas de `taille_bloc`.
+    """
+    dtype = _dtype_etats(table.n_etats)
+    etat = int(etat_initial)
+    restantes = nb_etapes
+    premier = True
+    while restantes > 0:
+        m = min(taille_bloc, restantes)
+        nb_tirages = m - 1 if premier else m # l'état initial n'est pas tiré
+        u = generateur.random(nb_tirages)
+        pas = [0] * nb_tirages
+
+        if table.n_etats <= SEUIL_SUCCESSEURS:
+            # Petit espace d'états : successeur de chaque état pour chaque tirage,
+            # puis la boucle n'est plus qu'une suite d'indexations de listes
+            successeurs = np.empty((table.n_etats, nb_tirages), dtype=np.int64)
+            for s in range(table.n_etats):
+                successeurs[s] = table.tirer(np.full(nb_tirages, s), u)
+            successeurs = successeurs.tolist()
+            for t in range(nb_tirages):
+                etat = successeurs[etat][t]
+                pas[t] = etat
+        else:
+            # Grand espace d'états : avance pas à pas avec la table (bissection ou alias)
+            etat = table.parcourir(etat, u.tolist(), pas)
+
+        if premier:
+            pas.insert(0, int(etat_initial))
+            premier = False
+        restantes -= m
+        yield np.array(pas, dtype=dtype)
+
 
-def simuler_chaine_markov(matrice_transition: np.ndarray, 
-                          etat_initial: int, 
-                          nb_etapes: int) -> tuple[list[int] | None, str | None]:
+class _Compteurs:
+    """
+    Comptes de visites et de transitions d'une trajectoire, mis à jour morceau
+    par morceau (la trajectoire complète n'est jamais gardée en mémoire).
+
+    Les transitions sont comptées dans une matrice dense pour les petites
+    chaînes, dans une matrice CSR sinon (seules les transitions observées
+    occupent de la mémoire).
+    """
+    def __init__(self, n_etats: int):
+        self.n_etats = n_etats
+        self.visites = np.zeros(n_etats, dtype=np.int64)
+        if n_etats <= 1024:
+            self.transitions = np.zeros((n_etats, n_etats), dtype=np.int64)
+        else:
+            self.transitions = sp.csr_matrix((n_etats, n_etats), dtype=np.int64)
+        self._dernier = None
+
+    def ajouter(self, bloc: np.ndarray):
+        """Ajoute un morceau (consécutif au précédent) de la trajectoire."""
+        if len(bloc) == 0:
+            return
+        bloc = bloc.astype(np.int64)
+        self.visites += np.bincount(bloc, minlength=self.n_etats)
+        depart = bloc[:-1] if self._dernier is None else np.concatenate(([self._dernier], bloc[:-1]))
+        arrivee = bloc[1:] if self._dernier is None else bloc
+        self._dernier = bloc[-1]
+
+        if sp.issparse(self.transitions):
+            codes, nombres = np.unique(depart * self.n_etats + arrivee, return_counts=True)
+            ajout = sp.csr_matrix((nombres, (codes // self.n_etats, codes % self.n_etats)),
+                                  shape=self.transitions.shape)
+            self.transitions = self.transitions + ajout
+        else:
+            self.transitions += np.bincount(depart * self.n_etats + arrivee,
+                                            minlength=self.n_etats ** 2).reshape(self.n_etats, -1)
+
+    def fusionner(self, autre: "_Compteurs"):
+        """Ajoute les comptes d'une autre trajectoire (indépendante)."""
+        self.visites += autre.visites
+        self.transitions = self.transitions + autre.transitions
+
+    def resultats(self) -> dict:
+        return {"visites": self.visites, "transitions": self.transitions}
+
+
+def simuler_chaine_markov(matrice_transition: np.ndarray,
+                          etat_initial: int,
+                          nb_etapes: int,
+                          generateur: np.random.Generator | int | None = None,
+                          methode: str = "cdf") -> tuple[np.ndarray | None, str | None]:
     """
     Simule une trajectoire de chaîne de Markov.
 
+    Les lignes cumulées de la matrice sont calculées une seule fois et les
+    tirages uniformes sont générés par blocs : aucun appel à np.random.choice
+    n'est fait à chaque étape.
+
     Args:
-        matrice_transition: Matrice (N x N) des probabilités de transition.
+        matrice_transition: Matrice (N x N) des probabilités de transition (dense ou CSR).
         etat_initial: L'indice de l'état de départ (ex: 0, 1, ...).
         nb_etapes: Le nombre total d'étapes à simuler.
+        generateur: Un numpy.random.Generator (ou une graine) pour rendre
+                    la simulation reproductible. Par défaut, un générateur neuf.
+        methode: "cdf" (bissection dans les lignes cumulées) ou "alias"
+                 (tables d'alias de Walker, tirage en O(1) pour les lignes
+                 très remplies). Les tables sont gardées en cache.
 
     Returns:
         Un tuple (trajectoire, erreur).
-        - Si succès, (liste_etats, None).
+        - Si succès, (tableau_etats, None) : un tableau NumPy (et non plus une
+          liste) du plus petit type entier capable de coder les N états
+          (int8 jusqu'à 128 états), pour limiter la mémoire des longues
+          trajectoires. `.tolist()` redonne une liste d'entiers Python.
         - Si échec, (None, message_erreur).
     """
     try:
         # Validation simple
+        matrice_transition = _preparer_matrice(matrice_transition)
+        erreur = _valider_matrice(matrice_transition)
+        if erreur:
+            return None, erreur
         n_etats = matrice_transition.shape[0]
-        if n_etats != matrice_transition.shape[1]:
-            return None, "Erreur : La matrice de transition doit être carrée."
-        if not np.allclose(np.sum(matrice_transition, axis=1), 1):
-            return None, "Erreur : Les lignes de la matrice ne somment pas à 1."
-        if etat_initial >= n_etats or etat_initial < 0:
-            return None, "Erreur : L'état initial est en dehors des bornes."
-
-        etats = np.arange(n_etats) # Liste des états possibles [0, 1, ..., N-1]
-        trajectoire = [etat_initial]
-        etat_actuel = etat_initial
-
-        for _ in range(nb_etapes - 1): # -1 car l'état initial est déjà inclus
-            # Probabilités de transition depuis l'état actuel
-            probabilites = matrice_transition[etat_actuel]
-            
-            # Choisir le prochain état basé sur les probabilités [cite: 29]
-            etat_actuel = np.random.choice(etats, p=probabilites)
-            trajectoire.append(etat_actuel)
-            
+        erreur = _valider_etat_initial(etat_initial, n_etats)
+        if erreur:
+            return None, erreur
+
+        if methode not in _TABLES:
+            return None, f"Erreur : Méthode d'échantillonnage inconnue '{methode}'."
+
+        generateur = np.random.default_rng(generateur)
+        table = _obtenir_table(matrice_transition, methode)
+        blocs = _blocs_trajectoire(table, etat_initial, max(nb_etapes, 1), generateur)
+        trajectoire = np.concatenate(list(blocs))
+
         return trajectoire, None
-        
+
+    except Exception as e:
+        return None, f"Une erreur de simulation est survenue : {e}"
+
+
+def iterer_chaine_markov(matrice_transition: np.ndarray,
+                         etat_initial: int,
+                         nb_etapes: int,
+                         taille_bloc: int = TAILLE_BLOC,
+                         generateur: np.random.Generator | int | None = None,
+                         methode: str = "cdf") -> tuple[Iterator[np.ndarray] | None, str | None]:
+    """
+    Simule une trajectoire en la livrant par morceaux de taille fixe.
+
+    La mémoire utilisée ne dépend que de `taille_bloc`, pas de `nb_etapes`.
+    Pour un même générateur, la concaténation des morceaux est identique à
+    la trajectoire de simuler_chaine_markov.
+
+    Args:
+        matrice_transition: Matrice (N x N) des probabilités de transition (dense ou CSR).
+        etat_initial: L'indice de l'état de départ.
+        nb_etapes: Le nombre total d'étapes à simuler.
+        taille_bloc: Nombre d'états par morceau.
+        generateur: Un numpy.random.Generator (ou une graine).
+        methode: "cdf" ou "alias" (voir simuler_chaine_markov).
+
+    Returns:
+        Un tuple (morceaux, erreur).
+        - Si succès, (générateur de tableaux d'états, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        matrice_transition = _preparer_matrice(matrice_transition)
+        erreur = _valider_matrice(matrice_transition)
+        if erreur:
+            return None, erreur
+        erreur = _valider_etat_initial(etat_initial, matrice_transition.shape[0])
+        if erreur:
+            return None, erreur
+        if methode not in _TABLES:
+            return None, f"Erreur : Méthode d'échantillonnage inconnue '{methode}'."
+        if taille_bloc < 1:
+            return None, "Erreur : La taille des morceaux doit être au moins 1."
+
+        table = _obtenir_table(matrice_transition, methode)
+        generateur = np.random.default_rng(generateur)
+        return _blocs_trajectoire(table, etat_initial, max(nb_etapes, 1), generateur, taille_bloc), None
+
+    except Exception as e:
+        return None, f"Une erreur de simulation est survenue : {e}"
+
+
+def simuler_chaine_markov_fichier(matrice_transition: np.ndarray,
+                                  etat_initial: int,
+                                  nb_etapes: int,
+                                  chemin_fichier: str | None = None,
+                                  taille_bloc: int = TAILLE_BLOC,
+                                  generateur: np.random.Generator | int | None = None,
+                                  methode: str = "cdf") -> tuple[dict | None, str | None]:
+    """
+    Simule une très longue trajectoire sans la garder en mémoire.
+
+    La trajectoire est écrite morceau par morceau dans un fichier .npy projeté
+    en mémoire (type entier le plus petit possible pour N états), et les comptes
+    de visites et de transitions sont calculés au fil de l'eau.
+
+    Args:
+        matrice_transition: Matrice (N x N) des probabilités de transition (dense ou CSR).
+        etat_initial: L'indice de l'état de départ.
+        nb_etapes: Le nombre total d'étapes à simuler.
+        chemin_fichier: Fichier .npy de sortie. Si None, seules les statistiques sont calculées.
+        taille_bloc: Nombre d'états simulés (et gardés en mémoire) à la fois.
+        generateur: Un numpy.random.Generator (ou une graine).
+        methode: "cdf" ou "alias" (voir simuler_chaine_markov).
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, ({"visites": (N,), "transitions": (N x N) dense ou CSR,
+                       "fichier": chemin ou None, "nb_etapes": int}, None).
+        - Si échec, (None, message_erreur).
+    """
+    morceaux, erreur = iterer_chaine_markov(matrice_transition, etat_initial, nb_etapes,
+                                            taille_bloc, generateur, methode)
+    if erreur:
+        return None, erreur
+    try:
+        n_etats = matrice_transition.shape[0]
+        nb_etapes = max(nb_etapes, 1)
+        sortie = None
+        if chemin_fichier is not None:
+            sortie = np.lib.format.open_memmap(chemin_fichier, mode='w+',
+                                               dtype=_dtype_etats(n_etats), shape=(nb_etapes,))
+
+        compteurs = _Compteurs(n_etats)
+        position = 0
+        for morceau in morceaux:
+            if sortie is not None:
+                sortie[position:position + len(morceau)] = morceau
+            compteurs.ajouter(morceau)
+            position += len(morceau)
+
+        if sortie is not None:
+            sortie.flush()
+            del sortie
+
+        resultats = compteurs.resultats()
+        resultats.update({"fichier": chemin_fichier, "nb_etapes": nb_etapes})
+        return resultats, None
+
+    except Exception as e:
+        return None, f"Une erreur de simulation est survenue : {e}"
+
+
+# Matrice de transition partagée par les tâches d'un processus de travail
+_MATRICE_TRAVAILLEUR = None
+
+
+def _initialiser_travailleur(matrice_transition):
+    # Exécuté une fois par processus : la matrice n'est envoyée qu'une fois
+    global _MATRICE_TRAVAILLEUR
+    _MATRICE_TRAVAILLEUR = matrice_transition
+
+
+def _executer_repliques(etat_initial: int,
+                        nb_etapes: int,
+                        graines: list[np.random.SeedSequence],
+                        methode: str,
+                        taille_bloc: int,
+                        matrice_transition=None) -> tuple[_Compteurs, np.ndarray]:
+    """Simule un lot de répliques (une graine chacune) et retourne leurs comptes cumulés."""
+    if matrice_transition is None:
+        matrice_transition = _MATRICE_TRAVAILLEUR
+    table = _obtenir_table(matrice_transition, methode)
+    compteurs = _Compteurs(table.n_etats)
+    etats_finaux = np.empty(len(graines), dtype=np.int64)
+    for r, graine in enumerate(graines):
+        replique = _Compteurs(table.n_etats)
+        for morceau in _blocs_trajectoire(table, etat_initial, nb_etapes,
+                                          np.random.default_rng(graine), taille_bloc):
+            replique.ajouter(morceau)
+        compteurs.fusionner(replique)
+        etats_finaux[r] = morceau[-1]
+    return compteurs, etats_finaux
+
+
+def monte_carlo_markov_parallele(matrice_transition: np.ndarray,
+                                 etat_initial: int,
+                                 nb_etapes: int,
+                                 nb_repliques: int,
+                                 graine: int | None = None,
+                                 nb_processus: int | None = None,
+                                 methode: str = "cdf",
+                                 taille_bloc: int = TAILLE_BLOC) -> tuple[dict | None, str | None]:
+    """
+    Simule des répliques indépendantes de la chaîne sur plusieurs processus.
+
+    Chaque réplique reçoit son propre flux aléatoire, issu de
+    numpy.random.SeedSequence(graine).spawn(nb_repliques) : les résultats
+    sont identiques bit à bit pour une même graine, quel que soit le nombre
+    de processus. Seuls les comptes de visites et de transitions (et l'état
+    final de chaque réplique) reviennent des processus, pas les trajectoires.
+
+    Args:
+        matrice_transition: Matrice (N x N) des probabilités de transition (dense ou CSR).
+        etat_initial: L'indice de l'état de départ.
+        nb_etapes: Le nombre d'étapes de chaque réplique.
+        nb_repliques: Le nombre de trajectoires indépendantes.
+        graine: Graine racine (None : graine aléatoire).
+        nb_processus: Nombre de processus (None : autant que de cœurs, 1 : pas de pool).
+        methode: "cdf" ou "alias" (voir simuler_chaine_markov).
+        taille_bloc: Nombre d'états simulés à la fois dans chaque réplique.
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, ({"visites": (N,), "transitions": (N x N) dense ou CSR,
+                       "etats_finaux": (nb_repliques,), "graine": int}, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        matrice_transition = _preparer_matrice(matrice_transition)
+        erreur = _valider_matrice(matrice_transition)
+        if erreur:
+            return None, erreur
+        erreur = _valider_etat_initial(etat_initial, matrice_transition.shape[0])
+        if erreur:
+            return None, erreur
+        if methode not in _TABLES:
+            return None, f"Erreur : Méthode d'échantillonnage inconnue '{methode}'."
+        if nb_repliques < 1:
+            return None, "Erreur : Il faut au moins une réplique."
+
+        racine = np.random.SeedSequence(graine)
+        graines = racine.spawn(nb_repliques)
+        nb_processus = nb_processus or os.cpu_count() or 1
+        nb_etapes = max(nb_etapes, 1)
+
+        compteurs = _Compteurs(matrice_transition.shape[0])
+        etats_finaux = np.empty(nb_repliques, dtype=np.int64)
+
+        # Lots contigus de répliques : plusieurs lots par processus pour équilibrer la charge
+        nb_lots = min(nb_repliques, nb_processus * 4)
+        bornes = np.linspace(0, nb_repliques, nb_lots + 1).astype(int)
+        lots = [(bornes[i], bornes[i + 1]) for i in range(nb_lots)]
+
+        if nb_processus == 1:
+            for debut, fin in lots:
+                lot, finaux = _executer_repliques(etat_initial, nb_etapes, graines[debut:fin],
+                                                  methode, taille_bloc, matrice_transition)
+                compteurs.fusionner(lot)
+                etats_finaux[debut:fin] = finaux
+        else:
+            with ProcessPoolExecutor(max_workers=nb_processus,
+                                     initializer=_initialiser_travailleur,
+                                     initargs=(matrice_transition,)) as pool:
+                taches = {pool.submit(_executer_repliques, etat_initial, nb_etapes,
+                                      graines[debut:fin], methode, taille_bloc): (debut, fin)
+                          for debut, fin in lots}
+                # Les comptes sont des entiers : l'ordre de fusion ne change pas le résultat
+                for tache in as_completed(taches):
+                    debut, fin = taches[tache]
+                    lot, finaux = tache.result()
+                    compteurs.fusionner(lot)
+                    etats_finaux[debut:fin] = finaux
+
+        resultats = compteurs.resultats()
+        resultats.update({"etats_finaux": etats_finaux, "graine": racine.entropy})
+        return resultats, None
+
+    except Exception as e:
+        return None, f"Une erreur de simulation est survenue : {e}"
+
+
+def simuler_ensemble_markov(matrice_transition: np.ndarray,
+                            nb_etapes: int,
+                            etats_initiaux: np.ndarray | int | None = None,
+                            distribution_initiale: np.ndarray | None = None,
+                            nb_marcheurs: int | None = None,
+                            generateur: np.random.Generator | int | None = None,
+                            histogrammes: bool = False,
+                            methode: str = "cdf") -> tuple[dict | None, str | None]:
+    """
+    Simule un ensemble de marcheurs indépendants, tous avancés ensemble.
+
+    À chaque étape, un seul tirage vectorisé fait avancer tous les marcheurs
+    (au lieu d'appeler simuler_chaine_markov une fois par marcheur).
+
+    Args:
+        matrice_transition: Matrice (N x N) des probabilités de transition (dense ou CSR).
+        nb_etapes: Le nombre total d'étapes (état initial compris).
+        etats_initiaux: Vecteur des états de départ (un par marcheur), ou un
+                        seul état commun à `nb_marcheurs` marcheurs.
+        distribution_initiale: Loi (N,) des états de départ, utilisée si
+                               `etats_initiaux` n'est pas fourni.
+        nb_marcheurs: Nombre de marcheurs (obligatoire avec une distribution
+                      initiale ou un état initial commun).
+        generateur: Un numpy.random.Generator (ou une graine).
+        histogrammes: Si True, compte aussi les marcheurs par état à chaque étape.
+        methode: "cdf" ou "alias" (voir simuler_chaine_markov).
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, ({"trajectoires": (marcheurs x étapes),
+                       "histogrammes": (étapes x N) ou None}, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        matrice_transition = _preparer_matrice(matrice_transition)
+        erreur = _valider_matrice(matrice_transition)
+        if erreur:
+            return None, erreur
+        n_etats = matrice_transition.shape[0]
+        if methode not in _TABLES:
+            return None, f"Erreur : Méthode d'échantillonnage inconnue '{methode}'."
+        generateur = np.random.default_rng(generateur)
+
+        # 1. États de départ des marcheurs
+        if etats_initiaux is not None:
+            etats = np.asarray(etats_initiaux)
+            if etats.dtype == bool or not np.issubdtype(etats.dtype, np.integer):
+                return None, "Erreur : Les états initiaux doivent être des entiers."
+            etats = etats.astype(np.int64)
+            if etats.ndim == 0:
+                if nb_marcheurs is None:
+                    return None, "Erreur : Indiquez le nombre de marcheurs pour un état initial commun."
+                etats = np.full(nb_marcheurs, etats)
+        elif distribution_initiale is not None:
+            if nb_marcheurs is None:
+                return None, "Erreur : Indiquez le nombre de marcheurs à tirer selon la distribution initiale."
+            distribution = np.asarray(distribution_initiale, dtype=np.float64)
+            if distribution.shape != (n_etats,):
+                return None, "Erreur : La distribution initiale doit avoir N composantes sommant à 1."
+            if not np.all(np.isfinite(distribution)) or np.any(distribution < 0):
+                return None, "Erreur : La distribution initiale contient des probabilités négatives ou invalides."
+            if not np.isclose(distribution.sum(), 1):
+                return None, "Erreur : La distribution initiale doit avoir N composantes sommant à 1."
+            cumul = np.cumsum(distribution)
+            cumul /= cumul[-1]
+            etats = np.searchsorted(cumul, generateur.random(nb_marcheurs), side='right')
+            etats = np.minimum(etats, n_etats - 1)
+        else:
+            return None, "Erreur : Fournissez des états initiaux ou une distribution initiale."
+        if np.any(etats >= n_etats) or np.any(etats < 0):
+            return None, "Erreur : Un état initial est en dehors des bornes."
+
+        # 2. Avancer tous les marcheurs d'une étape à la fois
+        nb_etapes = max(nb_etapes, 1)
+        table = _obtenir_table(matrice_transition, methode)
+        trajectoires = np.empty((nb_etapes, len(etats)), dtype=_dtype_etats(n_etats))
+        comptes = np.empty((nb_etapes, n_etats), dtype=np.int64) if histogrammes else None
+
+        for t in range(nb_etapes):
+            if t > 0:
+                etats = table.tirer(etats, generateur.random(len(etats)))
+            trajectoires[t] = etats
+            if histogrammes:
+                comptes[t] = np.bincount(etats, minlength=n_etats)
+
+        # Stockage (étapes x marcheurs) pour des écritures contiguës, rendu transposé
+        return {"trajectoires": trajectoires.T, "histogrammes": comptes}, None
+
+    except Exception as e:
+        return None, f"Une erreur de simulation est survenue : {e}"
+
+
+
+def distribution_stationnaire(matrice_transition: np.ndarray,
+                              methode: str = "valeurs_propres",
+                              tolerance: float = 1e-12,
+                              max_iterations: int = 100_000) -> tuple[np.ndarray | None, str | None]:
+    """
+    Calcule la distribution stationnaire π (telle que π·P = π et Σπ = 1).
+
+    Args:
+        matrice_transition: Matrice (N x N) des probabilités de transition (dense ou CSR).
+        methode: "valeurs_propres" (vecteur propre à gauche associé à 1)
+                 ou "puissance" (itérations π ← π·P jusqu'à convergence).
+        tolerance: Écart (norme 1) entre deux itérations pour arrêter la méthode "puissance".
+        max_iterations: Nombre maximal d'itérations de la méthode "puissance".
+
+    Returns:
+        Un tuple (distribution, erreur).
+        - Si succès, (pi, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        matrice_transition = _preparer_matrice(matrice_transition)
+        erreur = _valider_matrice(matrice_transition)
+        if erreur:
+            return None, erreur
+        n_etats = matrice_transition.shape[0]
+
+        if methode == "valeurs_propres" and sp.issparse(matrice_transition) and n_etats <= 2:
+            # eigs exige k < N - 1 : une si petite matrice est résolue en dense
+            matrice_transition = matrice_transition.toarray()
+        if methode == "valeurs_propres" and sp.issparse(matrice_transition):
+            # Valeur propre de plus grande partie réelle (= 1) de P^T, sans densifier
+            _, vecteurs = spla.eigs(matrice_transition.T, k=1, which='LR')
+            pi = np.real(vecteurs[:, 0])
+        elif methode == "valeurs_propres":
+            valeurs, vecteurs = np.linalg.eig(matrice_transition.T)
+            pi = np.real(vecteurs[:, np.argmin(np.abs(valeurs - 1))])
+        elif methode == "puissance":
+            # On itère sur la chaîne "paresseuse" (P + I) / 2 : même distribution
+            # stationnaire, mais la convergence est garantie même si P est périodique
+            pi = np.full(n_etats, 1.0 / n_etats)
+            for _ in range(max_iterations):
+                suivant = 0.5 * (matrice_transition.T @ pi + pi)
+                ecart = np.abs(suivant - pi).sum()
+                pi = suivant
+                if ecart < tolerance:
+                    break
+            else:
+                return None, f"Erreur : Pas de convergence après {max_iterations} itérations."
+        else:
+            return None, f"Erreur : Méthode inconnue '{methode}'."
+
+        pi = np.abs(pi) / np.abs(pi).sum()
+        return pi, None
+
+    except Exception as e:
+        return None, f"Erreur lors du calcul de la distribution stationnaire : {e}"
+
+
+def _puissance_deux(matrice_transition: np.ndarray, empreinte: str, k: int) -> np.ndarray:
+    """P^(2^k), calculée par carrés successifs et mise en cache."""
+    puissance = _CACHE_PUISSANCES.obtenir((empreinte, k))
+    if puissance is None:
+        if k == 0:
+            # Copie : l'appelant peut modifier sa matrice ensuite, l'empreinte ne changerait pas
+            puissance = matrice_transition.copy()
+        else:
+            precedente = _puissance_deux(matrice_transition, empreinte, k - 1)
+            puissance = precedente @ precedente
+        puissance.setflags(write=False)
+        _CACHE_PUISSANCES.ajouter((empreinte, k), puissance)
+    return puissance
+
+
+def distribution_n_etapes(matrice_transition: np.ndarray,
+                          distribution_initiale: np.ndarray,
+                          n: int) -> tuple[np.ndarray | None, str | None]:
+    """
+    Calcule la loi exacte de X_n, c'est-à-dire π·P^n.
+
+    P^n est décomposée en puissances P^(2^k) (exponentiation par carrés) :
+    seulement O(log n) produits, et les carrés sont gardés en cache pour
+    les appels suivants avec la même matrice. Pour une matrice creuse, les
+    carrés se rempliraient : on applique alors P n fois au vecteur, ce qui
+    garde une mémoire en O(nombre de transitions non nulles).
+
+    Args:
+        matrice_transition: Matrice (N x N) des probabilités de transition (dense ou CSR).
+        distribution_initiale: Loi (N,) de l'état initial.
+        n: Le nombre d'étapes.
+
+    Returns:
+        Un tuple (distribution, erreur).
+        - Si succès, (pi_n, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        matrice_transition = _preparer_matrice(matrice_transition)
+        erreur = _valider_matrice(matrice_transition)
+        if erreur:
+            return None, erreur
+        distribution = np.asarray(distribution_initiale, dtype=np.float64)
+        if distribution.shape != (matrice_transition.shape[0],):
+            return None, "Erreur : La distribution initiale doit avoir N composantes."
+        if n < 0:
+            return None, "Erreur : Le nombre d'étapes doit être positif."
+
+        if sp.issparse(matrice_transition):
+            transposee = matrice_transition.T.tocsr()
+            for _ in range(n):
+                distribution = transposee @ distribution
+            return distribution, None
+
+        empreinte = empreinte_tableaux(matrice_transition)
+        k = 0
+        while n:
+            if n & 1:
+                distribution = distribution @ _puissance_deux(matrice_transition, empreinte, k)
+            n >>= 1
+            k += 1
+        return distribution, None
+
+    except Exception as e:
+        return None, f"Erreur lors du calcul de la distribution : {e}"
+
+
+def evolution_distribution(matrice_transition: np.ndarray,
+                           distribution_initiale: np.ndarray,
+                           nb_etapes: int) -> tuple[np.ndarray | None, str | None]:
+    """
+    Calcule les lois exactes π·P^t pour t = 0, ..., nb_etapes - 1.
+
+    Pratique pour superposer les probabilités exactes à une trajectoire simulée.
+
+    Returns:
+        Un tuple (distributions, erreur).
+        - Si succès, (tableau (nb_etapes x N), None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        matrice_transition = _preparer_matrice(matrice_transition)
+        erreur = _valider_matrice(matrice_transition)
+        if erreur:
+            return None, erreur
+        distribution = np.asarray(distribution_initiale, dtype=np.float64)
+        if distribution.shape != (matrice_transition.shape[0],):
+            return None, "Erreur : La distribution initiale doit avoir N composantes."
+
+        distributions = np.empty((max(nb_etapes, 1), len(distribution)))
+        distributions[0] = distribution
+        for t in range(1, len(distributions)):
+            distributions[t] = matrice_transition.T @ distributions[t - 1]
+        return distributions, None
+
+    except Exception as e:
+        return None, f"Erreur lors du calcul de la distribution : {e}"
+
+
+
+def _factoriser(matrice: np.ndarray | sp.csr_matrix):
+    """
+    Factorise une matrice carrée (LU dense ou LU creuse) une seule fois.
+
+    Returns:
+        Une fonction resoudre(seconds_membres) réutilisant la factorisation.
+    """
+    if sp.issparse(matrice):
+        lu = spla.splu(sp.csc_matrix(matrice))
+        return lu.solve
+    with warnings.catch_warnings():
+        # La singularité est signalée par l'exception ci-dessous, pas par un avertissement
+        warnings.simplefilter("ignore", sla.LinAlgWarning)
+        lu, piv = sla.lu_factor(matrice, check_finite=False)
+    if np.any(np.diag(lu) == 0):
+        raise np.linalg.LinAlgError("matrice singulière")
+    return lambda seconds_membres: sla.lu_solve((lu, piv), seconds_membres, check_finite=False)
+
+
+def analyser_chaine_absorbante(matrice_transition: np.ndarray,
+                               matrice_fondamentale: bool | None = None) -> tuple[dict | None, str | None]:
+    """
+    Analyse exacte d'une chaîne absorbante (sans simulation).
+
+    Avec Q (transitions entre états transitoires) et R (des transitoires vers
+    les absorbants), on résout (I - Q) X = [R | 1] avec une seule
+    factorisation (LU creuse pour une matrice CSR) :
+    - probabilités d'absorption B = N·R,
+    - nombre moyen d'étapes avant absorption t = N·1,
+    où N = (I - Q)^-1 est la matrice fondamentale.
+
+    Args:
+        matrice_transition: Matrice (N x N) des probabilités de transition (dense ou CSR).
+        matrice_fondamentale: Si True, calcule aussi N (dense, taille T x T).
+                              Par défaut : oui pour une matrice dense, non pour une matrice creuse.
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, ({"etats_absorbants", "etats_transitoires",
+                       "matrice_fondamentale" (ou None), "probabilites_absorption" (T x A),
+                       "temps_absorption" (T,)}, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        matrice_transition = _preparer_matrice(matrice_transition)
+        erreur = _valider_matrice(matrice_transition)
+        if erreur:
+            return None, erreur
+        creuse = sp.issparse(matrice_transition)
+        if matrice_fondamentale is None:
+            matrice_fondamentale = not creuse
+
+        # 1. Détecter les états absorbants (P[i, i] = 1)
+        absorbant = np.isclose(matrice_transition.diagonal(), 1)
+        absorbants, transitoires = np.flatnonzero(absorbant), np.flatnonzero(~absorbant)
+        if len(absorbants) == 0:
+            return None, "Erreur : La chaîne n'a aucun état absorbant."
+
+        # 2. Blocs Q et R
+        lignes = matrice_transition[transitoires]
+        Q, R = lignes[:, transitoires], lignes[:, absorbants]
+        identite = sp.identity(len(transitoires), format='csr') if creuse else np.eye(len(transitoires))
+        if creuse:
+            R = R.toarray()
+
+        # 3. Une seule factorisation de (I - Q) pour tous les seconds membres
+        try:
+            resoudre = _factoriser(identite - Q)
+            seconds_membres = [R, np.ones((len(transitoires), 1))]
+            if matrice_fondamentale:
+                seconds_membres.append(np.eye(len(transitoires)))
+            solution = resoudre(np.hstack(seconds_membres))
+        except (np.linalg.LinAlgError, RuntimeError):
+            return None, "Erreur : Certains états transitoires n'atteignent jamais un état absorbant."
+
+        nb_absorbants = len(absorbants)
+        resultats = {
+            "etats_absorbants": absorbants,
+            "etats_transitoires": transitoires,
+            "matrice_fondamentale": solution[:, nb_absorbants + 1:] if matrice_fondamentale else None,
+            "probabilites_absorption": solution[:, :nb_absorbants],
+            "temps_absorption": solution[:, nb_absorbants],
+        }
+        return resultats, None
+
+    except Exception as e:
+        return None, f"Erreur lors de l'analyse de la chaîne absorbante : {e}"
+
+
+def temps_moyens_premier_passage(matrice_transition: np.ndarray,
+                                 cible: int | None = None) -> tuple[np.ndarray | None, str | None]:
+    """
+    Calcule les temps moyens de premier passage d'une chaîne irréductible.
+
+    - Avec une `cible` j : vecteur m (N,) où m[i] est le nombre moyen d'étapes
+      pour atteindre j depuis i (m[j] = temps moyen de retour en j). Une seule
+      résolution, creuse si la matrice l'est.
+    - Sans cible : matrice M (N x N) complète, tirée de la matrice fondamentale
+      Z = (I - P + 1·π)^-1 par M[i, j] = (Z[j, j] - Z[i, j]) / π[j] (dense).
+
+    Returns:
+        Un tuple (temps, erreur).
+        - Si succès, (m ou M, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        matrice_transition = _preparer_matrice(matrice_transition)
+        erreur = _valider_matrice(matrice_transition)
+        if erreur:
+            return None, erreur
+        n_etats = matrice_transition.shape[0]
+
+        if cible is not None:
+            if cible >= n_etats or cible < 0:
+                return None, "Erreur : L'état cible est en dehors des bornes."
+            autres = np.flatnonzero(np.arange(n_etats) != cible)
+            Q = matrice_transition[autres][:, autres]
+            identite = sp.identity(len(autres), format='csr') if sp.issparse(Q) else np.eye(len(autres))
+            try:
+                temps_autres = _factoriser(identite - Q)(np.ones(len(autres)))
+            except (np.linalg.LinAlgError, RuntimeError):
+                return None, "Erreur : L'état cible n'est pas accessible depuis tous les états."
+            temps = np.empty(n_etats)
+            temps[autres] = temps_autres
+            # Retour en j : une étape, puis le temps d'atteinte depuis l'état suivant
+            ligne = matrice_transition[cible]
+            ligne = ligne.toarray().ravel() if sp.issparse(ligne) else ligne
+            temps[cible] = 1 + ligne[autres] @ temps_autres
+            return temps, None
+
+        if sp.issparse(matrice_transition):
+            matrice_transition = matrice_transition.toarray()
+        pi, erreur = distribution_stationnaire(matrice_transition)
+        if erreur:
+            return None, erreur
+        try:
+            Z = np.linalg.inv(np.eye(n_etats) - matrice_transition + pi[np.newaxis, :])
+        except np.linalg.LinAlgError:
+            return None, "Erreur : La chaîne n'est pas irréductible."
+        M = (np.diag(Z)[np.newaxis, :] - Z) / pi[np.newaxis, :]
+        M[np.diag_indices(n_etats)] = 1 / pi
+        return M, None
+
     except Exception as e:
-        return None, f"Une erreur de simulation est survenue : {e}"
\ No newline at end of file
+        return None, f"Erreur lors du calcul des temps de premier passage : {e}"
@@ -1,10 +1,569 @@
+import hashlib
+import json
+import os
+import signal
+import sqlite3
+import subprocess
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
 import pulp
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+from scipy.optimize import Bounds, LinearConstraint, linprog, milp
+from threadpoolctl import threadpool_limits
+
+from core.core_cache import CacheLRU
+
+
+# Types de variables acceptés par resoudre_prog_lineaire
+TYPES_VARIABLES = ("continue", "entiere", "binaire")
+# Types de contraintes acceptés par resoudre_prog_lineaire
+TYPES_CONTRAINTES = ("<=", ">=", "==")
+
+# Statut d'une solution entière réalisable mais dont l'optimalité n'est pas
+# prouvée (limite de temps, annulation) : la meilleure solution trouvée est rendue
+STATUT_REALISABLE = pulp.LpSolution[pulp.LpSolutionIntegerFeasible]
+
+
+class JetonAnnulation:
+    """
+    Permet d'interrompre une résolution en cours depuis un autre thread
+    (l'interface ou un traitement par lots). Le solveur s'arrête et rend la
+    meilleure solution trouvée jusque-là.
+    """
+    def __init__(self):
+        self._evenement = threading.Event()
+
+    def annuler(self):
+        self._evenement.set()
+
+    @property
+    def annule(self) -> bool:
+        return self._evenement.is_set()
 
-def resoudre_prog_lineaire(direction: str, 
-                         fonction_obj: dict[str, float], 
-                         contraintes: list[dict]) -> tuple[str, float, dict[str, float]]:
+    def attendre(self, delai: float) -> bool:
+        """Attend au plus `delai` secondes ; True si l'annulation a été demandée."""
+        return self._evenement.wait(delai)
+
+
+class ProblemeLineaire:
+    """
+    Forme matricielle d'un problème de programmation linéaire :
+
+        optimiser   c·x
+        sous        A_ub·x <= b_ub
+                    A_eq·x == b_eq
+                    borne_inf <= x <= borne_sup
+                    x_j entier pour les variables marquées dans `entiers`
+
+    Les matrices de contraintes sont stockées en CSR (scipy.sparse) : la
+    mémoire et le temps de construction ne dépendent que des coefficients
+    non nuls, pas du produit contraintes x variables.
     """
-    Résout un problème de programmation linéaire avec PuLP. [cite: 17, 27]
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+                 bornes=(0, None), direction: str = "Minimiser",
+                 noms_variables: list[str] | None = None,
+                 entiers=None):
+        """
+        Args:
+            c: Coefficients (n,) de la fonction objectif.
+            A_ub, b_ub: Contraintes <= (matrice m1 x n dense ou creuse, vecteur m1).
+            A_eq, b_eq: Contraintes == (matrice m2 x n dense ou creuse, vecteur m2).
+            bornes: Un couple (inf, sup) commun, ou une liste de n couples.
+                    None signifie "pas de borne". Par défaut : x >= 0.
+            direction: "Maximiser" ou "Minimiser".
+            noms_variables: Noms des n variables (par défaut x0, x1, ...).
+            entiers: Indices (ou masque booléen) des variables entières. Par défaut : aucune.
+        """
+        self.c = np.array(c, dtype=np.float64).ravel() # Copie : les modifications ne touchent pas l'appelant
+        n = len(self.c)
+        self.direction = direction
+        self.noms_variables = list(noms_variables) if noms_variables is not None else [f"x{j}" for j in range(n)]
+        if len(self.noms_variables) != n:
+            raise ValueError("Il faut autant de noms que de variables.")
+
+        self.A_ub, self.b_ub = self._contraintes(A_ub, b_ub, n)
+        self.A_eq, self.b_eq = self._contraintes(A_eq, b_eq, n)
+
+        bornes = list(bornes)
+        if len(bornes) == 2 and not isinstance(bornes[0], (tuple, list)):
+            bornes = [bornes] * n
+        if len(bornes) != n:
+            raise ValueError("Il faut une paire de bornes par variable.")
+        self.borne_inf = np.array([-np.inf if inf is None else inf for inf, _ in bornes], dtype=np.float64)
+        self.borne_sup = np.array([np.inf if sup is None else sup for _, sup in bornes], dtype=np.float64)
+
+        self.entiers = np.zeros(n, dtype=bool)
+        if entiers is not None:
+            entiers = np.asarray(entiers)
+            self.entiers[entiers if entiers.dtype == bool else entiers.astype(np.intp)] = True
+
+    @staticmethod
+    def _contraintes(A, b, n):
+        if A is None:
+            return sp.csr_matrix((0, n)), np.zeros(0)
+        A = sp.csr_matrix(A, dtype=np.float64)
+        b = np.array(b, dtype=np.float64).ravel()
+        if A.shape[1] != n or A.shape[0] != len(b):
+            raise ValueError("Dimensions des contraintes incohérentes avec c et b.")
+        return A, b
+
+    @property
+    def nb_variables(self) -> int:
+        return len(self.c)
+
+    @property
+    def est_mip(self) -> bool:
+        """True si au moins une variable est entière."""
+        return bool(self.entiers.any())
+
+    @classmethod
+    def depuis_dictionnaires(cls, direction: str,
+                             fonction_obj: dict[str, float],
+                             contraintes: list[dict],
+                             types_variables: dict[str, str] | None = None,
+                             bornes: dict[str, tuple] | None = None) -> "ProblemeLineaire":
+        """
+        Construit la forme matricielle à partir des dictionnaires de
+        resoudre_prog_lineaire (seuls les coefficients présents sont parcourus).
+        Les contraintes >= sont changées de signe pour devenir des <=.
+        Les variables binaires sont des entières bornées par défaut à [0, 1].
+        """
+        types_variables = types_variables or {}
+        bornes = bornes or {}
+        inconnus = set(types_variables.values()) - set(TYPES_VARIABLES)
+        if inconnus:
+            raise ValueError(f"Type(s) de variable inconnu(s) : {sorted(inconnus)}")
+        inconnus = {c['type'] for c in contraintes} - set(TYPES_CONTRAINTES)
+        if inconnus:
+            raise ValueError(f"Type(s) de contrainte inconnu(s) : {sorted(inconnus)}")
+        noms = set(fonction_obj.keys()) | set(types_variables) | set(bornes)
+        for c in contraintes:
+            noms.update(c['coeffs'].keys())
+        noms = sorted(noms)
+        indice = {nom: j for j, nom in enumerate(noms)}
+
+        c_vec = np.zeros(len(noms))
+        for nom, coeff in fonction_obj.items():
+            c_vec[indice[nom]] = coeff
+
+        # Triplets (ligne, colonne, valeur) des deux familles de contraintes
+        triplets = {'ub': ([], [], [], []), 'eq': ([], [], [], [])}
+        for c in contraintes:
+            famille, signe = ('eq', 1.0) if c['type'] == '==' else ('ub', -1.0 if c['type'] == '>=' else 1.0)
+            lignes, colonnes, valeurs, rhs = triplets[famille]
+            for nom, coeff in c['coeffs'].items():
+                lignes.append(len(rhs))
+                colonnes.append(indice[nom])
+                valeurs.append(signe * coeff)
+            rhs.append(signe * c['rhs'])
+
+        matrices = {}
+        for famille, (lignes, colonnes, valeurs, rhs) in triplets.items():
+            A = sp.csr_matrix((valeurs, (lignes, colonnes)), shape=(len(rhs), len(noms)))
+            matrices[famille] = (A, np.array(rhs, dtype=np.float64))
+
+        bornes_par_defaut = {"continue": (0, None), "entiere": (0, None), "binaire": (0, 1)}
+        bornes_vec = [bornes.get(nom, bornes_par_defaut[types_variables.get(nom, "continue")]) for nom in noms]
+        entiers = [j for j, nom in enumerate(noms) if types_variables.get(nom, "continue") != "continue"]
+
+        return cls(c_vec, *matrices['ub'], *matrices['eq'], bornes=bornes_vec, direction=direction,
+                   noms_variables=noms, entiers=entiers)
+
+
+def _construire_pulp(probleme: ProblemeLineaire) -> pulp.LpProblem:
+    """Construit le modèle PuLP ligne par ligne, à partir des coefficients non nuls uniquement."""
+    sens = pulp.LpMaximize if probleme.direction == "Maximiser" else pulp.LpMinimize
+    prob = pulp.LpProblem("Mon_Probleme_PL", sens)
+
+    variables = [pulp.LpVariable(f"Var_{nom}",
+                                 lowBound=None if np.isinf(inf) else inf,
+                                 upBound=None if np.isinf(sup) else sup,
+                                 cat=pulp.LpInteger if entier else pulp.LpContinuous)
+                 for nom, inf, sup, entier in zip(probleme.noms_variables, probleme.borne_inf.tolist(),
+                                                  probleme.borne_sup.tolist(), probleme.entiers.tolist())]
+
+    c = probleme.c.tolist()
+    objectif = pulp.LpAffineExpression([(variables[j], c[j]) for j in np.flatnonzero(probleme.c).tolist()])
+    prob.setObjective(objectif)
+
+    for A, b, type_contrainte, prefixe in ((probleme.A_ub, probleme.b_ub, pulp.LpConstraintLE, "Contrainte_ub"),
+                                           (probleme.A_eq, probleme.b_eq, pulp.LpConstraintEQ, "Contrainte_eq")):
+        for i in range(A.shape[0]):
+            debut, fin = A.indptr[i], A.indptr[i + 1]
+            expression = pulp.LpAffineExpression(
+                [(variables[j], v) for j, v in zip(A.indices[debut:fin].tolist(), A.data[debut:fin].tolist())])
+            prob.addConstraint(pulp.LpConstraint(expression, type_contrainte, f"{prefixe}_{i}", float(b[i])))
+    return prob
+
+
+def _resoudre_pulp(prob: pulp.LpProblem,
+                   solveur: pulp.PULP_CBC_CMD | None = None,
+                   jeton: JetonAnnulation | None = None) -> tuple[str, float, dict[str, float]]:
+    """Résout un modèle PuLP avec CBC et formate les résultats."""
+    solveur = solveur or pulp.PULP_CBC_CMD(msg=0) # msg=0 pour cacher les logs de Cbc
+    try:
+        if jeton is not None and jeton.annule:
+            return "Not Solved", 0.0, {}
+        if jeton is not None and all(hasattr(solveur, nom) for nom in _INTERNES_CBC):
+            _executer_cbc_annulable(prob, solveur, jeton)
+        else:
+            # Sans ces fonctions (autre version de PuLP) : résolution non interruptible,
+            # dont seule la limite de temps du solveur (timeLimit) borne la durée
+            prob.solve(solveur)
+    except Exception as e:
+        return f"Erreur lors de la résolution: {e}", 0, {}
+
+    statut = pulp.LpStatus[prob.status]
+    if prob.sol_status == pulp.LpSolutionIntegerFeasible:
+        statut = STATUT_REALISABLE # Arrêt avant la preuve d'optimalité
+    valeur_obj = pulp.value(prob.objective)
+    valeurs_vars = {v.name: v.varValue for v in prob.variables()}
+    return statut, valeur_obj, valeurs_vars
+
+
+# Fonctions internes de PULP_CBC_CMD reprises par _executer_cbc_annulable (vérifiées avec PuLP 3.3)
+_INTERNES_CBC = ("create_tmp_files", "getOptions", "readsol_MPS")
+
+
+def _executer_cbc_annulable(prob: pulp.LpProblem, solveur: pulp.PULP_CBC_CMD, jeton: JetonAnnulation):
+    """
+    Même déroulement que PULP_CBC_CMD.solve_CBC (fichier MPS, programme CBC,
+    lecture de la solution), mais en gardant la main sur le processus : si le
+    jeton est annulé, CBC reçoit un Ctrl-C, arrête la recherche et écrit la
+    meilleure solution trouvée.
+    """
+    fichier_mps, fichier_sol = solveur.create_tmp_files(prob.name, "mps", "sol")
+    variables, noms_variables, noms_contraintes, _ = prob.writeMPS(fichier_mps, rename=1)
+    commande = [fichier_mps] + (["-max"] if prob.sense == pulp.LpMaximize else [])
+    if solveur.timeLimit is not None:
+        commande += ["-sec", str(solveur.timeLimit)]
+    for option in solveur.options + solveur.getOptions():
+        commande += f"-{option}".split()
+    commande += ["-solve" if prob.isMIP() else "-initialSolve",
+                 "-printingOptions", "all", "-solution", fichier_sol]
+
+    if os.name == "nt":
+        # Sous Windows, Ctrl-Break ne peut viser qu'un groupe de processus distinct
+        processus = subprocess.Popen([solveur.path] + commande, stdout=subprocess.DEVNULL,
+                                     stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL,
+                                     creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+        signal_arret = signal.CTRL_BREAK_EVENT
+    else:
+        processus = subprocess.Popen([solveur.path] + commande, stdout=subprocess.DEVNULL,
+                                     stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+        signal_arret = signal.SIGINT
+    try:
+        while processus.poll() is None:
+            if jeton.attendre(0.05):
+                processus.send_signal(signal_arret)
+                processus.wait()
+        if not os.path.exists(fichier_sol):
+            raise pulp.PulpSolverError(f"Pulp: Error while executing {solveur.path}")
+        statut, valeurs, _, _, _, statut_solution = solveur.readsol_MPS(
+            fichier_sol, prob, variables, noms_variables, noms_contraintes)
+        prob.assignVarsVals(valeurs)
+        prob.assignStatus(statut, statut_solution)
+    finally:
+        if processus.poll() is None:
+            processus.kill()
+        solveur.delete_tmp_files(fichier_mps, fichier_sol)
+
+
+def _resoudre_cbc(probleme: ProblemeLineaire,
+                  limite_temps: float | None = None,
+                  ecart_relatif: float | None = None,
+                  nb_threads: int | None = None,
+                  jeton: JetonAnnulation | None = None) -> tuple[str, float, dict[str, float]]:
+    """Backend CBC : modèle PuLP, résolu par le programme CBC (fichier MPS + sous-processus)."""
+    solveur = pulp.PULP_CBC_CMD(msg=0, timeLimit=limite_temps, gapRel=ecart_relatif, threads=nb_threads)
+    return _resoudre_pulp(_construire_pulp(probleme), solveur, jeton)
+
+
+# Statuts de scipy.optimize.linprog traduits en statuts PuLP
+_STATUTS_HIGHS = {0: "Optimal", 1: "Not Solved", 2: "Infeasible", 3: "Unbounded", 4: "Undefined"}
+
+
+def _nom_pulp(nom: str) -> str:
+    # Même nom que celui que PuLP donnerait à la variable (caractères interdits remplacés par _)
+    return f"Var_{nom}".translate(pulp.LpElement.trans)
+
+
+def _resoudre_highs(probleme: ProblemeLineaire,
+                    limite_temps: float | None = None,
+                    ecart_relatif: float | None = None,
+                    nb_threads: int | None = None,
+                    jeton: JetonAnnulation | None = None) -> tuple[str, float, dict[str, float]]:
+    """
+    Backend HiGHS : résolution dans le processus (scipy.optimize.linprog, ou
+    scipy.optimize.milp s'il y a des variables entières), sans fichier ni sous-processus.
+
+    scipy n'expose ni le nombre de threads de HiGHS (`nb_threads` est ignoré)
+    ni de rappel pendant la résolution : le jeton n'est consulté qu'avant de
+    commencer. Pour un MIP interruptible, utiliser le backend CBC.
+    """
+    if jeton is not None and jeton.annule:
+        return "Not Solved", 0.0, {}
+    signe = -1.0 if probleme.direction == "Maximiser" else 1.0 # linprog minimise toujours
+    options = {}
+    if limite_temps is not None:
+        options["time_limit"] = limite_temps
+    try:
+        contraintes = [LinearConstraint(A, bas, haut) for A, bas, haut in
+                       ((probleme.A_ub, -np.inf, probleme.b_ub), (probleme.A_eq, probleme.b_eq, probleme.b_eq))
+                       if A.shape[0]]
+        if probleme.est_mip:
+            if ecart_relatif is not None:
+                options["mip_rel_gap"] = ecart_relatif
+            res = milp(signe * probleme.c, integrality=probleme.entiers.astype(np.uint8),
+                       bounds=Bounds(probleme.borne_inf, probleme.borne_sup),
+                       constraints=contraintes, options=options)
+        else:
+            res = linprog(signe * probleme.c,
+                          A_ub=probleme.A_ub if probleme.A_ub.shape[0] else None,
+                          b_ub=probleme.b_ub if probleme.A_ub.shape[0] else None,
+                          A_eq=probleme.A_eq if probleme.A_eq.shape[0] else None,
+                          b_eq=probleme.b_eq if probleme.A_eq.shape[0] else None,
+                          bounds=np.column_stack((probleme.borne_inf, probleme.borne_sup)),
+                          method='highs', options=options)
+    except Exception as e:
+        return f"Erreur lors de la résolution: {e}", 0, {}
+
+    statut = _STATUTS_HIGHS.get(res.status, "Undefined")
+    if res.status == 1 and res.x is not None:
+        statut = STATUT_REALISABLE # Limite atteinte avec une solution entière réalisable
+    elif res.status == 4 and "unbounded or infeasible" in res.message:
+        # HiGHS ne tranche pas (cas courant pour un MIP) : un objectif nul ne laisse que la réalisabilité
+        faisabilite = milp(np.zeros(probleme.nb_variables), integrality=probleme.entiers.astype(np.uint8),
+                           bounds=Bounds(probleme.borne_inf, probleme.borne_sup),
+                           constraints=contraintes, options=options)
+        statut = "Unbounded" if faisabilite.status == 0 else _STATUTS_HIGHS.get(faisabilite.status, "Undefined")
+    # Sans solution, même convention que CBC : objectif et variables à 0
+    valeurs = res.x.tolist() if res.x is not None else [0.0] * probleme.nb_variables
+    valeur_obj = float(signe * res.fun) if res.x is not None else 0.0
+    # Même présentation que PuLP : variables triées par nom
+    valeurs_vars = dict(sorted(zip(map(_nom_pulp, probleme.noms_variables), valeurs)))
+    return statut, valeur_obj, valeurs_vars
+
+
+# Au-delà de ce nombre de variables entières, le choix automatique passe à CBC
+SEUIL_MIP_HIGHS = 200
+
+# Backends disponibles pour le paramètre `backend`
+BACKENDS = {"cbc": _resoudre_cbc, "highs": _resoudre_highs}
+
+
+def choisir_backend(probleme: ProblemeLineaire, annulable: bool = False) -> str:
+    """
+    Choisit le backend d'un problème :
+    - HiGHS (dans le processus) pour les problèmes continus et les petits MIP,
+      ce qui évite le coût fixe de CBC (fichier MPS, lancement d'un processus,
+      lecture de la solution) qui domine sur les petits problèmes ;
+    - CBC pour les MIP de plus de SEUIL_MIP_HIGHS variables entières (threads
+      configurables), ou pour tout MIP dont la résolution doit pouvoir être
+      interrompue (`annulable`).
+    """
+    if not probleme.est_mip:
+        return "highs"
+    if annulable or probleme.entiers.sum() > SEUIL_MIP_HIGHS:
+        return "cbc"
+    return "highs"
+
+
+def empreinte_probleme(probleme: ProblemeLineaire) -> str:
+    """
+    Empreinte canonique d'un problème : indépendante de l'ordre des variables
+    et de l'ordre des contraintes (les variables sont triées par nom, les
+    lignes de chaque bloc triées par contenu).
+    """
+    ordre = np.argsort(np.asarray(probleme.noms_variables, dtype=str), kind='stable')
+    rang = np.empty_like(ordre)
+    rang[ordre] = np.arange(len(ordre))
+    h = hashlib.blake2b(digest_size=16)
+    h.update(probleme.direction.encode())
+    h.update("\x00".join(np.asarray(probleme.noms_variables, dtype=str)[ordre]).encode())
+    for vecteur in (probleme.c, probleme.borne_inf, probleme.borne_sup, probleme.entiers):
+        h.update(np.ascontiguousarray(vecteur[ordre], dtype=float).tobytes())
+    for bloc, A, b in ((b"|ub|", probleme.A_ub, probleme.b_ub), (b"|eq|", probleme.A_eq, probleme.b_eq)):
+        A = A.tocsr()
+        lignes = []
+        for i in range(A.shape[0]):
+            debut, fin = A.indptr[i], A.indptr[i + 1]
+            colonnes = rang[A.indices[debut:fin]]
+            tri = np.argsort(colonnes)
+            valeurs = A.data[debut:fin][tri]
+            garder = valeurs != 0
+            lignes.append(colonnes[tri][garder].astype(np.int64).tobytes()
+                          + np.float64(b[i]).tobytes()
+                          + valeurs[garder].astype(float).tobytes())
+        h.update(bloc)
+        for ligne in sorted(lignes):
+            h.update(len(ligne).to_bytes(8, "little"))
+            h.update(ligne)
+    return h.hexdigest()
+
+
+class CacheResultatsLP:
+    """
+    Cache des résultats de PL, indexé par empreinte_probleme.
+
+    Un cache LRU en mémoire, doublé (optionnellement) d'une base SQLite sur
+    disque pour retrouver les résultats d'une exécution à l'autre. Seuls les
+    résultats définitifs (optimal, infaisable, non borné) sont conservés.
+    """
+    STATUTS_CONSERVES = ("Optimal", "Infeasible", "Unbounded")
+
+    def __init__(self, taille_max: int = 256, chemin_sqlite: str | None = None):
+        self.memoire = CacheLRU(taille_max=taille_max)
+        self.chemin_sqlite = chemin_sqlite
+        self._verrou = threading.Lock()
+        self._connexion = None
+        if chemin_sqlite is not None:
+            self._connexion = sqlite3.connect(chemin_sqlite, check_same_thread=False)
+            self._connexion.execute("CREATE TABLE IF NOT EXISTS resultats "
+                                    "(empreinte TEXT PRIMARY KEY, resultat TEXT)")
+            self._connexion.commit()
+        self.succes_disque = 0
+
+    def obtenir(self, cle: str):
+        """Retourne (statut, valeur_objectif, valeurs_variables) ou None si absent."""
+        resultat = self.memoire.obtenir(cle)
+        if resultat is None and self._connexion is not None:
+            with self._verrou:
+                ligne = self._connexion.execute("SELECT resultat FROM resultats WHERE empreinte = ?",
+                                                (cle,)).fetchone()
+            if ligne is not None:
+                self.succes_disque += 1
+                resultat = tuple(json.loads(ligne[0]))
+                self.memoire.ajouter(cle, resultat)
+        if resultat is None:
+            return None
+        statut, valeur_obj, valeurs_vars = resultat
+        return statut, valeur_obj, dict(valeurs_vars) # Copie : l'appelant peut la modifier
+
+    def ajouter(self, cle: str, resultat: tuple):
+        if resultat[0] not in self.STATUTS_CONSERVES:
+            return
+        statut, valeur_obj, valeurs_vars = resultat
+        resultat = (statut, valeur_obj, dict(valeurs_vars))
+        self.memoire.ajouter(cle, resultat)
+        if self._connexion is not None:
+            with self._verrou:
+                self._connexion.execute("INSERT OR REPLACE INTO resultats VALUES (?, ?)",
+                                        (cle, json.dumps(resultat)))
+                self._connexion.commit()
+
+    def vider(self):
+        """Vide la mémoire et la base sur disque."""
+        self.memoire.vider()
+        if self._connexion is not None:
+            with self._verrou:
+                self._connexion.execute("DELETE FROM resultats")
+                self._connexion.commit()
+
+    def statistiques(self) -> dict:
+        """Succès (en mémoire ou sur disque) et échecs du cache."""
+        stats = self.memoire.statistiques()
+        # Un succès sur disque a d'abord été un échec en mémoire
+        stats["succes_disque"] = self.succes_disque
+        stats["succes"] += self.succes_disque
+        stats["echecs"] -= self.succes_disque
+        return stats
+
+
+def resoudre_probleme(probleme: ProblemeLineaire,
+                      backend: str = "auto",
+                      cache: CacheResultatsLP | None = None,
+                      limite_temps: float | None = None,
+                      ecart_relatif: float | None = None,
+                      nb_threads: int | None = None,
+                      jeton: JetonAnnulation | None = None) -> tuple[str, float, dict[str, float]]:
+    """
+    Résout un ProblemeLineaire avec le backend demandé ("auto", "cbc" ou "highs").
+    Si `cache` est donné, un problème déjà résolu (à l'ordre des variables et
+    des contraintes près) n'est pas résolu à nouveau. Il est ignoré si un
+    écart relatif est demandé (la solution rendue n'est alors pas forcément optimale).
+
+    Args:
+        limite_temps: Durée maximale de la résolution, en secondes.
+        ecart_relatif: Écart relatif toléré entre la solution et la borne (MIP).
+        nb_threads: Nombre de threads du solveur (CBC uniquement).
+        jeton: JetonAnnulation permettant d'interrompre la résolution.
+        (Voir resoudre_prog_lineaire pour les autres paramètres.)
+
+    Returns:
+        Un tuple (statut, valeur_objectif, valeurs_variables), comme resoudre_prog_lineaire.
+        Si la résolution est arrêtée (limite de temps, annulation) après avoir
+        trouvé une solution entière, le statut est STATUT_REALISABLE et la
+        meilleure solution trouvée est rendue.
+    """
+    if ecart_relatif is not None:
+        cache = None
+    if cache is not None:
+        cle = empreinte_probleme(probleme)
+        resultat = cache.obtenir(cle)
+        if resultat is not None:
+            return resultat
+    if backend == "auto":
+        backend = choisir_backend(probleme, annulable=jeton is not None)
+    if backend not in BACKENDS:
+        return f"Erreur : Backend inconnu '{backend}'.", 0, {}
+    resultat = BACKENDS[backend](probleme, limite_temps, ecart_relatif, nb_threads, jeton)
+    if cache is not None:
+        cache.ajouter(cle, resultat)
+    return resultat
+
+
+def resoudre_prog_lineaire_matriciel(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None,
+                                     bornes=(0, None), direction: str = "Minimiser",
+                                     noms_variables: list[str] | None = None,
+                                     backend: str = "auto",
+                                     cache: CacheResultatsLP | None = None,
+                                     entiers=None,
+                                     **parametres) -> tuple[str, float, dict[str, float]]:
+    """
+    Résout un problème de programmation linéaire donné sous forme matricielle.
+
+    Args:
+        c: Coefficients (n,) de la fonction objectif.
+        A_ub, b_ub: Contraintes <= (A_ub dense ou scipy.sparse).
+        A_eq, b_eq: Contraintes == (A_eq dense ou scipy.sparse).
+        bornes: Un couple (inf, sup) commun ou une liste de n couples (None = pas de borne).
+        direction: "Maximiser" ou "Minimiser".
+        noms_variables: Noms des variables (par défaut x0, x1, ...).
+        backend: "auto", "cbc" (PuLP + CBC) ou "highs" (scipy, dans le processus).
+        cache: Cache de résultats (CacheResultatsLP) optionnel.
+        entiers: Indices des variables entières.
+        parametres: limite_temps, ecart_relatif, nb_threads, jeton (voir resoudre_probleme).
+
+    Returns:
+        Un tuple (statut, valeur_objectif, valeurs_variables), comme resoudre_prog_lineaire.
+    """
+    try:
+        probleme = ProblemeLineaire(c, A_ub, b_ub, A_eq, b_eq, bornes, direction, noms_variables, entiers)
+    except Exception as e:
+        return f"Erreur dans la définition du problème: {e}", 0, {}
+    return resoudre_probleme(probleme, backend, cache, **parametres)
+
+
+def resoudre_prog_lineaire(direction: str,
+                         fonction_obj: dict[str, float],
+                         contraintes: list[dict],
+                         backend: str = "auto",
+                         cache: CacheResultatsLP | None = None,
+                         types_variables: dict[str, str] | None = None,
+                         bornes: dict[str, tuple] | None = None,
+                         **parametres) -> tuple[str, float, dict[str, float]]:
+    """
+    Résout un problème de programmation linéaire. [cite: 17, 27]
+
+    Le problème est mis sous forme matricielle puis confié à un backend :
+    CBC via PuLP, ou HiGHS directement dans le processus (choix automatique
+    par défaut, voir choisir_backend).
 
     Args:
         direction: "Maximiser" ou "Minimiser".
@@ -12,47 +571,412 @@ def resoudre_prog_lineaire(direction: str,
         contraintes: Liste de dictionnaires de contraintes.
                      Ex: [{'coeffs': {'x': 1, 'y': 1}, 'type': '<=', 'rhs': 10},
                           {'coeffs': {'x': 2, 'y': 1}, 'type': '>=', 'rhs': 5}]
+        backend: "auto", "cbc" ou "highs".
+        cache: Cache de résultats (CacheResultatsLP) optionnel : un problème
+               identique (à l'ordre des variables et contraintes près) n'est
+               résolu qu'une fois.
+        types_variables: Type de chaque variable ("continue" par défaut,
+                         "entiere" ou "binaire"). Ex: {'x': 'entiere'}
+        bornes: Bornes (inf, sup) de certaines variables, None = pas de borne.
+                Par défaut x >= 0 (et 0 <= x <= 1 pour une binaire). Ex: {'y': (-5, None)}
+        parametres: limite_temps, ecart_relatif, nb_threads, jeton (voir resoudre_probleme).
 
     Returns:
         Un tuple (statut, valeur_objectif, valeurs_variables).
     """
-    
-    # 1. Définir la direction du problème
-    if direction == "Maximiser":
-        prob = pulp.LpProblem("Mon_Probleme_PL", pulp.LpMaximize)
-    else:
-        prob = pulp.LpProblem("Mon_Probleme_PL", pulp.LpMinimize)
-
-    # 2. Définir les variables (nous les "devinons" à partir des entrées)
-    noms_variables = set(fonction_obj.keys())
-    for c in contraintes:
-        noms_variables.update(c['coeffs'].keys())
-    
-    variables = pulp.LpVariable.dicts("Var", noms_variables, lowBound=0) # On suppose les variables >= 0
-
-    # 3. Ajouter la fonction objectif
-    prob += pulp.lpSum([fonction_obj.get(v, 0) * variables[v] for v in noms_variables]), "Fonction_Objectif"
-
-    # 4. Ajouter les contraintes
-    for i, c in enumerate(contraintes):
-        expression = pulp.lpSum([c['coeffs'].get(v, 0) * variables[v] for v in noms_variables])
-        
-        if c['type'] == '<=':
-            prob += expression <= c['rhs'], f"Contrainte_{i}"
-        elif c['type'] == '>=':
-            prob += expression >= c['rhs'], f"Contrainte_{i}"
-        elif c['type'] == '==':
-            prob += expression == c['rhs'], f"Contrainte_{i}"
-
-    # 5. Résoudre le problème
+    # 1-4. Direction, variables (types et bornes), objectif et contraintes sous forme matricielle
+    try:
+        probleme = ProblemeLineaire.depuis_dictionnaires(direction, fonction_obj, contraintes,
+                                                         types_variables, bornes)
+    except Exception as e:
+        return f"Erreur dans la définition du problème: {e}", 0, {}
+
+    # 5. Résoudre le problème, 6. Formater et retourner les résultats
+    return resoudre_probleme(probleme, backend, cache, **parametres)
+
+
+class ModeleLP:
+    """
+    Modèle de PL persistant, pour résoudre plusieurs fois le même problème
+    en ne changeant que les seconds membres ou les coefficients de l'objectif.
+
+    Après chaque résolution, on garde la base optimale (factorisée) de la
+    forme standard [A_ub I; A_eq 0]·[x; s] = [b_ub; b_eq]. Elle donne :
+    - les valeurs duales, coûts réduits et écarts,
+    - les plages de sensibilité des seconds membres et de l'objectif.
+    Lors d'une modification, si la base reste réalisable (second membre) ou
+    optimale (objectif), la nouvelle solution est obtenue directement à partir
+    de la base, sans relancer le solveur. Sinon, le problème est résolu à
+    nouveau par HiGHS (scipy n'expose pas de reprise à chaud sur une base :
+    le repli est donc une résolution complète).
+    """
+    # Au-delà de ce nombre de contraintes, on ne cherche pas à compléter une base dégénérée
+    TAILLE_MAX_COMPLETION = 300
+
+    def __init__(self, probleme: ProblemeLineaire):
+        if probleme.est_mip:
+            raise ValueError("ModeleLP ne traite que les problèmes continus (pas de variables entières).")
+        # Copie des vecteurs modifiés sur place par modifier_* : le problème d'origine reste intact
+        self.probleme = ProblemeLineaire.__new__(ProblemeLineaire)
+        self.probleme.__dict__.update(probleme.__dict__)
+        for cle in ("c", "b_ub", "b_eq"):
+            setattr(self.probleme, cle, getattr(probleme, cle).copy())
+        self.m_ub, self.m_eq = probleme.A_ub.shape[0], probleme.A_eq.shape[0]
+        n = probleme.nb_variables
+        # Forme standard : une variable d'écart s >= 0 par contrainte <=
+        blocs = [[probleme.A_ub, sp.identity(self.m_ub, format='csr')],
+                 [probleme.A_eq, sp.csr_matrix((self.m_eq, self.m_ub))]]
+        self._A = sp.bmat(blocs, format='csc')
+        self._inf = np.concatenate((probleme.borne_inf, np.zeros(self.m_ub)))
+        self._sup = np.concatenate((probleme.borne_sup, np.full(self.m_ub, np.inf)))
+        self._n = n
+        self._base = None # (indices de base, LU de la base)
+        self._z = None # Solution complète [x; s]
+        self._resultats = None
+
+    # --- Modifications ---------------------------------------------------
+
+    def modifier_second_membre(self, b_ub: dict | np.ndarray | None = None,
+                               b_eq: dict | np.ndarray | None = None):
+        """Change des seconds membres (vecteur complet ou dictionnaire {ligne: valeur})."""
+        for nouveau, actuel in ((b_ub, self.probleme.b_ub), (b_eq, self.probleme.b_eq)):
+            if isinstance(nouveau, dict):
+                for i, valeur in nouveau.items():
+                    actuel[i] = valeur
+            elif nouveau is not None:
+                actuel[:] = nouveau
+
+    def modifier_objectif(self, c: dict | np.ndarray):
+        """Change des coefficients de l'objectif (vecteur complet ou dictionnaire {variable: valeur})."""
+        if isinstance(c, dict):
+            for j, valeur in c.items():
+                self.probleme.c[j] = valeur
+        else:
+            self.probleme.c[:] = c
+
+    # --- Résolution -------------------------------------------------------
+
+    @property
+    def _signe(self) -> float:
+        return -1.0 if self.probleme.direction == "Maximiser" else 1.0 # forme interne : minimisation
+
+    def _b(self) -> np.ndarray:
+        return np.concatenate((self.probleme.b_ub, self.probleme.b_eq))
+
+    def _cout(self) -> np.ndarray:
+        return np.concatenate((self._signe * self.probleme.c, np.zeros(self.m_ub)))
+
+    def resoudre(self) -> dict:
+        """
+        Résout le modèle (en réutilisant la base précédente si elle convient).
+
+        Returns:
+            Un dictionnaire {"statut", "valeur_obj", "valeurs_vars", "x",
+            "duals_ub", "duals_eq", "couts_reduits", "ecarts",
+            "plages_b_ub", "plages_b_eq", "plages_objectif",
+            "resolution" ("base" si aucun appel au solveur, "solveur" sinon)}.
+            Les plages sont des tableaux (k x 2) [min, max], ou None si la
+            base est dégénérée. Les duals et coûts réduits sont exprimés dans
+            le sens du problème (dérivée de l'objectif optimal).
+        """
+        if self._base is not None and self._base_toujours_optimale():
+            return self._formater("base")
+
+        p = self.probleme
+        try:
+            res = linprog(self._signe * p.c,
+                          A_ub=p.A_ub if self.m_ub else None, b_ub=p.b_ub if self.m_ub else None,
+                          A_eq=p.A_eq if self.m_eq else None, b_eq=p.b_eq if self.m_eq else None,
+                          bounds=np.column_stack((p.borne_inf, p.borne_sup)), method='highs')
+            statut = _STATUTS_HIGHS.get(res.status, "Undefined")
+        except Exception as e:
+            statut = f"Erreur lors de la résolution: {e}"
+        if statut != "Optimal":
+            self._base = None
+            self._resultats = {"statut": statut, "valeur_obj": None, "resolution": "solveur"}
+            return self._resultats
+        self._z = np.concatenate((res.x, res.slack if self.m_ub else np.zeros(0)))
+        self._base = self._identifier_base()
+        return self._formater("solveur")
+
+    def _identifier_base(self):
+        """Indices des colonnes de base de la solution courante, et leur LU (None si introuvable)."""
+        m = self.m_ub + self.m_eq
+        if m == 0:
+            return None
+        tol = 1e-9 * (1 + np.abs(self._z))
+        libres = (self._z > self._inf + tol) & (self._z < self._sup - tol)
+        base = list(np.flatnonzero(libres))
+
+        if len(base) < m and m <= self.TAILLE_MAX_COMPLETION:
+            # Solution dégénérée : on complète avec des colonnes hors base (écarts d'abord)
+            dense = self._A.toarray()
+            candidats = [k for k in list(range(self._n, self._n + self.m_ub)) + list(range(self._n))
+                         if not libres[k]]
+            rang = np.linalg.matrix_rank(dense[:, base]) if base else 0
+            for k in candidats:
+                if len(base) == m:
+                    break
+                if np.linalg.matrix_rank(dense[:, base + [k]]) > rang:
+                    base.append(k)
+                    rang += 1
+        if len(base) != m:
+            return None
+        try:
+            return np.array(base), spla.splu(sp.csc_matrix(self._A[:, base]))
+        except RuntimeError:
+            return None # Base singulière
+
+    def _hors_base(self, base) -> tuple[np.ndarray, np.ndarray]:
+        hors_base = np.setdiff1d(np.arange(self._A.shape[1]), base)
+        # Valeur des variables hors base : la borne où elles se trouvent
+        valeurs = np.where(np.isclose(self._z[hors_base], self._sup[hors_base]),
+                           self._sup[hors_base], self._inf[hors_base])
+        valeurs[~np.isfinite(valeurs)] = 0.0
+        return hors_base, valeurs
+
+    def _base_toujours_optimale(self) -> bool:
+        """Recalcule la solution sur l'ancienne base ; True si elle est encore réalisable et optimale."""
+        base, lu = self._base
+        hors_base, valeurs_hors_base = self._hors_base(base)
+        z_base = lu.solve(self._b() - self._A[:, hors_base] @ valeurs_hors_base)
+        tol = 1e-9 * (1 + np.abs(z_base))
+        if np.any(z_base < self._inf[base] - tol) or np.any(z_base > self._sup[base] + tol):
+            return False
+        couts_reduits = self._couts_reduits(base, lu)
+        if not self._duale_realisable(couts_reduits, hors_base, valeurs_hors_base):
+            return False
+        self._z[base] = z_base
+        self._z[hors_base] = valeurs_hors_base
+        return True
+
+    def _couts_reduits(self, base, lu) -> np.ndarray:
+        cout = self._cout()
+        y = lu.solve(cout[base], trans='T')
+        return cout - self._A.T @ y
+
+    def _duale_realisable(self, couts_reduits, hors_base, valeurs_hors_base) -> bool:
+        r = couts_reduits[hors_base]
+        a_la_borne_inf = valeurs_hors_base == self._inf[hors_base]
+        # Minimisation : r >= 0 à la borne inférieure, r <= 0 à la borne supérieure
+        return bool(np.all(np.where(a_la_borne_inf, r >= -1e-9, r <= 1e-9)))
+
+    # --- Résultats et sensibilité ------------------------------------------
+
+    def _formater(self, resolution: str) -> dict:
+        p = self.probleme
+        x = self._z[:self._n].copy()
+        resultats = {
+            "statut": "Optimal",
+            "valeur_obj": float(p.c @ x),
+            "valeurs_vars": dict(sorted(zip(map(_nom_pulp, p.noms_variables), x.tolist()))),
+            "x": x,
+            "ecarts": p.b_ub - p.A_ub @ x,
+            "duals_ub": None, "duals_eq": None, "couts_reduits": None,
+            "plages_b_ub": None, "plages_b_eq": None, "plages_objectif": None,
+            "resolution": resolution,
+        }
+        if self._base is not None:
+            base, lu = self._base
+            hors_base, valeurs_hors_base = self._hors_base(base)
+            couts_reduits = self._couts_reduits(base, lu)
+            if self._duale_realisable(couts_reduits, hors_base, valeurs_hors_base):
+                y = lu.solve(self._cout()[base], trans='T')
+                resultats.update({
+                    "duals_ub": self._signe * y[:self.m_ub],
+                    "duals_eq": self._signe * y[self.m_ub:],
+                    "couts_reduits": self._signe * couts_reduits[:self._n],
+                })
+                plages_b = self._plages_second_membre(base, lu)
+                resultats["plages_b_ub"], resultats["plages_b_eq"] = plages_b[:self.m_ub], plages_b[self.m_ub:]
+                resultats["plages_objectif"] = self._plages_objectif(base, lu, hors_base,
+                                                                     valeurs_hors_base, couts_reduits)
+        self._resultats = resultats
+        return resultats
+
+    def _plages_second_membre(self, base, lu) -> np.ndarray:
+        """Pour chaque ligne i : intervalle de b_i où la base reste réalisable (donc optimale)."""
+        b = self._b()
+        z_base = self._z[base]
+        plages = np.empty((len(b), 2))
+        for i in range(len(b)):
+            e = np.zeros(len(b))
+            e[i] = 1.0
+            d = lu.solve(e) # Variation de z_base quand b_i augmente de 1
+            with np.errstate(divide='ignore', invalid='ignore'):
+                vers_sup = np.where(d > 0, (self._sup[base] - z_base) / d, (self._inf[base] - z_base) / d)
+                vers_inf = np.where(d > 0, (self._inf[base] - z_base) / d, (self._sup[base] - z_base) / d)
+            actifs = np.abs(d) > 1e-12
+            plages[i] = (b[i] + (vers_inf[actifs].max() if actifs.any() else -np.inf),
+                         b[i] + (vers_sup[actifs].min() if actifs.any() else np.inf))
+        return plages
+
+    def _plages_objectif(self, base, lu, hors_base, valeurs_hors_base, couts_reduits) -> np.ndarray:
+        """Pour chaque variable j : intervalle de c_j où la solution actuelle reste optimale."""
+        plages = np.empty((self._n, 2))
+        a_la_borne_inf = valeurs_hors_base == self._inf[hors_base]
+        position = {k: i for i, k in enumerate(base)}
+        r = couts_reduits[hors_base]
+        for j in range(self._n):
+            if j in position:
+                # Variable de base : c_j + Δ modifie les coûts réduits hors base de -Δ·α
+                e = np.zeros(len(base))
+                e[position[j]] = 1.0
+                alpha = self._A[:, hors_base].T @ lu.solve(e, trans='T')
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    # On veut r - Δ·α >= 0 (borne inf) ou <= 0 (borne sup)
+                    limite = r / alpha
+                    sup_si = np.where(a_la_borne_inf, alpha > 1e-12, alpha < -1e-12)
+                    inf_si = np.where(a_la_borne_inf, alpha < -1e-12, alpha > 1e-12)
+                delta_max = limite[sup_si].min() if sup_si.any() else np.inf
+                delta_min = limite[inf_si].max() if inf_si.any() else -np.inf
+            else:
+                # Variable hors base : seul son propre coût réduit compte
+                k = np.flatnonzero(hors_base == j)[0]
+                delta_min, delta_max = (-r[k], np.inf) if a_la_borne_inf[k] else (-np.inf, -r[k])
+            # Retour au sens du problème (maximiser : coûts changés de signe)
+            c_interne = self._signe * self.probleme.c[j]
+            bornes = sorted((self._signe * (c_interne + delta_min), self._signe * (c_interne + delta_max)))
+            plages[j] = bornes
+        return plages
+
+
+# --- Résolution de scénarios en parallèle -----------------------------------
+
+# Variables d'environnement limitant à un thread par processus les bibliothèques
+# chargées après le démarrage du processus (celles déjà chargées sont limitées par threadpoolctl)
+_VARIABLES_THREADS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+# Problème de base de chaque processus du pool (construit une seule fois par processus)
+_PROBLEME_TRAVAILLEUR = None
+
+
+def _initialiser_travailleur(probleme: ProblemeLineaire):
+    # Exécuté une fois par processus : le problème de base n'est envoyé qu'une fois
+    global _PROBLEME_TRAVAILLEUR
+    _PROBLEME_TRAVAILLEUR = probleme
+    for variable in _VARIABLES_THREADS:
+        os.environ[variable] = "1"
+    # NumPy/SciPy sont déjà chargés (hérités du processus parent) et ne relisent pas l'environnement
+    threadpool_limits(1)
+
+
+def _appliquer_scenario(probleme: ProblemeLineaire, scenario: dict) -> ProblemeLineaire:
+    """
+    Copie du problème de base avec les modifications d'un scénario.
+
+    Clés reconnues (toutes optionnelles) :
+    "c", "b_ub", "b_eq", "borne_inf", "borne_sup" : {indice: valeur},
+    "A_ub", "A_eq" : {(ligne, colonne): valeur}.
+    """
+    inconnues = set(scenario) - {"c", "b_ub", "b_eq", "borne_inf", "borne_sup", "A_ub", "A_eq"}
+    if inconnues:
+        raise ValueError(f"Clé(s) de scénario inconnue(s) : {sorted(inconnues)}")
+
+    nouveau = ProblemeLineaire.__new__(ProblemeLineaire)
+    nouveau.__dict__.update(probleme.__dict__)
+    for cle in ("c", "b_ub", "b_eq", "borne_inf", "borne_sup"):
+        if scenario.get(cle):
+            vecteur = getattr(probleme, cle).copy()
+            for i, valeur in scenario[cle].items():
+                vecteur[i] = valeur
+            setattr(nouveau, cle, vecteur)
+    for cle in ("A_ub", "A_eq"):
+        if scenario.get(cle):
+            A = getattr(probleme, cle)
+            lignes, colonnes = map(np.array, zip(*scenario[cle]))
+            # On ajoute (nouvelle valeur - ancienne) : la structure creuse de base n'est pas recopiée
+            ecarts = np.fromiter(scenario[cle].values(), dtype=float) - np.asarray(A[lignes, colonnes]).ravel()
+            setattr(nouveau, cle, (A + sp.csr_matrix((ecarts, (lignes, colonnes)), shape=A.shape)).tocsr())
+    return nouveau
+
+
+def _resoudre_scenario(scenario: dict,
+                       limite_temps: float | None,
+                       probleme: ProblemeLineaire | None = None) -> tuple[str, float, dict[str, float]]:
+    """Résout un scénario ; une erreur n'affecte que ce scénario."""
+    if probleme is None:
+        probleme = _PROBLEME_TRAVAILLEUR
     try:
-        prob.solve(pulp.PULP_CBC_CMD(msg=0)) # msg=0 pour cacher les logs de Cbc
+        return _resoudre_highs(_appliquer_scenario(probleme, scenario), limite_temps)
     except Exception as e:
         return f"Erreur lors de la résolution: {e}", 0, {}
 
-    # 6. Formater et retourner les résultats
-    statut = pulp.LpStatus[prob.status]
-    valeur_obj = pulp.value(prob.objective)
-    valeurs_vars = {v.name: v.varValue for v in prob.variables()}
-    
-    return statut, valeur_obj, valeurs_vars
\ No newline at end of file
+
+def _resoudre_scenario_isole(probleme: ProblemeLineaire,
+                             scenario: dict,
+                             limite_temps: float | None) -> tuple[str, float, dict[str, float]]:
+    """Résout un scénario seul dans un processus neuf : s'il le fait planter, lui seul est en erreur."""
+    with ProcessPoolExecutor(max_workers=1, initializer=_initialiser_travailleur,
+                             initargs=(probleme,)) as pool:
+        try:
+            return pool.submit(_resoudre_scenario, scenario, limite_temps).result()
+        except Exception as e:
+            return f"Erreur lors de la résolution: {e}", 0, {}
+
+
+def resoudre_scenarios(probleme: ProblemeLineaire,
+                       scenarios: list[dict],
+                       nb_processus: int | None = None,
+                       limite_temps: float | None = None,
+                       dans_l_ordre: bool = False) -> Iterator[tuple[int, tuple[str, float, dict[str, float]]]]:
+    """
+    Résout de nombreuses variantes d'un même problème sur un pool de processus.
+
+    Le problème de base est envoyé une fois à chaque processus ; seules les
+    modifications de chaque scénario (voir _appliquer_scenario) circulent
+    ensuite. Chaque processus est limité à un thread de calcul, pour ne pas
+    surcharger les cœurs. Les résultats sont rendus au fur et à mesure qu'ils
+    sont prêts (pas forcément dans l'ordre des scénarios), ou dans l'ordre
+    des scénarios avec `dans_l_ordre=True` (chacun dès que lui et tous les
+    précédents sont prêts).
+
+    Args:
+        probleme: Le problème de base.
+        scenarios: Liste de modifications, ex. {"b_ub": {0: 12}, "c": {1: 2.5}}.
+        nb_processus: Nombre de processus (None : autant que de cœurs, 1 : pas de pool).
+        limite_temps: Durée maximale (en secondes) de chaque résolution. Un
+                      scénario qui la dépasse a le statut "Not Solved".
+        dans_l_ordre: Rendre les résultats dans l'ordre de `scenarios`.
+
+    Yields:
+        Des tuples (indice du scénario, (statut, valeur_objectif, valeurs_variables)).
+        Un scénario en échec a un statut "Erreur lors de la résolution: ..."
+        sans interrompre les autres, y compris s'il fait planter son processus.
+        Fermer le générateur avant la fin annule les scénarios pas encore commencés.
+    """
+    nb_processus = nb_processus or os.cpu_count() or 1
+
+    if nb_processus == 1:
+        for i, scenario in enumerate(scenarios):
+            yield i, _resoudre_scenario(scenario, limite_temps, probleme)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=nb_processus,
+                               initializer=_initialiser_travailleur,
+                               initargs=(probleme,))
+    try:
+        taches = {pool.submit(_resoudre_scenario, scenario, limite_temps): i
+                  for i, scenario in enumerate(scenarios)}
+        en_attente = {} # Résultats prêts mais précédés d'un scénario non terminé (dans_l_ordre)
+        suivant = 0
+        for tache in as_completed(taches):
+            i = taches[tache]
+            try:
+                resultat = tache.result()
+            except BrokenProcessPool:
+                # Un processus a planté : toutes les tâches non terminées échouent avec lui.
+                # Chacune est relancée seule, pour que l'erreur ne touche que le scénario fautif.
+                resultat = _resoudre_scenario_isole(probleme, scenarios[i], limite_temps)
+            except Exception as e: # Scénario non transmissible...
+                resultat = (f"Erreur lors de la résolution: {e}", 0, {})
+            if not dans_l_ordre:
+                yield i, resultat
+                continue
+            en_attente[i] = resultat
+            while suivant in en_attente:
+                yield suivant, en_attente.pop(suivant)
+                suivant += 1
+    finally:
+        # Générateur fermé avant la fin : on n'attend pas les scénarios restants
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -1,35 +1,295 @@
+import hashlib
+import os
+from collections.abc import Iterator
+
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression # [cite: 28]
 
-def charger_donnees_csv(chemin_fichier: str) -> tuple[pd.DataFrame | None, str | None]:
+from core.core_cache import CacheColonnesDisque
+
+try:
+    import pyarrow # Moteur de lecture CSV multi-thread (optionnel)
+    MOTEUR_CSV = "pyarrow"
+except ImportError:
+    pyarrow = None
+    MOTEUR_CSV = "c"
+
+# Nombre de lignes lues pour deviner le type des colonnes
+NB_LIGNES_APERCU = 100
+
+# Cache binaire des colonnes numériques déjà lues (fichiers .npy relus en mémoire mappée).
+# Les petits fichiers ne sont pas mis en cache : les relire coûte moins cher.
+TAILLE_MIN_CACHE_CSV = 1 * 2**20
+CACHE_CSV = CacheColonnesDisque(os.path.join(os.path.expanduser("~"), ".cache", "projet_math_app", "csv"),
+                                octets_max=2 * 2**30)
+# Octets lus au début, au milieu et à la fin du fichier pour l'empreinte du contenu
+OCTETS_EMPREINTE_CSV = 64 * 2**10
+
+
+def lire_entete_csv(chemin_fichier: str) -> tuple[dict[str, str] | None, str | None]:
+    """
+    Lit uniquement l'en-tête (et quelques lignes) d'un fichier CSV, pour
+    connaître ses colonnes sans charger le fichier.
+
+    Returns:
+        Un tuple (colonnes, erreur).
+        - Si succès, ({nom_colonne: "numerique" ou "texte"}, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        apercu = pd.read_csv(chemin_fichier, nrows=NB_LIGNES_APERCU)
+        if len(apercu.columns) == 0:
+            return None, "Erreur : Le fichier CSV est vide."
+        return {colonne: "numerique" if pd.api.types.is_numeric_dtype(apercu[colonne]) else "texte"
+                for colonne in apercu.columns}, None
+    except FileNotFoundError:
+        return None, "Erreur : Fichier non trouvé. Vérifiez le chemin."
+    except pd.errors.EmptyDataError:
+        return None, "Erreur : Le fichier CSV est vide."
+    except pd.errors.ParserError:
+        return None, "Erreur : Impossible de lire le fichier. Est-ce un CSV valide ?"
+    except Exception as e:
+        return None, f"Une erreur inattendue est survenue : {e}"
+
+
+def _cle_cache_csv(chemin_fichier: str) -> str:
+    """
+    Clé de cache d'un fichier CSV : chemin absolu, taille, date de
+    modification et empreinte d'un échantillon du contenu (début, milieu, fin).
+    """
+    infos = os.stat(chemin_fichier)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{os.path.realpath(chemin_fichier)}|{infos.st_size}|{infos.st_mtime_ns}".encode())
+    with open(chemin_fichier, "rb") as f:
+        for position in (0, infos.st_size // 2, max(infos.st_size - OCTETS_EMPREINTE_CSV, 0)):
+            f.seek(position)
+            h.update(f.read(OCTETS_EMPREINTE_CSV))
+    return h.hexdigest()
+
+
+def charger_donnees_csv(chemin_fichier: str,
+                        colonnes: list[str] | None = None,
+                        float32: bool = False,
+                        taille_bloc: int | None = None,
+                        cache: CacheColonnesDisque | None = None) -> tuple[pd.DataFrame | None, str | None]:
     """
     Charge un fichier CSV et retourne un DataFrame pandas. 
 
+    Seules les colonnes demandées sont lues (les autres ne sont même pas
+    converties), avec le moteur pyarrow s'il est installé. Les colonnes du
+    résultat sont dans l'ordre de `colonnes` (ou du fichier si colonnes=None).
+
+    Si un `cache` est donné (par exemple CACHE_CSV), les colonnes numériques
+    d'un fichier de plus de TAILLE_MIN_CACHE_CSV octets y sont écrites en
+    fichiers .npy : tant que le fichier ne change pas, elles sont ensuite
+    relues en mémoire mappée, sans analyser le texte. Les colonnes de texte
+    demandées (ou toutes, avec colonnes=None) sont toujours relues du fichier.
+
     Args:
         chemin_fichier: Le chemin vers le fichier .csv.
+        colonnes: Les colonnes à charger (None : toutes).
+        float32: Charger les colonnes numériques en float32 (deux fois moins de mémoire).
+        taille_bloc: Si donné, retourne un itérateur de DataFrames de
+                     `taille_bloc` lignes au lieu d'un seul DataFrame (pour
+                     les fichiers plus gros que la mémoire). Le premier bloc
+                     est lu tout de suite ; une erreur dans un bloc suivant
+                     lève une ValueError de message "Erreur : ...".
+        cache: Le cache binaire des colonnes (None : pas de cache, rien n'est écrit sur le disque).
 
     Returns:
         Un tuple (dataframe, erreur).
-        - Si succès, retourne (df, None).
+        - Si succès, retourne (df, None) (ou (itérateur, None) avec taille_bloc).
         - Si échec, retourne (None, message_erreur).
     """
     try:
-        df = pd.read_csv(chemin_fichier)
+        cle = None
+        if cache is not None and os.path.getsize(chemin_fichier) >= TAILLE_MIN_CACHE_CSV:
+            cle = _cle_cache_csv(chemin_fichier)
+            entete, erreur = lire_entete_csv(chemin_fichier)
+            if erreur:
+                return None, erreur
+            noms = colonnes if colonnes is not None else list(entete)
+            # Seules les colonnes numériques sont en cache : celles de texte sont relues dans le fichier
+            numeriques = [nom for nom in noms if entete.get(nom) == "numerique"]
+            tableaux = cache.obtenir(cle, numeriques) if numeriques else None
+            # Une colonne lue en float32 ne peut pas servir une demande en pleine précision
+            if tableaux is not None and (float32 or all(t.dtype != np.float32 for t in tableaux.values())):
+                if float32:
+                    tableaux = {nom: tableau.astype(np.float32, copy=False) for nom, tableau in tableaux.items()}
+                textes = [nom for nom in noms if nom not in tableaux]
+                if textes:
+                    lus = pd.read_csv(chemin_fichier, usecols=textes, engine=MOTEUR_CSV)
+                    tableaux = {**tableaux, **{nom: lus[nom].to_numpy() for nom in textes}}
+                df = pd.DataFrame({nom: tableaux[nom] for nom in noms}, copy=False)
+                if taille_bloc is not None:
+                    return (df.iloc[debut:debut + taille_bloc] for debut in range(0, len(df), taille_bloc)), None
+                return df, None
+
+        types = None
+        if float32:
+            entete, erreur = lire_entete_csv(chemin_fichier)
+            if erreur:
+                return None, erreur
+            types = {colonne: np.float32 for colonne, genre in entete.items()
+                     if genre == "numerique" and (colonnes is None or colonne in colonnes)}
+
+        if taille_bloc is not None:
+            # Le moteur pyarrow ne sait pas lire par blocs
+            # (et un fichier lu par blocs est trop gros pour être mis en cache d'un coup)
+            blocs = pd.read_csv(chemin_fichier, usecols=colonnes, dtype=types, chunksize=taille_bloc)
+            # Premier bloc lu tout de suite : en-tête et colonnes invalides sont signalés dans le tuple
+            premier = next(blocs, None)
+            if premier is None:
+                blocs.close()
+                return None, "Erreur : Le fichier CSV est vide."
+            return _blocs_csv(premier, blocs, colonnes), None
+
+        df = pd.read_csv(chemin_fichier, usecols=colonnes, dtype=types, engine=MOTEUR_CSV)
+        if colonnes is not None:
+            df = df[colonnes]
         if df.empty:
             return None, "Erreur : Le fichier CSV est vide."
+        if cle is not None:
+            try:
+                en_cache = cache.colonnes(cle)
+                nouvelles = {colonne: df[colonne].to_numpy() for colonne in df.columns
+                             if pd.api.types.is_numeric_dtype(df[colonne])
+                             and en_cache.get(colonne) in (None, np.dtype(np.float32).str)}
+                if nouvelles:
+                    cache.ajouter(cle, nouvelles)
+            except OSError:
+                pass # Cache indisponible (disque plein, droits...) : le chargement reste valide
         return df, None
-    except FileNotFoundError:
-        return None, "Erreur : Fichier non trouvé. Vérifiez le chemin."
-    except pd.errors.ParserError:
-        return None, "Erreur : Impossible de lire le fichier. Est-ce un CSV valide ?"
     except Exception as e:
-        return None, f"Une erreur inattendue est survenue : {e}"
+        return None, _message_erreur_csv(e)
+
+
+class _ErreurLectureCSV(ValueError):
+    """Erreur de lecture d'un bloc CSV après le premier (message au format "Erreur : ...")."""
+
+
+def _message_erreur_csv(e: Exception) -> str:
+    """Message d'erreur de lecture d'un fichier CSV."""
+    if isinstance(e, FileNotFoundError):
+        return "Erreur : Fichier non trouvé. Vérifiez le chemin."
+    if isinstance(e, pd.errors.EmptyDataError):
+        return "Erreur : Le fichier CSV est vide."
+    if isinstance(e, pd.errors.ParserError):
+        return "Erreur : Impossible de lire le fichier. Est-ce un CSV valide ?"
+    if isinstance(e, ValueError):
+        # Colonne absente de l'en-tête, ou valeur non numérique en float32
+        return f"Erreur : Colonnes invalides ({e})."
+    return f"Une erreur inattendue est survenue : {e}"
+
+
+def _blocs_csv(premier: pd.DataFrame, blocs, colonnes: list[str] | None) -> Iterator[pd.DataFrame]:
+    """
+    Blocs d'un CSV lu par morceaux, dans l'ordre de `colonnes` (usecols garde
+    celui du fichier). Une erreur de lecture d'un bloc suivant ne peut plus
+    être rendue dans le tuple (df, erreur) : elle est levée en _ErreurLectureCSV
+    (une ValueError), avec le même message que charger_donnees_csv.
+    """
+    with blocs:
+        bloc = premier
+        while bloc is not None:
+            yield bloc if colonnes is None else bloc[colonnes]
+            try:
+                bloc = next(blocs, None)
+            except Exception as e:
+                raise _ErreurLectureCSV(_message_erreur_csv(e)) from e
+
+
+class AccumulateurRegression:
+    """
+    Statistiques suffisantes de la régression linéaire simple y = m·x + b.
+
+    On garde n, les moyennes de x et y et les sommes centrées
+    Σ(x - x̄)², Σ(y - ȳ)², Σ(x - x̄)(y - ȳ), mises à jour bloc par bloc
+    (formules de Welford / Chan) : c'est numériquement stable, même pour des
+    données très décalées de l'origine, et deux accumulateurs (blocs d'un
+    fichier, processus différents) se fusionnent exactement.
+    Les couples contenant une valeur manquante (NaN) sont ignorés.
+    """
+    def __init__(self):
+        self.n = 0
+        self.moyenne_x = 0.0
+        self.moyenne_y = 0.0
+        self.sxx = 0.0 # Σ(x - x̄)²
+        self.syy = 0.0 # Σ(y - ȳ)²
+        self.sxy = 0.0 # Σ(x - x̄)(y - ȳ)
+
+    def ajouter(self, x_data, y_data) -> "AccumulateurRegression":
+        """Ajoute un bloc de données (séries, tableaux ou listes de même longueur)."""
+        x = np.asarray(x_data, dtype=np.float64).ravel()
+        y = np.asarray(y_data, dtype=np.float64).ravel()
+        if len(x) != len(y):
+            raise ValueError("X et Y n'ont pas la même longueur.")
+        valides = ~(np.isnan(x) | np.isnan(y))
+        if not valides.all():
+            x, y = x[valides], y[valides]
+        if len(x) == 0:
+            return self
+
+        bloc = AccumulateurRegression()
+        bloc.n = len(x)
+        bloc.moyenne_x, bloc.moyenne_y = x.mean(), y.mean()
+        dx, dy = x - bloc.moyenne_x, y - bloc.moyenne_y
+        bloc.sxx, bloc.syy, bloc.sxy = dx @ dx, dy @ dy, dx @ dy
+        return self.fusionner(bloc)
+
+    def fusionner(self, autre: "AccumulateurRegression") -> "AccumulateurRegression":
+        """Ajoute les statistiques d'un autre accumulateur (formule de Chan)."""
+        if autre.n == 0:
+            return self
+        n = self.n + autre.n
+        delta_x = autre.moyenne_x - self.moyenne_x
+        delta_y = autre.moyenne_y - self.moyenne_y
+        poids = self.n * autre.n / n
+        self.sxx += autre.sxx + delta_x * delta_x * poids
+        self.syy += autre.syy + delta_y * delta_y * poids
+        self.sxy += autre.sxy + delta_x * delta_y * poids
+        self.moyenne_x += delta_x * autre.n / n
+        self.moyenne_y += delta_y * autre.n / n
+        self.n = n
+        return self
+
+    def resultats(self) -> dict:
+        """
+        Pente, ordonnée à l'origine, R² et erreurs standard (NaN si moins de 3 points).
+
+        Raises:
+            ValueError: S'il y a moins de deux points ou si X est constante.
+        """
+        if self.n < 2:
+            raise ValueError("Il faut au moins deux points.")
+        if self.sxx == 0:
+            raise ValueError("La variable X est constante.")
+        pente = self.sxy / self.sxx
+        ordonnee = self.moyenne_y - pente * self.moyenne_x
+        # Somme des carrés des résidus (bornée à 0 contre les erreurs d'arrondi)
+        residus = max(self.syy - pente * self.sxy, 0.0)
+        r_carre = 1.0 - residus / self.syy if self.syy > 0 else 1.0
+        if self.n > 2:
+            variance = residus / (self.n - 2)
+            erreur_pente = np.sqrt(variance / self.sxx)
+            erreur_ordonnee = np.sqrt(variance * (1.0 / self.n + self.moyenne_x ** 2 / self.sxx))
+        else:
+            erreur_pente = erreur_ordonnee = np.nan
+        return {
+            "pente": float(pente),
+            "ordonnee_origine": float(ordonnee),
+            "r_carre": float(r_carre),
+            "erreur_std_pente": float(erreur_pente),
+            "erreur_std_ordonnee": float(erreur_ordonnee),
+            "n": self.n,
+            "equation": f"y = {pente:.4f}x + {ordonnee:.4f}"
+        }
 
 
 def calculer_regression(x_data: pd.Series, y_data: pd.Series) -> tuple[dict, str | None]:
     """
-    Calcule la régression linéaire simple.
+    Calcule la régression linéaire simple, en une passe sur les données
+    (voir AccumulateurRegression).
 
     Args:
         x_data: La série (colonne) des données X.
@@ -37,27 +297,362 @@ def calculer_regression(x_data: pd.Series, y_data: pd.Series) -> tuple[dict, str
 
     Returns:
         Un tuple (résultats, erreur).
-        - Si succès, (dict_resultats, None).
+        - Si succès, (dict_resultats, None) : pente, ordonnee_origine,
+          r_carre, erreur_std_pente, erreur_std_ordonnee, n, equation.
         - Si échec, (None, message_erreur).
     """
     try:
-        # sklearn a besoin que X soit un array 2D, d'où le .reshape(-1, 1)
-        X = np.array(x_data).reshape(-1, 1)
-        Y = np.array(y_data)
-
-        # Créer et entraîner le modèle
-        model = LinearRegression()
-        model.fit(X, Y)
-
-        # Extraire les résultats
-        resultats = {
-            "pente": model.coef_[0],
-            "ordonnee_origine": model.intercept_,
-            "r_carre": model.score(X, Y),
-            "equation": f"y = {model.coef_[0]:.4f}x + {model.intercept_:.4f}"
-        }
-        
-        return resultats, None
-        
+        return AccumulateurRegression().ajouter(x_data, y_data).resultats(), None
+    except Exception as e:
+        return None, f"Erreur lors du calcul de la régression : {e}"
+
+
+def calculer_regression_csv(chemin_fichier: str,
+                            colonne_x: str,
+                            colonne_y: str,
+                            taille_bloc: int = 1_000_000) -> tuple[dict, str | None]:
+    """
+    Régression linéaire simple sur un fichier CSV lu par blocs : la mémoire
+    utilisée ne dépend que de `taille_bloc`, pas de la taille du fichier.
+
+    Returns:
+        Un tuple (résultats, erreur), comme calculer_regression.
+    """
+    blocs, erreur = charger_donnees_csv(chemin_fichier, colonnes=list({colonne_x, colonne_y}),
+                                        taille_bloc=taille_bloc)
+    if erreur:
+        return None, erreur
+    try:
+        accumulateur = AccumulateurRegression()
+        for bloc in blocs:
+            accumulateur.ajouter(bloc[colonne_x], bloc[colonne_y])
+        return accumulateur.resultats(), None
+    except _ErreurLectureCSV as e:
+        return None, str(e)
+    except Exception as e:
+        return None, f"Erreur lors du calcul de la régression : {e}"
+
+
+class AccumulateurCovariance:
+    """
+    Moyennes et matrice des co-moments centrés Σ(xi - x̄i)(xj - x̄j) de
+    plusieurs colonnes, accumulées bloc par bloc (version matricielle de
+    AccumulateurRegression, fusionnable de la même façon).
+
+    Une seule passe sur les données suffit ensuite pour toutes les
+    régressions simples entre paires de colonnes et pour les moindres carrés
+    multiples d'une colonne cible. Les lignes contenant une valeur manquante
+    (NaN) dans l'une des colonnes sont ignorées.
+    """
+    def __init__(self, colonnes: list[str]):
+        self.colonnes = list(colonnes)
+        k = len(self.colonnes)
+        self.n = 0
+        self.moyennes = np.zeros(k)
+        self.comoments = np.zeros((k, k))
+
+    def ajouter(self, bloc) -> "AccumulateurCovariance":
+        """Ajoute un bloc : DataFrame (colonnes prises par nom) ou tableau (n x k)."""
+        if isinstance(bloc, pd.DataFrame):
+            bloc = bloc[self.colonnes]
+        donnees = np.asarray(bloc, dtype=np.float64).reshape(-1, len(self.colonnes))
+        donnees = donnees[~np.isnan(donnees).any(axis=1)]
+        if len(donnees) == 0:
+            return self
+
+        partiel = AccumulateurCovariance(self.colonnes)
+        partiel.n = len(donnees)
+        partiel.moyennes = donnees.mean(axis=0)
+        centrees = donnees - partiel.moyennes
+        partiel.comoments = centrees.T @ centrees
+        return self.fusionner(partiel)
+
+    def fusionner(self, autre: "AccumulateurCovariance") -> "AccumulateurCovariance":
+        """Ajoute les statistiques d'un autre accumulateur (mêmes colonnes)."""
+        if autre.n == 0:
+            return self
+        n = self.n + autre.n
+        delta = autre.moyennes - self.moyennes
+        self.comoments += autre.comoments + np.outer(delta, delta) * (self.n * autre.n / n)
+        self.moyennes += delta * autre.n / n
+        self.n = n
+        return self
+
+    def regressions_paires(self) -> pd.DataFrame:
+        """
+        Régression simple y = m·x + b pour chaque couple ordonné de colonnes (x ≠ y).
+
+        Returns:
+            Un DataFrame (une ligne par couple) : x, y, pente, ordonnee_origine, r_carre, n.
+            Pente et R² valent NaN si x est constante.
+        """
+        variances = np.diag(self.comoments)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # pente[i, j] : régression de la colonne j (y) sur la colonne i (x)
+            pentes = self.comoments / variances[:, None]
+            pentes[variances == 0, :] = np.nan
+            r_carres = self.comoments ** 2 / np.outer(variances, variances)
+        r_carres[:, variances == 0] = 1.0 # y constante : ajustement parfait
+        r_carres[variances == 0, :] = np.nan
+        ordonnees = self.moyennes[None, :] - pentes * self.moyennes[:, None]
+
+        i, j = np.where(~np.eye(len(self.colonnes), dtype=bool))
+        noms = np.array(self.colonnes, dtype=object)
+        return pd.DataFrame({"x": noms[i], "y": noms[j], "pente": pentes[i, j],
+                             "ordonnee_origine": ordonnees[i, j],
+                             "r_carre": np.clip(r_carres[i, j], 0.0, 1.0), "n": self.n})
+
+    def moindres_carres(self, cible: str, explicatives: list[str] | None = None) -> dict:
+        """
+        Régression multiple cible = b + Σ βk·xk, à partir des co-moments.
+
+        Args:
+            cible: La colonne expliquée.
+            explicatives: Les colonnes explicatives (par défaut : toutes les autres).
+
+        Returns:
+            {"coefficients": {colonne: βk}, "ordonnee_origine", "r_carre", "n"}.
+        """
+        if self.n < 2:
+            raise ValueError("Il faut au moins deux lignes complètes.")
+        if explicatives is None:
+            explicatives = [c for c in self.colonnes if c != cible]
+        if not explicatives:
+            raise ValueError("Il faut au moins une variable explicative.")
+        iy = self.colonnes.index(cible)
+        ix = [self.colonnes.index(c) for c in explicatives]
+
+        Sxx = self.comoments[np.ix_(ix, ix)]
+        Sxy = self.comoments[ix, iy]
+        # lstsq : solution de norme minimale si des colonnes sont colinéaires
+        beta = np.linalg.lstsq(Sxx, Sxy, rcond=None)[0]
+        ordonnee = self.moyennes[iy] - beta @ self.moyennes[ix]
+        syy = self.comoments[iy, iy]
+        r_carre = float(beta @ Sxy / syy) if syy > 0 else 1.0
+        return {"coefficients": dict(zip(explicatives, beta.tolist())),
+                "ordonnee_origine": float(ordonnee),
+                "r_carre": min(max(r_carre, 0.0), 1.0),
+                "n": self.n}
+
+
+def calculer_regressions_paires(source: pd.DataFrame | str,
+                                colonnes: list[str] | None = None,
+                                cible: str | None = None,
+                                taille_bloc: int = 1_000_000,
+                                cache: CacheColonnesDisque | None = None) -> tuple[dict | None, str | None]:
+    """
+    Toutes les régressions simples entre colonnes numériques (et, si `cible`
+    est donnée, la régression multiple de la cible sur les autres colonnes),
+    en une seule passe sur les données.
+
+    Args:
+        source: Un DataFrame, ou le chemin d'un fichier CSV (lu par blocs).
+        colonnes: Les colonnes à utiliser (par défaut : toutes les colonnes numériques).
+        cible: Colonne expliquée pour la régression multiple (optionnel).
+        taille_bloc: Nombre de lignes lues à la fois dans un fichier CSV.
+        cache: Le cache binaire des colonnes (voir charger_donnees_csv).
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, ({"paires": DataFrame, "multiple": dict ou None}, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        if isinstance(source, pd.DataFrame):
+            if colonnes is None:
+                colonnes = list(source.select_dtypes("number").columns)
+            blocs = [source]
+        else:
+            if colonnes is None:
+                entete, erreur = lire_entete_csv(source)
+                if erreur:
+                    return None, erreur
+                colonnes = [c for c, genre in entete.items() if genre == "numerique"]
+            blocs, erreur = charger_donnees_csv(source, colonnes=colonnes, taille_bloc=taille_bloc, cache=cache)
+            if erreur:
+                return None, erreur
+        if len(colonnes) < 2:
+            return None, "Erreur : Il faut au moins deux colonnes numériques."
+
+        accumulateur = AccumulateurCovariance(colonnes)
+        for bloc in blocs:
+            accumulateur.ajouter(bloc)
+        if accumulateur.n < 2:
+            return None, "Erreur : Il faut au moins deux lignes complètes."
+
+        multiple = accumulateur.moindres_carres(cible) if cible is not None else None
+        return {"paires": accumulateur.regressions_paires(), "multiple": multiple}, None
+    except _ErreurLectureCSV as e:
+        return None, str(e)
+    except Exception as e:
+        return None, f"Erreur lors du calcul de la régression : {e}"
+
+
+def _regressions_depuis_sommes(n, sx, sy, sxx, sxy, syy, decalage_x, decalage_y) -> dict:
+    """
+    Pente, ordonnée à l'origine et R² (vectorisés) à partir des sommes
+    Σx, Σy, Σx², Σxy, Σy² de valeurs décalées de (decalage_x, decalage_y)
+    (un décalage par groupe ou un décalage commun).
+
+    Le décalage doit être proche de la moyenne de chaque groupe : sinon la
+    formule Σx² - (Σx)²/n perd toute sa précision. Les groupes de moins de
+    deux points ou de X constante donnent NaN.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        moyenne_x, moyenne_y = sx / n, sy / n
+        var_x = np.maximum(sxx - sx * moyenne_x, 0.0)
+        var_y = np.maximum(syy - sy * moyenne_y, 0.0)
+        cov = sxy - sx * moyenne_y
+        valides = (n >= 2) & (var_x > 0)
+        pente = np.where(valides, cov / var_x, np.nan)
+        ordonnee = moyenne_y + decalage_y - pente * (moyenne_x + decalage_x)
+        residus = np.maximum(var_y - pente * cov, 0.0)
+        r_carre = np.where(var_y > 0, 1.0 - residus / var_y, 1.0)
+        r_carre = np.where(valides, r_carre, np.nan)
+    return {"pente": pente, "ordonnee_origine": ordonnee, "r_carre": r_carre, "n": n.astype(np.int64)}
+
+
+def calculer_regression_groupes(df: pd.DataFrame,
+                                colonne_x: str,
+                                colonne_y: str,
+                                colonne_groupe: str) -> tuple[pd.DataFrame | None, str | None]:
+    """
+    Régression de Y sur X dans chaque groupe (valeurs de `colonne_groupe`),
+    en deux passes vectorisées (np.bincount) : les moyennes de chaque
+    groupe, puis les sommes Σx, Σy, Σx², Σxy, Σy² des valeurs centrées sur
+    la moyenne de leur groupe. Chaque régression coûte ensuite O(1).
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, (DataFrame, None) : une ligne par groupe avec les
+          colonnes <colonne_groupe>, pente, ordonnee_origine, r_carre, n.
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        x = df[colonne_x].to_numpy(dtype=np.float64)
+        y = df[colonne_y].to_numpy(dtype=np.float64)
+        codes, groupes = pd.factorize(df[colonne_groupe], sort=True)
+        valides = ~(np.isnan(x) | np.isnan(y)) & (codes >= 0)
+        if not valides.all():
+            x, y, codes = x[valides], y[valides], codes[valides]
+        if len(x) == 0:
+            return None, "Erreur : Aucune ligne complète."
+
+        # Centrage sur la moyenne de chaque groupe (un centrage global ne suffit
+        # pas quand les groupes sont loin les uns des autres)
+        nb_groupes = len(groupes)
+        effectifs = np.bincount(codes, minlength=nb_groupes)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            decalage_x = np.bincount(codes, weights=x, minlength=nb_groupes) / effectifs
+            decalage_y = np.bincount(codes, weights=y, minlength=nb_groupes) / effectifs
+        dx, dy = x - decalage_x[codes], y - decalage_y[codes]
+        sommes = [effectifs] + [np.bincount(codes, weights=poids, minlength=nb_groupes)
+                                for poids in (dx, dy, dx * dx, dx * dy, dy * dy)]
+        resultats = _regressions_depuis_sommes(*sommes, decalage_x, decalage_y)
+        return pd.DataFrame({colonne_groupe: groupes, **resultats}), None
+    except KeyError as e:
+        return None, f"Erreur : Colonne introuvable ({e})."
+    except Exception as e:
+        return None, f"Erreur lors du calcul de la régression : {e}"
+
+
+def _fusionner_moments(a: tuple, b: tuple) -> tuple:
+    """
+    Fusion vectorisée (formule de Chan) de deux jeux de moments
+    (n, moyenne_x, moyenne_y, Σ(x - x̄)², Σ(x - x̄)(y - ȳ), Σ(y - ȳ)²).
+    """
+    n_a, mx_a, my_a, sxx_a, sxy_a, syy_a = a
+    n_b, mx_b, my_b, sxx_b, sxy_b, syy_b = b
+    n = n_a + n_b
+    with np.errstate(divide="ignore", invalid="ignore"):
+        part_b = np.where(n > 0, n_b / n, 0.0)
+        poids = np.where(n > 0, n_a * n_b / n, 0.0)
+    # Une partie vide a une moyenne NaN : on la remplace par celle de l'autre partie
+    mx_a, my_a = np.where(n_a > 0, mx_a, mx_b), np.where(n_a > 0, my_a, my_b)
+    mx_b, my_b = np.where(n_b > 0, mx_b, mx_a), np.where(n_b > 0, my_b, my_a)
+    delta_x, delta_y = mx_b - mx_a, my_b - my_a
+    return (n, mx_a + delta_x * part_b, my_a + delta_y * part_b,
+            sxx_a + sxx_b + delta_x * delta_x * poids,
+            sxy_a + sxy_b + delta_x * delta_y * poids,
+            syy_a + syy_b + delta_y * delta_y * poids)
+
+
+def calculer_regression_glissante(x_data,
+                                  y_data,
+                                  fenetre: int,
+                                  pas: int = 1) -> tuple[pd.DataFrame | None, str | None]:
+    """
+    Régression de Y sur X sur une fenêtre glissante de `fenetre` lignes
+    (décalée de `pas` lignes à chaque fois), avec un coût O(1) par fenêtre.
+
+    Les données sont découpées en blocs de `fenetre` lignes. Dans chaque
+    bloc, les valeurs sont centrées sur la moyenne du bloc et on calcule
+    les sommes cumulées de x, y, x², xy, y² : elles restent de l'ordre de
+    grandeur des données locales. Une somme cumulée globale perdrait
+    au contraire toute précision sur des X croissants (temps, indices).
+    Une fenêtre couvre au plus deux blocs : ses moments centrés sont ceux
+    des deux morceaux, fusionnés par la formule de Chan. Les lignes avec
+    une valeur manquante (NaN) sont ignorées, `n` compte les lignes utilisées.
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, (DataFrame, None) : une ligne par fenêtre avec les
+          colonnes debut, fin (positions de la première et de la dernière
+          ligne), pente, ordonnee_origine, r_carre, n.
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        x = np.asarray(x_data, dtype=np.float64).ravel()
+        y = np.asarray(y_data, dtype=np.float64).ravel()
+        if len(x) != len(y):
+            return None, "Erreur : X et Y n'ont pas la même longueur."
+        if fenetre < 2 or pas < 1:
+            return None, "Erreur : La fenêtre doit contenir au moins 2 lignes et le pas être positif."
+        if fenetre > len(x):
+            return None, "Erreur : La fenêtre est plus longue que les données."
+
+        valides = ~(np.isnan(x) | np.isnan(y))
+        if not valides.any():
+            return None, "Erreur : Aucune ligne complète."
+
+        # 1. Blocs de `fenetre` lignes (complétés par des lignes non valides)
+        nb_blocs = -(-len(x) // fenetre)
+        taille = nb_blocs * fenetre
+        def en_blocs(valeurs):
+            return np.pad(valeurs, (0, taille - len(valeurs))).reshape(nb_blocs, fenetre)
+        poids = en_blocs(valides.astype(np.float64))
+        x_blocs = en_blocs(np.where(valides, x, 0.0))
+        y_blocs = en_blocs(np.where(valides, y, 0.0))
+
+        # 2. Sommes cumulées des valeurs centrées sur la moyenne de leur bloc
+        effectifs = poids.sum(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            centre_x = np.where(effectifs > 0, x_blocs.sum(axis=1, keepdims=True) / effectifs, 0.0)
+            centre_y = np.where(effectifs > 0, y_blocs.sum(axis=1, keepdims=True) / effectifs, 0.0)
+        dx, dy = (x_blocs - centre_x) * poids, (y_blocs - centre_y) * poids
+        cumuls = [np.pad(np.cumsum(valeurs, axis=1), ((0, 0), (1, 0)))
+                  for valeurs in (poids, dx, dy, dx * dx, dx * dy, dy * dy)]
+
+        # 3. Chaque fenêtre = fin du bloc k (depuis la position j) + début du bloc k + 1 (j lignes)
+        debuts = np.arange(0, len(x) - fenetre + 1, pas)
+        k, j = debuts // fenetre, debuts % fenetre
+        suivant = np.minimum(k + 1, nb_blocs - 1)
+
+        def moments(sommes, bloc):
+            # Moments centrés d'un morceau (moyennes NaN et sommes nulles s'il est vide)
+            n, sx, sy, sxx, sxy, syy = sommes
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mx, my = np.where(n > 0, sx / n, 0.0), np.where(n > 0, sy / n, 0.0)
+            return (n, np.where(n > 0, mx + centre_x[bloc, 0], np.nan), np.where(n > 0, my + centre_y[bloc, 0], np.nan),
+                    sxx - sx * mx, sxy - sx * my, syy - sy * my)
+
+        fin_bloc = moments([c[k, fenetre] - c[k, j] for c in cumuls], k)
+        debut_suivant = moments([np.where(j > 0, c[suivant, j], 0.0) for c in cumuls], suivant)
+        n, mx, my, sxx, sxy, syy = _fusionner_moments(fin_bloc, debut_suivant)
+
+        zeros = np.zeros_like(n)
+        resultats = _regressions_depuis_sommes(n, zeros, zeros, np.maximum(sxx, 0.0), sxy,
+                                               np.maximum(syy, 0.0), mx, my)
+        return pd.DataFrame({"debut": debuts, "fin": debuts + fenetre - 1, **resultats}), None
     except Exception as e:
-        return None, f"Erreur lors du calcul de la régression : {e}"
\ No newline at end of file
+        return None, f"Erreur lors du calcul de la régression : {e}"
@@ -1,9 +1,111 @@
+import os
+import tempfile
+import warnings
+
 import numpy as np
+import scipy.linalg as sla
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from core.core_cache import CacheLRU, empreinte_tableaux
+
+try:
+    import resource # Mesure du pic de mémoire (Unix uniquement)
+except ImportError:
+    resource = None
+
+
+def _reels(tableau) -> np.ndarray:
+    """
+    Convertit en tableau float64, en refusant les valeurs complexes (la
+    conversion perdrait la partie imaginaire sans erreur, avec un simple
+    avertissement de NumPy).
+
+    Raises:
+        TypeError: Si le tableau est complexe.
+    """
+    if np.iscomplexobj(tableau):
+        raise TypeError("Les coefficients complexes ne sont pas pris en charge.")
+    return np.asarray(tableau, dtype=np.float64)
+
+
+class Factorisation:
+    """
+    Factorisation réutilisable d'une matrice carrée A.
+
+    La factorisation (O(n³)) est faite une seule fois ; chaque résolution
+    ultérieure de AX = b ne coûte plus que O(n²).
+    - Cholesky si A est symétrique définie positive,
+    - LU avec pivot partiel sinon.
+
+    Lève np.linalg.LinAlgError si A est singulière, TypeError si elle est complexe.
+    """
+    def __init__(self, A: np.ndarray):
+        A = _reels(A)
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("La matrice A doit être carrée.")
+        self.n = A.shape[0]
+        self.methode = None
+
+        # Symétrie exacte seulement : une matrice presque symétrique résolue
+        # par Cholesky le serait comme une autre matrice (résultat faux)
+        if np.array_equal(A, A.T):
+            try:
+                self._facteurs = sla.cho_factor(A, check_finite=False)
+                self.methode = "cholesky"
+            except np.linalg.LinAlgError:
+                pass # Symétrique mais pas définie positive : on passe à LU
+
+        if self.methode is None:
+            with warnings.catch_warnings():
+                # La singularité est signalée par l'exception ci-dessous
+                warnings.simplefilter("ignore", sla.LinAlgWarning)
+                self._facteurs = sla.lu_factor(A, check_finite=False)
+            if np.any(np.diag(self._facteurs[0]) == 0):
+                raise np.linalg.LinAlgError("Singular matrix")
+            self.methode = "lu"
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(f, 'nbytes', 0) for f in self._facteurs)
+
+    def resoudre(self, b: np.ndarray) -> np.ndarray:
+        """Résout AX = b (b peut avoir plusieurs colonnes) avec les facteurs existants."""
+        b = _reels(b)
+        if self.methode == "cholesky":
+            return sla.cho_solve(self._facteurs, b, check_finite=False)
+        return sla.lu_solve(self._facteurs, b, check_finite=False)
+
+
+# Factorisations déjà calculées, indexées par l'empreinte du contenu de A
+_CACHE_FACTORISATIONS = CacheLRU(taille_max=32, octets_max=256 * 2**20,
+                                 taille_element=lambda factorisation: factorisation.nbytes)
+
+
+def obtenir_factorisation(A: np.ndarray) -> Factorisation:
+    """
+    Retourne la factorisation de A, calculée au besoin puis gardée en cache.
+
+    Le cache est indexé par une empreinte du contenu de A (éviction LRU,
+    mémoire bornée) : résoudre la même matrice contre une suite de
+    vecteurs b ne la factorise qu'une fois.
+    """
+    A = _reels(A)
+    cle = empreinte_tableaux(A)
+    factorisation = _CACHE_FACTORISATIONS.obtenir(cle)
+    if factorisation is None:
+        factorisation = Factorisation(A)
+        _CACHE_FACTORISATIONS.ajouter(cle, factorisation)
+    return factorisation
+
 
 def resoudre_systeme(A: np.ndarray, b: np.ndarray) -> tuple[np.ndarray | None, str | None]:
     """
     Résout un système d'équations linéaires AX = b.
 
+    La factorisation de A est mise en cache : les appels suivants avec la
+    même matrice (et un autre b) évitent de la refactoriser.
+
     Args:
         A: La matrice (N x N) des coefficients.
         b: Le vecteur (N x 1) des résultats.
@@ -14,12 +116,485 @@ def resoudre_systeme(A: np.ndarray, b: np.ndarray) -> tuple[np.ndarray | None, s
         - En cas d'erreur (matrice singulière), retourne (None, message_erreur).
     """
     try:
-        # Tente de résoudre le système en utilisant la fonction de NumPy [cite: 26]
-        solution = np.linalg.solve(A, b)
+        # Factorisation (réutilisée si A a déjà été vue), puis résolution en O(n²)
+        solution = obtenir_factorisation(A).resoudre(b)
         return solution, None
     except np.linalg.LinAlgError:
         # Gère le cas où la matrice A est singulière (pas de solution unique)
         return None, "Erreur : La matrice est singulière, le système n'admet pas de solution unique."
+    except TypeError as e:
+        return None, f"Erreur : {e}"
     except Exception as e:
         # Gère toute autre erreur potentielle
-        return None, f"Une erreur inattendue est survenue : {e}"
\ No newline at end of file
+        return None, f"Une erreur inattendue est survenue : {e}"
+
+
+def resoudre_systemes_par_lots(A: np.ndarray, b: np.ndarray) -> tuple[dict | None, str | None]:
+    """
+    Résout une pile de systèmes A[i] X[i] = b[i] en un seul appel vectorisé.
+
+    Une matrice singulière dans la pile ne fait pas échouer tout le lot :
+    son erreur est signalée individuellement et sa solution vaut NaN.
+
+    Args:
+        A: La pile (k x N x N) des matrices.
+        b: Les seconds membres, (k x N) ou (k x N x m) pour plusieurs colonnes.
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, ({"solutions": même forme que b,
+                       "erreurs": liste de k messages (None si le système est résolu)}, None).
+        - Si les entrées sont invalides, (None, message_erreur).
+    """
+    try:
+        A = _reels(A)
+        b = _reels(b)
+        if A.ndim != 3 or A.shape[1] != A.shape[2]:
+            return None, "Erreur : A doit être une pile de matrices carrées (k x N x N)."
+        if b.ndim not in (2, 3) or b.shape[:2] != A.shape[:2]:
+            return None, "Erreur : b doit être de forme (k x N) ou (k x N x m)."
+
+        # Les vecteurs sont traités comme des matrices à une colonne
+        seconds_membres = b[..., np.newaxis] if b.ndim == 2 else b
+        try:
+            solutions = np.linalg.solve(A, seconds_membres)
+            resolus = np.ones(len(A), dtype=bool)
+        except np.linalg.LinAlgError:
+            # Au moins une matrice singulière : on l'isole (déterminant nul) et
+            # on résout les autres ensemble
+            signes, _ = np.linalg.slogdet(A)
+            resolus = signes != 0
+            solutions = np.full(seconds_membres.shape, np.nan)
+            if resolus.any():
+                solutions[resolus] = np.linalg.solve(A[resolus], seconds_membres[resolus])
+
+        message = "Erreur : La matrice est singulière, le système n'admet pas de solution unique."
+        resultats = {
+            "solutions": solutions[..., 0] if b.ndim == 2 else solutions,
+            "erreurs": [None if ok else message for ok in resolus],
+        }
+        return resultats, None
+
+    except TypeError as e:
+        return None, f"Erreur : {e}"
+    except Exception as e:
+        return None, f"Une erreur inattendue est survenue : {e}"
+
+
+def resoudre_precision_mixte(A: np.ndarray,
+                             b: np.ndarray,
+                             max_raffinements: int = 10) -> tuple[dict | None, str | None]:
+    """
+    Résout AX = b par une LU en float32 suivie de raffinements itératifs en float64.
+
+    La factorisation (la partie coûteuse, O(n³)) se fait en simple précision :
+    deux fois moins de mémoire et de trafic. Chaque raffinement calcule le
+    résidu r = b - AX en double précision et corrige X avec la LU float32.
+    Si A est trop mal conditionnée pour que les raffinements convergent, ou
+    s'ils ne convergent pas, on se replie sur une résolution float64 complète.
+
+    Args:
+        A: La matrice (N x N) des coefficients (dense).
+        b: Le vecteur (N,) des résultats.
+        max_raffinements: Nombre maximal d'étapes de raffinement.
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, ({"solution", "methode" ("float32+raffinement" ou "float64"),
+                       "iterations" (raffinements), "residu" (relatif),
+                       "conditionnement" (estimation)}, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        A = _reels(A)
+        b = _reels(b)
+        if A.ndim != 2 or A.shape[0] != A.shape[1] or b.shape[0] != A.shape[0]:
+            return None, "Erreur : A doit être carrée et b de même nombre de lignes."
+        n = A.shape[0]
+        norme_A = np.linalg.norm(A, np.inf)
+        # Critère d'arrêt de LAPACK (dsgesv) : ||r|| <= sqrt(n) * eps * ||A|| * ||X||
+        seuil = np.sqrt(n) * np.finfo(np.float64).eps * norme_A
+
+        def residu_relatif(x):
+            r = b - A @ x
+            return r, np.linalg.norm(r, np.inf) / max(norme_A * np.linalg.norm(x, np.inf)
+                                                      + np.linalg.norm(b, np.inf), np.finfo(float).tiny)
+
+        # 1. LU en simple précision et estimation du conditionnement
+        A32 = A.astype(np.float32)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", sla.LinAlgWarning)
+            lu32, piv32 = sla.lu_factor(A32, check_finite=False)
+        conditionnement = np.inf
+        if np.all(np.diag(lu32) != 0):
+            rcond, _ = sla.lapack.sgecon(lu32, np.linalg.norm(A32, 1), norm='1')
+            conditionnement = 1.0 / rcond if rcond > 0 else np.inf
+
+        # 2. Raffinements, seulement si float32 peut donner au moins un chiffre exact
+        if conditionnement * np.finfo(np.float32).eps < 0.5:
+            x = sla.lu_solve((lu32, piv32), b.astype(np.float32)).astype(np.float64)
+            for iteration in range(max_raffinements + 1):
+                r, residu = residu_relatif(x)
+                if np.linalg.norm(r, np.inf) <= seuil * np.linalg.norm(x, np.inf):
+                    return {"solution": x, "methode": "float32+raffinement", "iterations": iteration,
+                            "residu": residu, "conditionnement": conditionnement}, None
+                if iteration < max_raffinements:
+                    x += sla.lu_solve((lu32, piv32), r.astype(np.float32)).astype(np.float64)
+
+        # 3. Repli : résolution complète en double précision
+        x = obtenir_factorisation(A).resoudre(b)
+        _, residu = residu_relatif(x)
+        return {"solution": x, "methode": "float64", "iterations": 0,
+                "residu": residu, "conditionnement": conditionnement}, None
+
+    except np.linalg.LinAlgError:
+        return None, "Erreur : La matrice est singulière, le système n'admet pas de solution unique."
+    except TypeError as e:
+        return None, f"Erreur : {e}"
+    except Exception as e:
+        return None, f"Une erreur inattendue est survenue : {e}"
+
+
+# Structures reconnues par resoudre_systeme_adapte
+STRUCTURES = ("auto", "dense", "spd", "triangulaire_inf", "triangulaire_sup",
+              "bande", "creuse", "cg", "gmres", "precision_mixte")
+# Au-delà de ce nombre d'inconnues, le mode "auto" préfère les méthodes itératives
+# pour les matrices creuses (la LU creuse peut se remplir et saturer la mémoire)
+SEUIL_DIRECT_CREUX = 200_000
+
+
+def _largeur_bande(A: np.ndarray | sp.csr_matrix) -> tuple[int, int]:
+    """Nombres (inférieur, supérieur) de diagonales non nulles autour de la diagonale."""
+    lignes, colonnes = A.nonzero()
+    if len(lignes) == 0:
+        return 0, 0
+    decalages = colonnes - lignes
+    return int(max(0, -decalages.min())), int(max(0, decalages.max()))
+
+
+def _est_symetrique(A: np.ndarray | sp.csr_matrix) -> bool:
+    """Symétrie exacte de A (dense ou creuse)."""
+    if sp.issparse(A):
+        return (A != A.T).nnz == 0
+    return np.array_equal(A, A.T)
+
+
+def _verifier_structure(A: np.ndarray | sp.csr_matrix, structure: str) -> str | None:
+    """
+    Vérifie qu'une structure donnée explicitement correspond bien à A : un
+    solveur triangulaire ou le gradient conjugué appliqué à une autre
+    matrice donnerait une solution fausse sans le signaler.
+
+    Returns:
+        None si la structure convient, sinon le message d'erreur.
+    """
+    if structure in ("triangulaire_inf", "triangulaire_sup"):
+        inf, sup = _largeur_bande(A)
+        if structure == "triangulaire_inf" and sup > 0:
+            return "Erreur : La matrice n'est pas triangulaire inférieure."
+        if structure == "triangulaire_sup" and inf > 0:
+            return "Erreur : La matrice n'est pas triangulaire supérieure."
+    if structure == "cg" and not _est_symetrique(A):
+        return "Erreur : Le gradient conjugué demande une matrice symétrique."
+    if structure == "spd" and not _est_symetrique(A):
+        return "Erreur : La matrice n'est pas symétrique."
+    return None
+
+
+def _detecter_structure(A: np.ndarray | sp.csr_matrix) -> str:
+    """Choisit le solveur le plus adapté à la structure de A."""
+    n = A.shape[0]
+    inf, sup = _largeur_bande(A)
+    if inf == 0:
+        return "triangulaire_sup"
+    if sup == 0:
+        return "triangulaire_inf"
+    if sp.issparse(A):
+        # Bande étroite : le stockage en bande ne coûte pas plus que quelques fois la matrice creuse
+        if (inf + sup + 1) * n <= 4 * A.nnz:
+            return "bande"
+        if n <= SEUIL_DIRECT_CREUX:
+            return "creuse"
+        # Très grands systèmes : méthode itérative (repli direct si pas de convergence)
+        return "cg" if _est_symetrique(A) and np.all(A.diagonal() > 0) else "gmres"
+    if inf + sup + 1 <= n // 4:
+        return "bande"
+    if _est_symetrique(A) and np.all(np.diag(A) > 0):
+        return "spd"
+    return "dense"
+
+
+def _resoudre_iteratif(A, b, methode: str, tolerance: float, max_iterations: int | None):
+    """Gradient conjugué (préconditionneur de Jacobi) ou GMRES (préconditionneur ILU)."""
+    A = sp.csr_matrix(A)
+    if methode == "cg":
+        inverse_diagonale = 1.0 / A.diagonal()
+        preconditionneur = spla.LinearOperator(A.shape, matvec=lambda x: inverse_diagonale * x)
+        solveur, options = spla.cg, {}
+    else:
+        ilu = spla.spilu(sp.csc_matrix(A))
+        preconditionneur = spla.LinearOperator(A.shape, matvec=ilu.solve)
+        solveur, options = spla.gmres, {"callback_type": "pr_norm"}
+
+    iterations = [0]
+    def compter(_):
+        iterations[0] += 1
+
+    solution, info = solveur(A, b, rtol=tolerance, maxiter=max_iterations,
+                             M=preconditionneur, callback=compter, **options)
+    return solution, info == 0, iterations[0]
+
+
+def resoudre_systeme_adapte(A: np.ndarray | sp.spmatrix,
+                            b: np.ndarray,
+                            structure: str = "auto",
+                            tolerance: float = 1e-10,
+                            max_iterations: int | None = None) -> tuple[dict | None, str | None]:
+    """
+    Résout AX = b avec le solveur adapté à la structure de A.
+
+    Structures possibles (détectées si structure="auto") :
+    - "triangulaire_inf" / "triangulaire_sup" : simple substitution, O(n²),
+    - "bande" : LU en bande (LAPACK gbsv), O(n·largeur²),
+    - "spd" / "dense" : Cholesky ou LU (factorisation mise en cache) ;
+      une matrice creuse "spd" passe par la LU creuse, et une matrice
+      détectée "spd" mais pas définie positive est résolue (et signalée) en "dense",
+    - "creuse" : LU creuse directe (scipy.sparse),
+    - "cg" : gradient conjugué préconditionné (A symétrique définie positive),
+    - "gmres" : GMRES préconditionné par ILU (A creuse quelconque),
+    - "precision_mixte" : LU float32 + raffinements float64 (sur demande
+      seulement, voir resoudre_precision_mixte).
+    En mode "auto", si la méthode itérative ne converge pas, on se replie
+    sur la résolution directe. Une structure donnée explicitement est
+    vérifiée (triangulaire, symétrie pour "cg" et "spd", Cholesky pour "spd").
+
+    Args:
+        A: La matrice (N x N), dense ou creuse (scipy.sparse).
+        b: Le vecteur (N,) des résultats.
+        structure: Une des valeurs de STRUCTURES.
+        tolerance: Résidu relatif visé par les méthodes itératives.
+        max_iterations: Nombre maximal d'itérations des méthodes itératives.
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, ({"solution", "methode", "residu" (relatif), "iterations"}, None).
+        - Si échec, (None, message_erreur).
+    """
+    try:
+        if structure not in STRUCTURES:
+            return None, f"Erreur : Structure inconnue '{structure}'."
+        creuse = sp.issparse(A)
+        if creuse and np.iscomplexobj(A.data):
+            raise TypeError("Les coefficients complexes ne sont pas pris en charge.")
+        A = sp.csr_matrix(A, dtype=np.float64) if creuse else _reels(A)
+        b = _reels(b)
+        if A.ndim != 2 or A.shape[0] != A.shape[1] or b.shape[0] != A.shape[0]:
+            return None, "Erreur : A doit être carrée et b de même nombre de lignes."
+
+        if structure == "auto":
+            methode = _detecter_structure(A)
+        else:
+            erreur = _verifier_structure(A, structure)
+            if erreur:
+                return None, erreur
+            methode = structure
+        if creuse and methode == "spd":
+            # Pas de Cholesky creuse dans SciPy : LU creuse plutôt que densifier A
+            methode = "creuse"
+        iterations = 0
+
+        if methode == "precision_mixte":
+            resultats, erreur = resoudre_precision_mixte(A.toarray() if creuse else A, b)
+            if erreur:
+                return None, erreur
+            resultats["methode"] = f"precision_mixte ({resultats['methode']})"
+            return resultats, None
+
+        with warnings.catch_warnings():
+            # Une matrice singulière est signalée par une exception, pas par un avertissement
+            warnings.simplefilter("error", sla.LinAlgWarning)
+            warnings.simplefilter("error", spla.MatrixRankWarning)
+
+            if methode in ("cg", "gmres"):
+                solution, converge, iterations = _resoudre_iteratif(A, b, methode, tolerance, max_iterations)
+                if not converge:
+                    if structure != "auto":
+                        return None, f"Erreur : La méthode {methode} n'a pas convergé en {iterations} itérations."
+                    methode = "creuse" if creuse else "dense"
+
+            if methode in ("triangulaire_inf", "triangulaire_sup"):
+                inferieure = methode == "triangulaire_inf"
+                if creuse:
+                    solution = spla.spsolve_triangular(A, b, lower=inferieure)
+                else:
+                    solution = sla.solve_triangular(A, b, lower=inferieure, check_finite=False)
+            elif methode == "bande":
+                inf, sup = _largeur_bande(A)
+                # Stockage LAPACK en bande : ab[sup + i - j, j] = A[i, j], rempli
+                # directement à partir des coefficients non nuls (sans densifier A creuse)
+                if creuse:
+                    coo = A.tocoo()
+                    lignes, colonnes, valeurs = coo.row, coo.col, coo.data
+                else:
+                    lignes, colonnes = np.nonzero(A)
+                    valeurs = A[lignes, colonnes]
+                ab = np.zeros((inf + sup + 1, A.shape[0]))
+                ab[sup + lignes - colonnes, colonnes] = valeurs
+                solution = sla.solve_banded((inf, sup), ab, b, check_finite=False)
+            elif methode in ("spd", "dense"):
+                factorisation = obtenir_factorisation(A.toarray() if creuse else A)
+                if methode == "spd" and factorisation.methode != "cholesky":
+                    # Symétrique mais pas définie positive : LU (refusé si "spd" est imposé)
+                    if structure == "spd":
+                        return None, "Erreur : La matrice n'est pas définie positive."
+                    methode = "dense"
+                solution = factorisation.resoudre(b)
+            elif methode == "creuse":
+                solution = spla.splu(sp.csc_matrix(A)).solve(b)
+
+        if not np.all(np.isfinite(solution)):
+            raise np.linalg.LinAlgError("Singular matrix")
+        residu = np.linalg.norm(A @ solution - b) / max(np.linalg.norm(b), np.finfo(float).tiny)
+        return {"solution": solution, "methode": methode, "residu": residu, "iterations": iterations}, None
+
+    except (np.linalg.LinAlgError, sla.LinAlgWarning, spla.MatrixRankWarning):
+        return None, "Erreur : La matrice est singulière, le système n'admet pas de solution unique."
+    except RuntimeError as e:
+        if "singular" in str(e).lower():
+            return None, "Erreur : La matrice est singulière, le système n'admet pas de solution unique."
+        return None, f"Une erreur inattendue est survenue : {e}"
+    except TypeError as e:
+        return None, f"Erreur : {e}"
+    except Exception as e:
+        return None, f"Une erreur inattendue est survenue : {e}"
+
+
+def _pic_rss_octets() -> int | None:
+    """Pic de mémoire résidente du processus (None si indisponible, ex. Windows)."""
+    if resource is None:
+        return None
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pic if os.uname().sysname == "Darwin" else pic * 1024 # Linux : en kilo-octets
+
+
+def _lire_panneau(travail: np.memmap, ordre: np.ndarray, debut: int, fin: int) -> np.ndarray:
+    """Colonnes [debut, fin) du fichier de travail (contiguës sur le disque), dans l'ordre des pivots."""
+    return np.asarray(travail[:, debut:fin])[ordre]
+
+
+def resoudre_systeme_hors_memoire(A: np.ndarray | str,
+                                  b: np.ndarray,
+                                  memoire_max: int = 256 * 2**20,
+                                  repertoire_travail: str | None = None) -> tuple[dict | None, str | None]:
+    """
+    Résout AX = b pour une matrice trop grande pour être copiée en mémoire.
+
+    A (tableau projeté en mémoire ou chemin d'un fichier .npy) est copiée dans
+    un fichier de travail (stockage par colonnes), puis factorisée en LU par
+    panneaux de colonnes (variante "left-looking" avec pivot partiel) : seuls
+    quelques panneaux (N x largeur) sont en mémoire à la fois, leur largeur
+    étant choisie pour respecter `memoire_max`. Les lignes ne sont jamais
+    échangées sur le disque : le fichier est indexé par ligne d'origine et
+    la permutation courante est appliquée à la lecture de chaque panneau.
+
+    Args:
+        A: La matrice (N x N) : np.memmap / np.ndarray, ou chemin d'un fichier .npy.
+        b: Le vecteur (N,) (ou la matrice N x m) des résultats.
+        memoire_max: Mémoire de travail visée, en octets.
+        repertoire_travail: Dossier du fichier de travail temporaire (par défaut : dossier temporaire du système).
+
+    Returns:
+        Un tuple (résultats, erreur).
+        - Si succès, ({"solution", "residu" (relatif), "largeur_panneau",
+                       "memoire_travail" (octets estimés), "pic_rss" (octets ou None)}, None).
+        - Si échec, (None, message_erreur).
+    """
+    dossier = None
+    try:
+        if isinstance(A, (str, os.PathLike)):
+            A = np.load(A, mmap_mode='r')
+        b = _reels(b)
+        if np.iscomplexobj(A):
+            raise TypeError("Les coefficients complexes ne sont pas pris en charge.")
+        if A.ndim != 2 or A.shape[0] != A.shape[1] or b.shape[0] != A.shape[0]:
+            return None, "Erreur : A doit être carrée et b de même nombre de lignes."
+        n = A.shape[0]
+
+        # 1. Largeur des panneaux : environ 6 panneaux (N x largeur) en mémoire à la fois
+        largeur = int(min(n, memoire_max // (6 * 8 * n)))
+        if largeur < 1:
+            return None, f"Erreur : Mémoire insuffisante (au moins {6 * 8 * n} octets pour N = {n})."
+        panneaux = [(debut, min(debut + largeur, n)) for debut in range(0, n, largeur)]
+
+        # 2. Copie de travail, par blocs de lignes, dans un fichier stocké par colonnes
+        dossier = tempfile.TemporaryDirectory(dir=repertoire_travail)
+        travail = np.lib.format.open_memmap(os.path.join(dossier.name, "lu.npy"), mode='w+',
+                                            dtype=np.float64, shape=(n, n), fortran_order=True)
+        lignes_par_bloc = max(1, memoire_max // (2 * 8 * n))
+        for debut in range(0, n, lignes_par_bloc):
+            travail[debut:debut + lignes_par_bloc] = A[debut:debut + lignes_par_bloc]
+
+        # 3. Factorisation LU par panneaux
+        ordre = np.arange(n) # ordre[i] = ligne d'origine en position i
+        for j0, j1 in panneaux:
+            panneau = _lire_panneau(travail, ordre, j0, j1)
+            # Mise à jour par les panneaux déjà factorisés (lus un par un depuis le disque)
+            for k0, k1 in panneaux:
+                if k0 >= j0:
+                    break
+                L = _lire_panneau(travail, ordre, k0, k1)
+                panneau[k0:k1] = sla.solve_triangular(L[k0:k1], panneau[k0:k1], lower=True,
+                                                      unit_diagonal=True, check_finite=False)
+                panneau[k1:] -= L[k1:] @ panneau[k0:k1]
+                del L
+            # LU avec pivot partiel du panneau (rectangulaire) sous la diagonale
+            lu, pivots, info = sla.lapack.dgetrf(panneau[j0:])
+            if info > 0:
+                raise np.linalg.LinAlgError("Singular matrix")
+            panneau[j0:] = lu
+            for i, p in enumerate(pivots):
+                if p != i:
+                    ordre[[j0 + i, j0 + p]] = ordre[[j0 + p, j0 + i]]
+            # Écriture indexée par ligne d'origine (pas d'échange de lignes sur le disque)
+            tampon = np.empty_like(panneau)
+            tampon[ordre] = panneau
+            travail[:, j0:j1] = tampon
+            del panneau, tampon, lu
+
+        # 4. Descente (L unitaire) puis remontée (U), panneau par panneau
+        x = b[ordre].copy()
+        for k0, k1 in panneaux:
+            L = _lire_panneau(travail, ordre, k0, k1)
+            x[k0:k1] = sla.solve_triangular(L[k0:k1], x[k0:k1], lower=True,
+                                            unit_diagonal=True, check_finite=False)
+            x[k1:] -= L[k1:] @ x[k0:k1]
+        for k0, k1 in reversed(panneaux):
+            U = _lire_panneau(travail, ordre, k0, k1)
+            x[k0:k1] = sla.solve_triangular(U[k0:k1], x[k0:k1], lower=False, check_finite=False)
+            x[:k0] -= U[:k0] @ x[k0:k1]
+        del travail # Libère la projection avant la suppression du dossier de travail
+
+        # 5. Résidu relatif, calculé par blocs de lignes de A
+        norme_r, norme_b = 0.0, max(np.linalg.norm(b), np.finfo(float).tiny)
+        for debut in range(0, n, lignes_par_bloc):
+            bloc = np.asarray(A[debut:debut + lignes_par_bloc], dtype=np.float64)
+            norme_r += np.sum((bloc @ x - b[debut:debut + lignes_par_bloc]) ** 2)
+
+        resultats = {
+            "solution": x,
+            "residu": np.sqrt(norme_r) / norme_b,
+            "largeur_panneau": largeur,
+            "memoire_travail": 6 * 8 * n * largeur,
+            "pic_rss": _pic_rss_octets(),
+        }
+        return resultats, None
+
+    except np.linalg.LinAlgError:
+        return None, "Erreur : La matrice est singulière, le système n'admet pas de solution unique."
+    except TypeError as e:
+        return None, f"Erreur : {e}"
+    except Exception as e:
+        return None, f"Une erreur inattendue est survenue : {e}"
+    finally:
+        if dossier is not None:
+            dossier.cleanup()
@@ -1,11 +1,30 @@
+import os
+import tempfile
+import threading
+import time
+
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 
 # Importation de nos 4 modules "cerveau"
-from core.core_systeme import resoudre_systeme
-from core.core_prog_lineaire import resoudre_prog_lineaire
-from core.core_regression import charger_donnees_csv, calculer_regression
-from core.core_markov import simuler_chaine_markov
+from core.core_systeme import (resoudre_systeme, obtenir_factorisation, resoudre_systeme_adapte,
+                               resoudre_systemes_par_lots, resoudre_precision_mixte,
+                               resoudre_systeme_hors_memoire)
+from core.core_prog_lineaire import (resoudre_prog_lineaire, resoudre_prog_lineaire_matriciel,
+                                     ProblemeLineaire, ModeleLP, CacheResultatsLP, resoudre_probleme,
+                                     resoudre_scenarios, JetonAnnulation, STATUT_REALISABLE)
+from core.core_fichiers_pl import enregistrer_probleme_fichier, charger_probleme_fichier
+from core.core_regression import (charger_donnees_csv, lire_entete_csv, calculer_regression,
+                                  calculer_regression_csv,
+                                  AccumulateurRegression, calculer_regressions_paires,
+                                  calculer_regression_groupes, calculer_regression_glissante,
+                                  TAILLE_MIN_CACHE_CSV)
+from core.core_cache import CacheColonnesDisque
+from core.core_markov import (simuler_chaine_markov, simuler_ensemble_markov,
+                              distribution_stationnaire, distribution_n_etapes,
+                              simuler_chaine_markov_fichier, analyser_chaine_absorbante,
+                              monte_carlo_markov_parallele, temps_moyens_premier_passage)
 
 def run_tests():
     """Fonction principale pour exécuter tous les tests."""
@@ -45,6 +64,100 @@ def run_tests():
     else:
         print(f"Résultat : {solution} (ERREUR - aurait dû échouer)")
 
+    # Cas 3: Même matrice A, autre vecteur b (factorisation réutilisée)
+    print("\n--- Cas 3 : Même A, nouveau b (factorisation en cache) ---")
+    b3 = np.array([1, 0, 0])
+    solution, erreur = resoudre_systeme(A1, b3)
+    print(f"Méthode de factorisation : {obtenir_factorisation(A1).methode}")
+    print(f"Résultat (Solution X) : {solution}")
+
+    # Cas 4: Choix automatique du solveur (matrice tridiagonale -> bande)
+    print("\n--- Cas 4 : Solveur adapté à la structure (tridiagonale 100x100) ---")
+    A4 = 2 * np.eye(100) - np.eye(100, k=1) - np.eye(100, k=-1)
+    resultats, erreur = resoudre_systeme_adapte(A4, np.ones(100))
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        print(f"Méthode choisie : {resultats['methode']}, résidu relatif : {resultats['residu']:.2e}")
+
+    # Cas 5: Matrice presque (mais pas exactement) symétrique : pas de Cholesky
+    print("\n--- Cas 5 : Matrice presque symétrique ---")
+    A5 = np.array([[1, 0.999999],
+                   [0.99999, 1]])
+    solution, erreur = resoudre_systeme(A5, np.array([1, 0]))
+    print(f"Méthode : {obtenir_factorisation(A5).methode}, résultat : {solution}") # ≈ [90909.17, -90908.26]
+    _, erreur = resoudre_systeme(np.array([[1, 1j], [0, 1]]), np.array([1, 0]))
+    print(f"Matrice complexe : {erreur}")
+    resultats, erreur = resoudre_systeme_adapte(A5, np.array([1, 0]))
+    print(f"Méthode choisie : {resultats['methode']}, résidu relatif : {resultats['residu']:.2e}")
+
+    # Cas 6: Structure donnée explicitement : vérifiée, et matrice creuse en bande non densifiée
+    print("\n--- Cas 6 : Structure explicite (vérification, bande creuse) ---")
+    resultats, erreur = resoudre_systeme_adapte(A4, np.ones(100), structure="triangulaire_inf")
+    print(f"Triangulaire inférieure pour une tridiagonale : {erreur}")
+    resultats, erreur = resoudre_systeme_adapte(sp.csr_matrix(A4), np.ones(100), structure="bande")
+    print(f"Bande creuse : méthode {resultats['methode']}, résidu relatif : {resultats['residu']:.2e}")
+    resultats, erreur = resoudre_systeme_adapte(sp.csr_matrix(np.tril(A4)), np.ones(100))
+    print(f"Triangulaire creuse détectée : méthode {resultats['methode']}") # triangulaire_inf
+    resultats, erreur = resoudre_systeme_adapte(np.array([[1.0, 2.0], [2.0, 1.0]]), np.ones(2), structure="spd")
+    print(f"'spd' imposé pour une symétrique indéfinie : {erreur}")
+    resultats, erreur = resoudre_systeme_adapte(np.array([[1.0, 2.0], [2.0, 1.0]]), np.ones(2))
+    print(f"Symétrique indéfinie détectée : méthode {resultats['methode']}") # dense, pas spd
+    # Méthodes itératives imposées, comparées à np.linalg.solve
+    rng = np.random.default_rng(0)
+    M = rng.normal(size=(30, 30))
+    for structure, A in (("cg", M @ M.T + 30 * np.eye(30)), ("gmres", M + 30 * np.eye(30))):
+        b = rng.normal(size=30)
+        resultats, erreur = resoudre_systeme_adapte(sp.csr_matrix(A), b, structure=structure, tolerance=1e-12)
+        if erreur:
+            print(f"Résultat : ERREUR - {erreur}")
+        else:
+            ecart = np.abs(resultats['solution'] - np.linalg.solve(A, b)).max()
+            print(f"{structure} : {resultats['iterations']} itérations, écart à np.linalg.solve : {ecart:.1e}")
+
+    # Cas 7: Pile de systèmes dont un singulier : les autres sont quand même résolus
+    print("\n--- Cas 7 : Systèmes par lots (dont un singulier) ---")
+    pile_A = np.array([A1, [[1, 1, 1], [1, 1, 1], [0, 0, 1]], 2 * np.eye(3)], dtype=float)
+    pile_b = np.array([b1, b1, b1], dtype=float)
+    resultats, erreur = resoudre_systemes_par_lots(pile_A, pile_b)
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        print(f"Solutions :\n{resultats['solutions']}") # [2 1 -2], [nan nan nan], [1 6 1]
+        print(f"Erreurs : {resultats['erreurs']}")
+
+    # Cas 8: Précision mixte (LU float32 + raffinements float64), et repli float64 si mal conditionnée
+    # (pour Hilbert, conditionnement ~1e13 : l'écart à np.linalg.solve reflète le conditionnement)
+    print("\n--- Cas 8 : Précision mixte ---")
+    rng = np.random.default_rng(1)
+    A8 = rng.normal(size=(200, 200)) + 200 * np.eye(200)
+    b8 = rng.normal(size=200)
+    hilbert = 1.0 / (np.arange(1, 11)[:, None] + np.arange(10)[None, :])
+    for nom, A, b in (("aléatoire 200x200", A8, b8), ("Hilbert 10x10", hilbert, np.ones(10))):
+        resultats, erreur = resoudre_precision_mixte(A, b)
+        if erreur:
+            print(f"Résultat : ERREUR - {erreur}")
+        else:
+            ecart = np.abs(resultats['solution'] - np.linalg.solve(A, b)).max() / np.abs(np.linalg.solve(A, b)).max()
+            print(f"{nom} : méthode {resultats['methode']}, {resultats['iterations']} raffinements, "
+                  f"résidu relatif : {resultats['residu']:.1e}, écart relatif à np.linalg.solve : {ecart:.1e}")
+
+    # Cas 9: LU hors mémoire par panneaux (fichier .npy, très peu de mémoire : panneaux de 16 colonnes)
+    print("\n--- Cas 9 : Résolution hors mémoire (150x150, panneaux de 16 colonnes) ---")
+    A9 = rng.normal(size=(150, 150)) # Quelconque : le pivot partiel est nécessaire
+    b9 = rng.normal(size=150)
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin_A9 = os.path.join(dossier, "A.npy")
+        np.save(chemin_A9, A9)
+        resultats, erreur = resoudre_systeme_hors_memoire(chemin_A9, b9, memoire_max=6 * 8 * 150 * 16,
+                                                          repertoire_travail=dossier)
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        ecart = np.abs(resultats['solution'] - np.linalg.solve(A9, b9)).max()
+        print(f"Largeur des panneaux : {resultats['largeur_panneau']}, résidu relatif : {resultats['residu']:.1e}, "
+              f"écart à np.linalg.solve : {ecart:.1e}")
+
 
     print("\n\n=============================================")
     print("🧪 TEST 2 : MODULE PROGRAMMATION LINÉAIRE 🧪")
@@ -73,6 +186,96 @@ def run_tests():
     print(f"Valeur optimale de z : {valeur_obj}")
     print(f"Valeurs des variables : {valeurs_vars}")
 
+    # Même problème, sous forme matricielle (A_ub creuse ou dense)
+    print("\n--- Cas 2 : Même problème sous forme matricielle ---")
+    statut, valeur_obj, valeurs_vars = resoudre_prog_lineaire_matriciel(
+        [3, 2], A_ub=[[2, 1], [1, 3]], b_ub=[10, 15], direction="Maximiser", noms_variables=['x', 'y'])
+    print(f"Statut : {statut}, z = {valeur_obj}, variables : {valeurs_vars}")
+    # Un type de contrainte mal saisi est refusé (et non traité comme <=)
+    statut, _, _ = resoudre_prog_lineaire(direction_pl, fonction_obj,
+                                          [{'coeffs': {'x': 1}, 'type': '=>', 'rhs': 1}])
+    print(f"Type de contrainte invalide : {statut}")
+
+    # Modèle persistant : duals, plages de sensibilité et re-résolution sans solveur
+    print("\n--- Cas 3 : Modèle persistant et sensibilité ---")
+    c3, b3_ub = np.array([3.0, 2.0]), np.array([10.0, 15.0])
+    probleme3 = ProblemeLineaire(c3, [[2, 1], [1, 3]], b3_ub, direction="Maximiser", noms_variables=['x', 'y'])
+    modele = ModeleLP(probleme3)
+    res = modele.resoudre()
+    print(f"z = {res['valeur_obj']}, duals = {res['duals_ub'].tolist()}, "
+          f"plages b_ub = {res['plages_b_ub'].tolist()}")
+    modele.modifier_second_membre({0: 11}) # Reste dans la plage [5, 30]
+    res = modele.resoudre()
+    print(f"b_ub[0] = 11 -> z = {res['valeur_obj']:.4f} (résolution : {res['resolution']})")
+    modele.modifier_objectif({1: 2.5})
+    print(f"Données de l'appelant inchangées : {c3.tolist() == [3, 2] and b3_ub.tolist() == [10, 15]}, "
+          f"problème d'origine inchangé : {probleme3.c.tolist() == [3, 2] and probleme3.b_ub.tolist() == [10, 15]}")
+
+    # Cache : le même problème, contraintes et variables dans un autre ordre
+    print("\n--- Cas 4 : Cache des résultats ---")
+    cache = CacheResultatsLP()
+    resoudre_prog_lineaire(direction_pl, fonction_obj, contraintes, cache=cache)
+    resultat = resoudre_prog_lineaire(direction_pl, dict(reversed(fonction_obj.items())),
+                                      list(reversed(contraintes)), cache=cache)
+    print(f"Résultat : {resultat}, statistiques : {cache.statistiques()}")
+
+    # Variables entières / binaires, bornes personnalisées et limite de temps
+    print("\n--- Cas 5 : Variables entières et binaires ---")
+    statut, valeur_obj, valeurs_vars = resoudre_prog_lineaire(
+        direction_pl, fonction_obj,
+        [{'coeffs': {'x': 2, 'y': 1}, 'type': '<=', 'rhs': 10.5},
+         {'coeffs': {'x': 1, 'y': 3}, 'type': '<=', 'rhs': 15}],
+        types_variables={'x': 'entiere', 'y': 'binaire'}, limite_temps=10)
+    print(f"Statut : {statut}, z = {valeur_obj}, variables : {valeurs_vars}")
+    # Mêmes statuts et valeurs avec HiGHS et CBC (continu, entier, non borné, irréalisable)
+    for nom, A_ub, b_ub in (("borné", [[1, 1]], [4]), ("non borné", [[1, -1]], [1]),
+                            ("irréalisable", [[1, 1], [-1, -1]], [4, -5])):
+        for entiers in (None, [1]):
+            probleme = ProblemeLineaire([1, 1], A_ub, b_ub, direction="Maximiser",
+                                        noms_variables=['x', 'y'], entiers=entiers)
+            highs, cbc = resoudre_probleme(probleme, backend="highs"), resoudre_probleme(probleme, backend="cbc")
+            identiques = highs[0] == cbc[0] and (highs[0] != "Optimal" or highs == cbc)
+            print(f"  {nom}{' (MIP)' if entiers else ''} : HiGHS {highs[0]}, CBC {cbc[0]}, "
+                  f"identiques : {identiques}") # Devrait être True
+
+    # Écriture puis relecture du modèle aux formats MPS et LP
+    print("\n--- Cas 6 : Fichiers MPS / LP ---")
+    probleme = ProblemeLineaire([3, 2], [[2, 1], [1, 3]], [10, 15],
+                                direction="Maximiser", noms_variables=['x', 'y'])
+    with tempfile.TemporaryDirectory() as dossier:
+        for extension in ("mps", "lp"):
+            chemin, erreur = enregistrer_probleme_fichier(probleme, os.path.join(dossier, f"modele.{extension}"))
+            relu, erreur = charger_probleme_fichier(chemin)
+            if erreur:
+                print(f"Résultat : ERREUR - {erreur}")
+            else:
+                print(f".{extension} : {resoudre_probleme(relu)}")
+
+    # Scénarios sur un pool de processus : un scénario invalide n'arrête pas les autres
+    print("\n--- Cas 7 : Scénarios en parallèle (dont un invalide) ---")
+    scenarios = [{"b_ub": {0: rhs}} for rhs in (8, 10, 12)] + [{"inconnue": {0: 1}}, {"c": {1: 5}}]
+    en_parallele = list(resoudre_scenarios(probleme, scenarios, nb_processus=2, dans_l_ordre=True))
+    en_serie = list(resoudre_scenarios(probleme, scenarios, nb_processus=1))
+    for i, (statut, valeur_obj, _) in en_parallele:
+        print(f"  Scénario {i} : {statut}, z = {valeur_obj}")
+    print(f"Dans l'ordre et identiques au calcul en série : {en_parallele == en_serie}") # Devrait être True
+
+    # Annulation d'un MIP difficile (partage de marché, 4 x 30) depuis un autre thread
+    print("\n--- Cas 8 : Annulation d'une résolution CBC ---")
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 100, size=(4, 30))
+    # Écarts e+ - e- sur chaque égalité : x = 0 est réalisable, CBC trouve vite une solution
+    probleme = ProblemeLineaire(np.concatenate([np.zeros(30), np.ones(8)]),
+                                A_eq=np.hstack([a, np.eye(4), -np.eye(4)]), b_eq=a.sum(axis=1) // 2,
+                                entiers=np.arange(30))
+    jeton = JetonAnnulation()
+    threading.Timer(1.0, jeton.annuler).start()
+    debut = time.perf_counter()
+    statut, valeur_obj, valeurs_vars = resoudre_probleme(probleme, backend="cbc", jeton=jeton)
+    x = np.array([valeurs_vars[f"Var_x{j}"] for j in range(30)])
+    print(f"Statut : {statut} (attendu : {STATUT_REALISABLE}), z = {valeur_obj}, "
+          f"arrêt en {time.perf_counter() - debut:.1f} s, x entier : {np.allclose(x, np.round(x))}")
+
 
     print("\n\n========================================")
     print("🧪 TEST 3 : MODULE RÉGRESSION LINÉAIRE 🧪")
@@ -104,6 +307,86 @@ def run_tests():
         else:
             print("ERREUR : Colonnes 'x' et 'y' non trouvées dans le CSV.")
 
+    # En-tête seul, puis lecture de la colonne y par blocs, en float32
+    print("\n--- Cas 3 : En-tête et lecture par blocs ---")
+    entete, erreur = lire_entete_csv(chemin_csv)
+    print(f"En-tête : {entete}")
+    blocs, erreur = charger_donnees_csv(chemin_csv, colonnes=['y'], float32=True, taille_bloc=4)
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        print(f"Tailles des blocs : {[len(bloc) for bloc in blocs]}")
+    # Ligne invalide loin dans le fichier : erreur dans le tuple, pas d'exception en cours de lecture
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin_invalide = os.path.join(dossier, "invalide.csv")
+        with open(chemin_invalide, "w") as f:
+            f.write("x,y\n" + "".join(f"{i},{2 * i}\n" for i in range(50)) + '"1,2\n')
+        resultats, erreur = calculer_regression_csv(chemin_invalide, 'x', 'y', taille_bloc=10)
+        print(f"Bloc invalide en cours de lecture : {erreur}")
+        resultats, erreur = calculer_regressions_paires(chemin_invalide, taille_bloc=10)
+        print(f"Idem pour les paires : {erreur}")
+
+    # Accumulateurs calculés sur deux moitiés puis fusionnés : même résultat qu'en une fois
+    print("\n--- Cas 4 : Fusion d'accumulateurs de régression ---")
+    if df is not None:
+        moitie = len(df) // 2
+        accumulateur = AccumulateurRegression().ajouter(df['x'][:moitie], df['y'][:moitie])
+        accumulateur.fusionner(AccumulateurRegression().ajouter(df['x'][moitie:], df['y'][moitie:]))
+        fusion = accumulateur.resultats()
+        print(f"  Pente : {fusion['pente']:.4f} ± {fusion['erreur_std_pente']:.4f}, "
+              f"R² : {fusion['r_carre']:.4f}, n = {fusion['n']}")
+
+    # Toutes les paires + régression multiple à partir d'une seule passe de covariance
+    print("\n--- Cas 5 : Régressions de toutes les paires ---")
+    rng = np.random.default_rng(0)
+    df5 = pd.DataFrame({'a': rng.normal(size=200), 'b': rng.normal(size=200)})
+    df5['c'] = 2 * df5['a'] - 3 * df5['b'] + 1 + rng.normal(scale=0.1, size=200)
+    resultats, erreur = calculer_regressions_paires(df5, cible='c', taille_bloc=64)
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        print(resultats['paires'].round(4).to_string(index=False))
+        multiple = resultats['multiple']
+        print(f"  c = {multiple['coefficients']['a']:.3f}·a + {multiple['coefficients']['b']:.3f}·b "
+              f"+ {multiple['ordonnee_origine']:.3f} (R² : {multiple['r_carre']:.4f})")
+
+    # Deuxième lecture d'un même gros fichier : colonnes relues depuis le cache binaire
+    print("\n--- Cas 6 : Cache binaire des colonnes CSV ---")
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin_gros = os.path.join(dossier, "gros.csv")
+        nb_lignes = TAILLE_MIN_CACHE_CSV // 8
+        pd.DataFrame({'x': np.arange(nb_lignes) * 0.5, 'nom': np.where(np.arange(nb_lignes) % 2, 'a', 'b'),
+                      'y': np.arange(nb_lignes) * 1.5 + 2}).to_csv(chemin_gros, index=False)
+        cache_csv = CacheColonnesDisque(os.path.join(dossier, "cache"))
+        premier, _ = charger_donnees_csv(chemin_gros, colonnes=['y', 'x'], cache=cache_csv)
+        second, _ = charger_donnees_csv(chemin_gros, colonnes=['y', 'x'], cache=cache_csv)
+        print(f"Identiques : {premier.equals(second)}, colonnes : {list(premier.columns)} / {list(second.columns)}, "
+              f"statistiques : {cache_csv.statistiques()}")
+        # Toutes les colonnes, dont une de texte : les numériques viennent du cache (un succès de plus)
+        complet, _ = charger_donnees_csv(chemin_gros, cache=cache_csv)
+        print(f"Toutes les colonnes : {list(complet.columns)}, identiques à la lecture directe : "
+              f"{complet.equals(pd.read_csv(chemin_gros))}, statistiques : {cache_csv.statistiques()}")
+
+    # Régression par groupe et sur fenêtre glissante (sommes par groupe / sommes cumulées)
+    print("\n--- Cas 7 : Régression par groupe et glissante ---")
+    df7 = pd.DataFrame({'groupe': ['A'] * 4 + ['B'] * 4, 'x': [1, 2, 3, 4] * 2,
+                        'y': [3, 5, 7, 9, 10, 8, 6, 4]})
+    resultats, erreur = calculer_regression_groupes(df7, 'x', 'y', 'groupe')
+    print(resultats.to_string(index=False) if erreur is None else f"Résultat : ERREUR - {erreur}")
+    resultats, erreur = calculer_regression_glissante(df7['x'], df7['y'], fenetre=4, pas=2)
+    print(resultats.to_string(index=False) if erreur is None else f"Résultat : ERREUR - {erreur}")
+
+    # Fenêtres courtes sur un X long et croissant (indices) : pas de perte de précision
+    print("\n--- Cas 8 : Régression glissante sur X monotone (1 000 000 lignes, fenêtre 10) ---")
+    x8 = np.arange(1_000_000, dtype=float)
+    y8 = 2 * x8 + np.random.default_rng(0).normal(scale=0.01, size=len(x8))
+    resultats, erreur = calculer_regression_glissante(x8, y8, fenetre=10)
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        print(f"Pentes : de {resultats['pente'].min():.4f} à {resultats['pente'].max():.4f}, "
+              f"R² minimal : {resultats['r_carre'].min():.6f}") # Pentes ≈ 2, R² ≈ 1
+
 
     print("\n\n=================================================")
     print("🧪 TEST 4 : MODULE PROCESSUS STOCHASTIQUE (MARKOV) 🧪")
@@ -125,13 +408,120 @@ def run_tests():
     print(f"État initial : {etat_initial}")
     print(f"Nombre d'étapes : {nb_etapes}")
     
-    trajectoire, erreur = simuler_chaine_markov(matrice_markov, etat_initial, nb_etapes)
+    # Générateur à graine fixe : la trajectoire est la même à chaque exécution
+    generateur = np.random.default_rng(42)
+    trajectoire, erreur = simuler_chaine_markov(matrice_markov, etat_initial, nb_etapes, generateur)
     
     if erreur:
         print(f"Résultat : ERREUR - {erreur}")
     else:
         print(f"Trajectoire simulée (longueur {len(trajectoire)}) :")
-        print(trajectoire)
+        print(trajectoire.tolist())
+    _, erreur = simuler_chaine_markov(matrice_markov, 1.7, nb_etapes)
+    print(f"État initial non entier : {erreur}")
+
+    # Cas 2: Ensemble de marcheurs simulés en parallèle
+    print("\n--- Cas 2 : Ensemble de 10 000 marcheurs partant de l'état 0 ---")
+    resultats, erreur = simuler_ensemble_markov(matrice_markov, nb_etapes, etats_initiaux=0,
+                                                nb_marcheurs=10000, generateur=42,
+                                                histogrammes=True)
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        print(f"Trajectoires : tableau {resultats['trajectoires'].shape} (marcheurs x étapes)")
+        print(f"Répartition empirique à la dernière étape : {resultats['histogrammes'][-1] / 10000}")
+    _, erreur = simuler_ensemble_markov(matrice_markov, nb_etapes, distribution_initiale=[1.5, -0.5, 0],
+                                        nb_marcheurs=10)
+    print(f"Distribution initiale négative : {erreur}")
+
+    # Cas 3: Distributions exactes (sans simulation)
+    print("\n--- Cas 3 : Distributions exactes ---")
+    pi, erreur = distribution_stationnaire(matrice_markov)
+    print(f"Distribution stationnaire : {pi}") # Devrait être [0.4634 0.3171 0.2195]
+    pi_n, erreur = distribution_n_etapes(matrice_markov, [1, 0, 0], nb_etapes - 1)
+    print(f"Loi exacte à la dernière étape : {pi_n}")
+    # Une matrice modifiée en place après un appel ne doit pas fausser le cache des puissances
+    matrice_modifiee = matrice_markov.copy()
+    distribution_n_etapes(matrice_modifiee, [1, 0, 0], 1)
+    matrice_modifiee[:] = np.eye(3)
+    pi_1, erreur = distribution_n_etapes(matrice_markov.copy(), [1, 0, 0], 1)
+    print(f"Loi après une étape (matrice d'origine) : {pi_1}") # Devrait être [0.7 0.2 0.1]
+    # Matrice creuse (avec un zéro explicite) : pas modifiée par le calcul, et N = 2 accepté
+    matrice_creuse = sp.csr_matrix((np.array([0.9, 0.1, 0.0, 0.5, 0.5]), np.array([0, 1, 1, 0, 1]),
+                                    np.array([0, 3, 5])), shape=(2, 2))
+    indices_avant = matrice_creuse.indices.copy()
+    pi, erreur = distribution_stationnaire(matrice_creuse)
+    print(f"Stationnaire (creuse, 2 états) : {pi}, matrice intacte : "
+          f"{np.array_equal(indices_avant, matrice_creuse.indices)}") # Devrait être [0.8333 0.1667]
+
+    # Cas 4: Longue trajectoire en flux (statistiques seulement, mémoire constante)
+    print("\n--- Cas 4 : 1 000 000 d'étapes en flux ---")
+    stats, erreur = simuler_chaine_markov_fichier(matrice_markov, etat_initial, 1_000_000, generateur=42)
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        print(f"Fréquences de visite : {stats['visites'] / stats['nb_etapes']}") # Proche de la loi stationnaire
+
+    # Cas 5: Chaîne absorbante (ruine du joueur, 0 et 4 absorbants)
+    print("\n--- Cas 5 : Chaîne absorbante (ruine du joueur) ---")
+    matrice_ruine = np.array([[1.0, 0.0, 0.0, 0.0, 0.0],
+                              [0.5, 0.0, 0.5, 0.0, 0.0],
+                              [0.0, 0.5, 0.0, 0.5, 0.0],
+                              [0.0, 0.0, 0.5, 0.0, 0.5],
+                              [0.0, 0.0, 0.0, 0.0, 1.0]])
+    analyse, erreur = analyser_chaine_absorbante(matrice_ruine)
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        print(f"États absorbants : {analyse['etats_absorbants']}")
+        print(f"Probabilités d'absorption :\n{analyse['probabilites_absorption']}")
+        print(f"Temps moyen avant absorption : {analyse['temps_absorption']}") # Devrait être [3. 4. 3.]
+
+    # Cas 6: Répliques Monte-Carlo sur plusieurs processus : mêmes résultats qu'avec un seul
+    print("\n--- Cas 6 : Monte-Carlo parallèle déterministe (1 vs 4 processus) ---")
+    seul, erreur_seul = monte_carlo_markov_parallele(matrice_markov, 0, 1000, 16, graine=7, nb_processus=1)
+    pool, erreur_pool = monte_carlo_markov_parallele(matrice_markov, 0, 1000, 16, graine=7, nb_processus=4)
+    if erreur_seul or erreur_pool:
+        print(f"Résultat : ERREUR - {erreur_seul or erreur_pool}")
+    else:
+        identiques = all(np.array_equal(seul[cle], pool[cle]) for cle in ("visites", "transitions", "etats_finaux"))
+        print(f"Résultats identiques : {identiques}") # Devrait être True
+
+    # Cas 7: Échantillonnage par tables d'alias : fréquences de transition proches de P
+    print("\n--- Cas 7 : Tables d'alias (200 000 étapes) ---")
+    trajectoire, erreur = simuler_chaine_markov(matrice_markov, 0, 200_000, generateur=3, methode="alias")
+    if erreur:
+        print(f"Résultat : ERREUR - {erreur}")
+    else:
+        comptes = np.zeros((3, 3))
+        np.add.at(comptes, (trajectoire[:-1], trajectoire[1:]), 1)
+        ecart = np.abs(comptes / comptes.sum(axis=1, keepdims=True) - matrice_markov).max()
+        print(f"Écart maximal entre fréquences et P : {ecart:.4f}") # Devrait être < 0.01
+
+    # Cas 8: Trajectoire écrite dans un .npy par morceaux, relue en mémoire mappée
+    print("\n--- Cas 8 : Trajectoire dans un fichier .npy ---")
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin_npy = os.path.join(dossier, "trajectoire.npy")
+        stats, erreur = simuler_chaine_markov_fichier(matrice_markov, 0, 100_000, chemin_npy,
+                                                      taille_bloc=4096, generateur=5)
+        en_memoire, _ = simuler_chaine_markov(matrice_markov, 0, 100_000, generateur=5)
+        if erreur:
+            print(f"Résultat : ERREUR - {erreur}")
+        else:
+            relue = np.load(chemin_npy, mmap_mode="r")
+            print(f"Type : {relue.dtype} / {en_memoire.dtype}, longueur : {len(relue)} / {len(en_memoire)}, "
+                  f"contenu identique : {np.array_equal(relue, en_memoire)}")
+            del relue
+
+    # Cas 9: Temps moyens de premier passage (marche sur un triangle : 2 pour aller ailleurs, 3 pour revenir)
+    print("\n--- Cas 9 : Temps moyens de premier passage ---")
+    triangle = np.array([[0, 0.5, 0.5],
+                         [0.5, 0, 0.5],
+                         [0.5, 0.5, 0]])
+    M, erreur = temps_moyens_premier_passage(triangle)
+    print(f"Matrice complète (dense) :\n{M}") # Devrait être 2 hors diagonale, 3 sur la diagonale
+    m, erreur = temps_moyens_premier_passage(sp.csr_matrix(triangle), cible=0)
+    print(f"Vers l'état 0 (creuse) : {m}") # Devrait être [3. 2. 2.]
 
     print("========================================")
     print("✅ FIN DES TESTS DU 'CORE' ✅")
@@ -139,8 +529,6 @@ def run_tests():
 
 
 if __name__ == "__main__":
-    # On fixe la "graine" aléatoire pour que le test de Markov
-    # donne toujours le même résultat à chaque exécution.
-    np.random.seed(42)
-    
+    # La graine du test de Markov est fixée via le générateur passé
+    # à simuler_chaine_markov (voir TEST 4).
     run_tests()
\ No newline at end of file
@@ -2,12 +2,13 @@
 
 import numpy as np
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
-                             QLabel, QLineEdit, QPushButton, QSpinBox)
+                             QLabel, QLineEdit, QPushButton, QSpinBox, QCheckBox)
 from PySide6.QtCore import Qt
 
 # Importation de l'assistant graphique et de la logique
 from ui.ui_helpers import MplCanvas
-from core.core_markov import simuler_chaine_markov
+from core.core_markov import (simuler_chaine_markov, evolution_distribution,
+                               distribution_stationnaire)
 
 class TabMarkov(QWidget):
     """
@@ -59,6 +60,10 @@ class TabMarkov(QWidget):
         
         controls_layout.addLayout(params_layout)
         
+        # Superposition des lois exactes P(X_t = i) et de la loi stationnaire
+        self.check_exact = QCheckBox("Superposer les distributions exactes")
+        controls_layout.addWidget(self.check_exact)
+        
         # 3. Bouton de Simulation
         self.btn_simuler = QPushButton("Simuler la trajectoire")
         controls_layout.addWidget(self.btn_simuler)
@@ -72,6 +77,7 @@ class TabMarkov(QWidget):
         # --- Colonne de droite (Graphique) ---
         self.plot_canvas = MplCanvas(self, width=5, height=4, dpi=100)
         self.plot_canvas.axes.set_title("Trajectoire de la Chaîne de Markov")
+        self.axes_proba = None # Axe secondaire des probabilités exactes
         
         # Assemblage final
         left_widget = QWidget()
@@ -125,6 +131,9 @@ class TabMarkov(QWidget):
                 self.lbl_erreur.setText(f"Erreur : {erreur}")
             else:
                 # Afficher le graphique
+                if self.axes_proba is not None:
+                    self.axes_proba.remove()
+                    self.axes_proba = None
                 self.plot_canvas.axes.clear()
                 
                 # Utiliser 'steps-post' est idéal pour les états discrets
@@ -135,10 +144,35 @@ class TabMarkov(QWidget):
                 self.plot_canvas.axes.set_ylabel("État")
                 self.plot_canvas.axes.set_yticks([0, 1, 2]) # Forcer les ticks pour les états
                 self.plot_canvas.axes.grid(True, linestyle='--', alpha=0.6, axis='y')
+                
+                if self.check_exact.isChecked():
+                    self.tracer_distributions_exactes(matrice_transition, etat_initial, nb_etapes)
+                
                 self.plot_canvas.fig.tight_layout()
                 self.plot_canvas.canvas.draw()
                 
         except ValueError:
             self.lbl_erreur.setText("Erreur de saisie : Veuillez entrer des nombres valides dans la matrice.")
         except Exception as e:
-            self.lbl_erreur.setText(f"Une erreur inattendue est survenue : {e}")
\ No newline at end of file
+            self.lbl_erreur.setText(f"Une erreur inattendue est survenue : {e}")
+
+    def tracer_distributions_exactes(self, matrice_transition, etat_initial, nb_etapes):
+        """
+        Trace sur un axe secondaire les probabilités exactes P(X_t = i)
+        et, en pointillés, la distribution stationnaire.
+        """
+        distribution_initiale = np.zeros(len(matrice_transition))
+        distribution_initiale[etat_initial] = 1.0
+        distributions, erreur = evolution_distribution(matrice_transition, distribution_initiale, nb_etapes)
+        pi, erreur_pi = distribution_stationnaire(matrice_transition)
+        if erreur or erreur_pi:
+            self.lbl_erreur.setText(f"Erreur : {erreur or erreur_pi}")
+            return
+        
+        self.axes_proba = self.plot_canvas.axes.twinx()
+        for i in range(len(pi)):
+            ligne, = self.axes_proba.plot(range(nb_etapes), distributions[:, i], label=f"P(X_t = {i})")
+            self.axes_proba.axhline(pi[i], color=ligne.get_color(), linestyle=':', alpha=0.8)
+        self.axes_proba.set_ylim(0, 1)
+        self.axes_proba.set_ylabel("Probabilité exacte")
+        self.axes_proba.legend(loc='upper right', fontsize=8)
\ No newline at end of file
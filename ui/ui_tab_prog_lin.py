@@ -1,16 +1,21 @@
 # Fichier : Projet_Math_App/ui/ui_tab_prog_lin.py
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
-                             QLabel, QLineEdit, QPushButton, QTextEdit, QComboBox)
+                             QLabel, QLineEdit, QPushButton, QTextEdit, QComboBox, QFileDialog)
 from PySide6.QtCore import Qt
 
 # Importation de la logique "cerveau"
-from core.core_prog_lineaire import resoudre_prog_lineaire
+from core.core_prog_lineaire import resoudre_prog_lineaire, resoudre_probleme
+from core.core_fichiers_pl import charger_probleme_fichier
+
+# Nombre maximal de variables listées dans les résultats (les gros modèles en ont des milliers)
+NB_VARIABLES_AFFICHEES = 50
 
 class TabProgLin(QWidget):
     """
     Onglet pour la programmation linéaire.
-    Simplifié à 2 variables (x, y) et 3 contraintes.
+    Simplifié à 2 variables (x, y) et 3 contraintes, ou modèle complet
+    chargé depuis un fichier MPS / LP.
     """
     def __init__(self):
         super().__init__()
@@ -77,9 +82,13 @@ class TabProgLin(QWidget):
             
         main_layout.addLayout(constraints_layout)
         
-        # --- Bouton de Résolution ---
+        # --- Boutons de Résolution ---
+        boutons_layout = QHBoxLayout()
         self.btn_resoudre = QPushButton("Résoudre le problème")
-        main_layout.addWidget(self.btn_resoudre)
+        boutons_layout.addWidget(self.btn_resoudre)
+        self.btn_fichier = QPushButton("Ouvrir un modèle MPS / LP...")
+        boutons_layout.addWidget(self.btn_fichier)
+        main_layout.addLayout(boutons_layout)
 
         # --- Zone de Résultats ---
         self.result_display = QTextEdit()
@@ -90,6 +99,7 @@ class TabProgLin(QWidget):
 
         # --- Connexion ---
         self.btn_resoudre.clicked.connect(self.on_resoudre_click)
+        self.btn_fichier.clicked.connect(self.on_fichier_click)
         
         # Pré-remplir avec l'exemple du test
         self.pre_remplir_exemple()
@@ -150,25 +160,48 @@ class TabProgLin(QWidget):
             statut, valeur_obj, valeurs_vars = resoudre_prog_lineaire(direction, fonction_obj, contraintes)
 
             # 5. Afficher les résultats
-            self.result_display.setStyleSheet("color: #F0F0F0;")
-            result_str = f"--- RÉSULTATS DE L'OPTIMISATION ---\n\n"
-            result_str += f"Statut : {statut}\n"
-            
-            if statut == "Optimal":
-                self.result_display.setStyleSheet("color: #6BFF6B;")
-                result_str += f"\nValeur {direction.lower().replace('r', 'le')} de z = {valeur_obj:.4f}\n"
-                result_str += "\nValeurs des variables :\n"
-                for var, val in valeurs_vars.items():
-                    if val > 1e-6: # N'afficher que les variables non nulles
-                        result_str += f"  {var.replace('Var_', '')} = {val:.4f}\n"
-            else:
-                 self.result_display.setStyleSheet("color: #FF6B6B;")
-            
-            self.result_display.setText(result_str)
+            self.afficher_resultats(direction, statut, valeur_obj, valeurs_vars)
 
         except ValueError as e:
             self.result_display.setStyleSheet("color: #FF6B6B;")
             self.result_display.setText(f"Erreur de saisie : {e}")
         except Exception as e:
             self.result_display.setStyleSheet("color: #FF6B6B;")
-            self.result_display.setText(f"Une erreur inattendue est survenue : {e}")
\ No newline at end of file
+            self.result_display.setText(f"Une erreur inattendue est survenue : {e}")
+
+    def afficher_resultats(self, direction, statut, valeur_obj, valeurs_vars, entete=""):
+        self.result_display.setStyleSheet("color: #F0F0F0;")
+        result_str = f"--- RÉSULTATS DE L'OPTIMISATION ---\n\n{entete}"
+        result_str += f"Statut : {statut}\n"
+
+        if statut == "Optimal":
+            self.result_display.setStyleSheet("color: #6BFF6B;")
+            result_str += f"\nValeur {direction.lower().replace('r', 'le')} de z = {valeur_obj:.4f}\n"
+            result_str += "\nValeurs des variables :\n"
+            non_nulles = [(var, val) for var, val in valeurs_vars.items() if abs(val) > 1e-6] # N'afficher que les variables non nulles
+            for var, val in non_nulles[:NB_VARIABLES_AFFICHEES]:
+                result_str += f"  {var.replace('Var_', '')} = {val:.4f}\n"
+            if len(non_nulles) > NB_VARIABLES_AFFICHEES:
+                result_str += f"  ... ({len(non_nulles) - NB_VARIABLES_AFFICHEES} autres variables non nulles)\n"
+        else:
+            self.result_display.setStyleSheet("color: #FF6B6B;")
+
+        self.result_display.setText(result_str)
+
+    def on_fichier_click(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "Ouvrir un modèle", "data/",
+                                                   "Modèles (*.mps *.lp *.mps.gz *.lp.gz)")
+        if not file_path:
+            return # L'utilisateur a annulé
+
+        probleme, erreur = charger_probleme_fichier(file_path)
+        if erreur:
+            self.result_display.setStyleSheet("color: #FF6B6B;")
+            self.result_display.setText(erreur)
+            return
+
+        statut, valeur_obj, valeurs_vars = resoudre_probleme(probleme)
+        nb_contraintes = probleme.A_ub.shape[0] + probleme.A_eq.shape[0]
+        entete = (f"Modèle : {file_path.split('/')[-1]} ({probleme.nb_variables} variables, "
+                  f"{nb_contraintes} contraintes, {probleme.A_ub.nnz + probleme.A_eq.nnz} coefficients)\n")
+        self.afficher_resultats(probleme.direction, statut, valeur_obj, valeurs_vars, entete)
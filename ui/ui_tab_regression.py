@@ -2,12 +2,18 @@
 
 import pandas as pd
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                             QLabel, QPushButton, QTextEdit, QComboBox, QFileDialog)
+                             QLabel, QPushButton, QTextEdit, QComboBox, QFileDialog,
+                             QTableWidget, QTableWidgetItem, QHeaderView)
 from PySide6.QtCore import Qt
 
 # Importation de l'assistant graphique et de la logique
 from ui.ui_helpers import MplCanvas
-from core.core_regression import charger_donnees_csv, calculer_regression
+from core.core_regression import (charger_donnees_csv, lire_entete_csv, calculer_regression,
+                                  calculer_regressions_paires, CACHE_CSV)
+
+# Colonnes du tableau "toutes les paires" (clé du DataFrame, titre affiché)
+COLONNES_PAIRES = [("x", "X"), ("y", "Y"), ("pente", "Pente"),
+                   ("ordonnee_origine", "Ordonnée"), ("r_carre", "R²"), ("n", "n")]
 
 class TabRegression(QWidget):
     """
@@ -15,7 +21,8 @@ class TabRegression(QWidget):
     """
     def __init__(self):
         super().__init__()
-        self.dataframe = None # Pour stocker les données chargées
+        self.chemin_csv = None # Fichier choisi (seul l'en-tête est lu à l'ouverture)
+        self.dataframe = None # Pour stocker les colonnes chargées
         self.init_ui()
 
     def init_ui(self):
@@ -47,6 +54,11 @@ class TabRegression(QWidget):
         self.btn_calculate = QPushButton("2. Calculer la Régression")
         self.btn_calculate.setEnabled(False) # Désactivé au début
         controls_layout.addWidget(self.btn_calculate)
+
+        # 3. Toutes les paires en une passe (Y sert de cible pour la régression multiple)
+        self.btn_all_pairs = QPushButton("3. Régresser toutes les paires")
+        self.btn_all_pairs.setEnabled(False)
+        controls_layout.addWidget(self.btn_all_pairs)
         
         # 4. Zone de Résultats
         self.result_display = QTextEdit()
@@ -60,6 +72,18 @@ class TabRegression(QWidget):
         # --- Colonne de droite (Graphique) ---
         self.plot_canvas = MplCanvas(self, width=5, height=4, dpi=100)
         self.plot_canvas.axes.set_title("Nuage de points et Droite de Régression")
+
+        # Tableau triable des régressions de toutes les paires (caché au début)
+        self.table_paires = QTableWidget(0, len(COLONNES_PAIRES))
+        self.table_paires.setHorizontalHeaderLabels([titre for _, titre in COLONNES_PAIRES])
+        self.table_paires.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.table_paires.setSortingEnabled(True)
+        self.table_paires.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table_paires.hide()
+
+        right_layout = QVBoxLayout()
+        right_layout.addWidget(self.plot_canvas, stretch=2)
+        right_layout.addWidget(self.table_paires, stretch=1)
         
         # Assemblage final
         left_widget = QWidget()
@@ -67,11 +91,12 @@ class TabRegression(QWidget):
         left_widget.setMaximumWidth(400) # Limiter la taille de la colonne de contrôle
         
         main_layout.addWidget(left_widget)
-        main_layout.addWidget(self.plot_canvas)
+        main_layout.addLayout(right_layout)
 
         # --- Connexions ---
         self.btn_load_csv.clicked.connect(self.on_load_csv_click)
         self.btn_calculate.clicked.connect(self.on_calculate_click)
+        self.btn_all_pairs.clicked.connect(self.on_all_pairs_click)
         
     def on_load_csv_click(self):
         """
@@ -83,22 +108,25 @@ class TabRegression(QWidget):
         if not file_path:
             return # L'utilisateur a annulé
 
-        df, erreur = charger_donnees_csv(file_path)
+        # Seul l'en-tête est lu ici : les colonnes choisies sont chargées au calcul
+        entete, erreur = lire_entete_csv(file_path)
+        self.dataframe = None
         
         if erreur:
             self.lbl_file_status.setText(erreur)
             self.lbl_file_status.setStyleSheet("color: #FF6B6B;")
-            self.dataframe = None
+            self.chemin_csv = None
             self.btn_calculate.setEnabled(False)
+            self.btn_all_pairs.setEnabled(False)
             self.combo_x.clear()
             self.combo_y.clear()
         else:
-            self.dataframe = df
+            self.chemin_csv = file_path
             self.lbl_file_status.setText(f"Fichier chargé : {file_path.split('/')[-1]}")
             self.lbl_file_status.setStyleSheet("color: #6BFF6B;")
             
-            # Remplir les ComboBox avec les noms de colonnes
-            columns = list(self.dataframe.columns)
+            # Remplir les ComboBox avec les noms des colonnes numériques
+            columns = [colonne for colonne, genre in entete.items() if genre == "numerique"]
             self.combo_x.clear()
             self.combo_y.clear()
             self.combo_x.addItems(columns)
@@ -111,6 +139,8 @@ class TabRegression(QWidget):
                 self.combo_y.setCurrentText('y')
             
             self.btn_calculate.setEnabled(True)
+            self.btn_all_pairs.setEnabled(len(columns) >= 2)
+            self.table_paires.hide()
             self.result_display.clear()
             self.plot_canvas.axes.clear()
             self.plot_canvas.axes.set_title("Chargez les données et cliquez sur 'Calculer'")
@@ -120,7 +150,7 @@ class TabRegression(QWidget):
         """
         Exécute la régression et affiche le graphique.
         """
-        if self.dataframe is None:
+        if self.chemin_csv is None:
             self.result_display.setText("Veuillez d'abord charger un fichier CSV.")
             return
 
@@ -131,6 +161,16 @@ class TabRegression(QWidget):
             self.result_display.setText("Veuillez sélectionner les colonnes X et Y.")
             return
 
+        # Charger uniquement les deux colonnes utiles (si elles ne le sont pas déjà)
+        if self.dataframe is None or not {col_x_name, col_y_name} <= set(self.dataframe.columns):
+            df, erreur = charger_donnees_csv(self.chemin_csv, colonnes=list(dict.fromkeys([col_x_name, col_y_name])),
+                                             cache=CACHE_CSV)
+            if erreur:
+                self.result_display.setStyleSheet("color: #FF6B6B;")
+                self.result_display.setText(erreur)
+                return
+            self.dataframe = df
+
         x_data = self.dataframe[col_x_name]
         y_data = self.dataframe[col_y_name]
 
@@ -146,6 +186,8 @@ class TabRegression(QWidget):
             result_str += f"Pente (m) : {resultats['pente']:.4f}\n"
             result_str += f"Ordonnée (b) : {resultats['ordonnee_origine']:.4f}\n"
             result_str += f"Score R² : {resultats['r_carre']:.4f}\n"
+            result_str += f"Erreur std. pente : {resultats['erreur_std_pente']:.4f}\n"
+            result_str += f"Erreur std. ordonnée : {resultats['erreur_std_ordonnee']:.4f}\n"
             self.result_display.setText(result_str)
             
             # Afficher le graphique
@@ -164,4 +206,49 @@ class TabRegression(QWidget):
             self.plot_canvas.axes.legend()
             self.plot_canvas.axes.grid(True, linestyle='--', alpha=0.6)
             self.plot_canvas.fig.tight_layout() # Optimise la mise en page
-            self.plot_canvas.canvas.draw() # Redessiner le canevas
\ No newline at end of file
+            self.plot_canvas.canvas.draw() # Redessiner le canevas
+
+    def on_all_pairs_click(self):
+        """
+        Calcule toutes les régressions simples (une seule passe sur le fichier)
+        et la régression multiple de Y sur les autres colonnes.
+        """
+        if self.chemin_csv is None:
+            self.result_display.setText("Veuillez d'abord charger un fichier CSV.")
+            return
+
+        colonnes = [self.combo_x.itemText(i) for i in range(self.combo_x.count())]
+        cible = self.combo_y.currentText() or None
+        resultats, erreur = calculer_regressions_paires(self.chemin_csv, colonnes=colonnes, cible=cible,
+                                                        cache=CACHE_CSV)
+        if erreur:
+            self.result_display.setStyleSheet("color: #FF6B6B;")
+            self.result_display.setText(erreur)
+            return
+
+        # Remplir le tableau (tri désactivé pendant le remplissage)
+        paires = resultats["paires"]
+        self.table_paires.setSortingEnabled(False)
+        self.table_paires.setRowCount(len(paires))
+        for ligne, enregistrement in enumerate(paires.itertuples(index=False)):
+            for colonne, (cle, _) in enumerate(COLONNES_PAIRES):
+                valeur = getattr(enregistrement, cle)
+                item = QTableWidgetItem()
+                if isinstance(valeur, str):
+                    item.setText(valeur)
+                else:
+                    # Valeur numérique : tri numérique (et non alphabétique)
+                    item.setData(Qt.ItemDataRole.DisplayRole, round(float(valeur), 6))
+                self.table_paires.setItem(ligne, colonne, item)
+        self.table_paires.setSortingEnabled(True)
+        self.table_paires.sortItems(COLONNES_PAIRES.index(("r_carre", "R²")), Qt.SortOrder.DescendingOrder)
+        self.table_paires.show()
+
+        multiple = resultats["multiple"]
+        self.result_display.setStyleSheet("color: #6BFF6B;")
+        result_str = f"{len(paires)} régressions simples calculées (n = {multiple['n'] if multiple else paires['n'].iloc[0]}).\n"
+        if multiple:
+            termes = " + ".join(f"{coef:.4f}·{nom}" for nom, coef in multiple["coefficients"].items())
+            result_str += f"\nRégression multiple de {cible} :\n{cible} = {termes} + {multiple['ordonnee_origine']:.4f}\n"
+            result_str += f"Score R² : {multiple['r_carre']:.4f}\n"
+        self.result_display.setText(result_str)